@@ -0,0 +1,81 @@
+# benchmarks/bench_parse_markdown.py
+"""
+Measures how parse_markdown scales with document size on synthetic Markdown files.
+
+    python benchmarks/bench_parse_markdown.py --sizes-mb 1 10 100 --check
+
+Prints a JSON report with per-size timings and the fitted scaling exponent
+(slope of log(time) over log(size)); an exponent near 1.0 means linear scaling.
+With --check the script exits non-zero when the exponent exceeds --max-exponent.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic import write_synthetic_file
+from scripts.markdown_parser import parse_markdown
+
+MB = 1024 * 1024
+
+
+def scaling_exponent(sizes, timings):
+    """
+    Least-squares slope of log(time) against log(size).
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(timing, 1e-9)) for timing in timings]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    if not denominator:
+        return 1.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denominator
+
+
+def run(sizes_mb, repeats=1, seed=0):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in sizes_mb:
+            file_path = os.path.join(tmp_dir, f"synthetic_{size_mb}mb.md")
+            size_bytes = write_synthetic_file(file_path, int(size_mb * MB), seed=seed)
+            best = None
+            headings = 0
+            for _ in range(repeats):
+                start = time.perf_counter()
+                parsed = parse_markdown(file_path, use_cache=False)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+                headings = len(parsed["headings"])
+                del parsed
+            os.remove(file_path)
+            results.append({
+                "size_mb": size_mb,
+                "bytes": size_bytes,
+                "headings": headings,
+                "seconds": round(best, 4),
+                "mb_per_second": round(size_bytes / MB / best, 3) if best else None,
+            })
+    exponent = scaling_exponent([r["bytes"] for r in results], [r["seconds"] for r in results]) \
+        if len(results) > 1 else None
+    return {"benchmark": "parse_markdown", "results": results, "scaling_exponent": exponent}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parse_markdown scaling on synthetic Markdown files.")
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 10, 100], help="Document sizes in MB.")
+    parser.add_argument("--repeats", type=int, default=1, help="Runs per size; the fastest is reported.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic content.")
+    parser.add_argument("--check", action="store_true", help="Fail if scaling is worse than --max-exponent.")
+    parser.add_argument("--max-exponent", type=float, default=1.25, help="Largest acceptable scaling exponent.")
+    args = parser.parse_args()
+
+    report = run(args.sizes_mb, args.repeats, args.seed)
+    print(json.dumps(report, indent=2))
+    if args.check and report["scaling_exponent"] is not None and report["scaling_exponent"] > args.max_exponent:
+        sys.exit(1)
@@ -0,0 +1,316 @@
+# benchmarks/run_benchmarks.py
+"""
+Benchmarks the main markdown-organizer operations on synthetic vaults.
+
+    python benchmarks/run_benchmarks.py --vault-sizes 10 10000 1000000 --output report.json
+    python benchmarks/run_benchmarks.py --vault-sizes 10000 --baseline report.json --check
+
+For every vault size a deterministic vault is generated (see
+`synthetic.write_synthetic_vault`) and the following operations are timed:
+
+    parse       parse_markdown on every file (parse cache disabled)
+    search      search_articles, both scanning the files and from an on-disk index
+    categorize  categorize_content (offline classifier with LLM-prompt fallback)
+    summarize   summarize_content_llm_prompt per file plus generate_summary_files per category
+    organize    organize_files per file and organize_files_bulk, on copies of the sample
+
+Per-file operations run on at most --sample files so large vaults stay tractable;
+parse always covers the whole vault. Each operation reports its throughput and its
+nearest-rank p50/p90/p99 latency in milliseconds. Each vault is benchmarked in a fresh
+process and reports that process's peak RSS once, since ru_maxrss is a high-water mark
+and a per-operation reading would only repeat the largest stage so far. The JSON
+report can be compared against a previous one with --baseline; with --check the
+script exits non-zero when any p50 latency regressed by more than --tolerance.
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic import WORDS, vault_file_path, write_synthetic_vault
+from scripts.categorizer import categorize_content
+from scripts.markdown_parser import parse_markdown
+from scripts.organizer import organize_files, organize_files_bulk
+from scripts.search_engine import search_articles
+from scripts.summarizer import generate_summary_files, summarize_content_llm_prompt
+
+MB = 1024 * 1024
+MANIFEST_NAME = ".vault.json"
+
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return round(peak / (MB if sys.platform == "darwin" else 1024), 1)
+
+
+def summarize_timings(latencies, total_seconds, extra=None):
+    ordered = sorted(latencies)
+    report = {
+        "count": len(ordered),
+        "total_seconds": round(total_seconds, 4),
+        "throughput_per_second": round(len(ordered) / total_seconds, 2) if total_seconds else None,
+        "latency_ms": {
+            "mean": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else None,
+            "p50": round(percentile(ordered, 0.50) * 1000, 3) if ordered else None,
+            "p90": round(percentile(ordered, 0.90) * 1000, 3) if ordered else None,
+            "p99": round(percentile(ordered, 0.99) * 1000, 3) if ordered else None,
+            "max": round(ordered[-1] * 1000, 3) if ordered else None,
+        },
+    }
+    report.update(extra or {})
+    return report
+
+
+def timed_calls(func, items):
+    """
+    Calls func(item) for every item, returning (results, per-call latencies, total seconds).
+    """
+    results, latencies = [], []
+    started = time.perf_counter()
+    for item in items:
+        start = time.perf_counter()
+        results.append(func(item))
+        latencies.append(time.perf_counter() - start)
+    return results, latencies, time.perf_counter() - started
+
+
+def prepare_vault(work_dir, file_count, seed, max_bytes):
+    """
+    Generates the vault, or reuses one left in work_dir by an earlier run with the same parameters.
+    Returns (base_dir, file_paths, generate_seconds); generate_seconds is None for a reused vault.
+    """
+    base_dir = os.path.join(work_dir, f"vault_{file_count}_seed{seed}")
+    manifest_path = os.path.join(base_dir, MANIFEST_NAME)
+    manifest = {"file_count": file_count, "seed": seed, "max_bytes": max_bytes}
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            if json.load(f) == manifest:
+                return base_dir, [vault_file_path(base_dir, index) for index in range(file_count)], None
+    except (OSError, ValueError):
+        pass
+
+    shutil.rmtree(base_dir, ignore_errors=True)
+    start = time.perf_counter()
+    file_paths = write_synthetic_vault(base_dir, file_count, seed=seed, max_bytes=max_bytes)
+    generate_seconds = time.perf_counter() - start
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    return base_dir, file_paths, generate_seconds
+
+
+def bench_parse(file_paths):
+    sizes = sum(os.path.getsize(file_path) for file_path in file_paths)
+    _, latencies, total = timed_calls(lambda file_path: parse_markdown(file_path, use_cache=False), file_paths)
+    return summarize_timings(latencies, total, {"mb_per_second": round(sizes / MB / total, 3) if total else None})
+
+
+def bench_search(base_dir, work_dir, queries, scan_queries):
+    index_path = os.path.join(work_dir, f"{os.path.basename(base_dir)}.index.sqlite")
+    if os.path.exists(index_path):
+        os.remove(index_path)
+    _, scan_latencies, scan_total = timed_calls(lambda query: search_articles(query, base_dir), queries[:scan_queries])
+
+    start = time.perf_counter()
+    search_articles(queries[0], base_dir, index_path=index_path, refresh_index=True)
+    index_build_seconds = time.perf_counter() - start
+    _, index_latencies, index_total = timed_calls(
+        lambda query: search_articles(query, base_dir, index_path=index_path), queries)
+    os.remove(index_path)
+    return {
+        "scan": summarize_timings(scan_latencies, scan_total),
+        "indexed": summarize_timings(index_latencies, index_total,
+                                     {"index_build_seconds": round(index_build_seconds, 4)}),
+    }
+
+
+def top_category(result):
+    # Local results carry 'categories'; LLM fallbacks only carry the classifier's 'confidences'.
+    if result.get("categories"):
+        return result["categories"][0]
+    confidences = result.get("confidences") or {}
+    return max(confidences, key=confidences.get) if confidences else "Uncategorized"
+
+
+def bench_categorize(file_paths):
+    results, latencies, total = timed_calls(categorize_content, file_paths)
+    local = sum(1 for result in results if result.get("source") == "local")
+    return results, summarize_timings(latencies, total, {"local_fraction": round(local / len(results), 4)})
+
+
+def bench_summarize(file_paths, categorized, output_dir):
+    prompts, latencies, total = timed_calls(summarize_content_llm_prompt, file_paths)
+    categories = {}
+    for file_path, prompt, result in zip(file_paths, prompts, categorized):
+        categories.setdefault(top_category(result), []).append(
+            {"title": prompt.get("title", ""), "path": file_path, "summary": prompt.get("title", "")})
+
+    os.makedirs(output_dir, exist_ok=True)
+    _, file_latencies, file_total = timed_calls(
+        lambda item: generate_summary_files(dict([item]), output_dir=output_dir), categories.items())
+    return {
+        "prompts": summarize_timings(latencies, total),
+        "summary_files": summarize_timings(file_latencies, file_total, {"categories": len(categories)}),
+    }
+
+
+def _copy_sample(file_paths, target_dir):
+    os.makedirs(target_dir, exist_ok=True)
+    copies = []
+    for index, file_path in enumerate(file_paths):
+        copy_path = os.path.join(target_dir, f"{index:07d}_{os.path.basename(file_path)}")
+        shutil.copyfile(file_path, copy_path)
+        copies.append(copy_path)
+    return copies
+
+
+def bench_organize(file_paths, categorized, work_dir):
+    categories = [top_category(result) for result in categorized]
+
+    copies = _copy_sample(file_paths, os.path.join(work_dir, "single", "inbox"))
+    target = os.path.join(work_dir, "single", "organized")
+    _, latencies, total = timed_calls(lambda move: organize_files(move[0], move[1], target), zip(copies, categories))
+
+    copies = _copy_sample(file_paths, os.path.join(work_dir, "bulk", "inbox"))
+    start = time.perf_counter()
+    organize_files_bulk(zip(copies, categories), os.path.join(work_dir, "bulk", "organized"))
+    bulk_seconds = time.perf_counter() - start
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return summarize_timings(latencies, total, {
+        "bulk_seconds": round(bulk_seconds, 4),
+        "bulk_throughput_per_second": round(len(copies) / bulk_seconds, 2) if bulk_seconds else None,
+    })
+
+
+def run_vault(work_dir, file_count, seed, sample, max_bytes, query_count, scan_queries):
+    base_dir, file_paths, generate_seconds = prepare_vault(work_dir, file_count, seed, max_bytes)
+    rng = random.Random(seed)
+    sample_paths = file_paths if len(file_paths) <= sample else sorted(rng.sample(file_paths, sample))
+    queries = [rng.choice(WORDS) + (" " + rng.choice(WORDS) if index % 2 else "") for index in range(query_count)]
+
+    operations = {"parse": bench_parse(file_paths)}
+    operations["search"] = bench_search(base_dir, work_dir, queries, scan_queries)
+    categorized, operations["categorize"] = bench_categorize(sample_paths)
+    scratch_dir = tempfile.mkdtemp(dir=work_dir)
+    operations["summarize"] = bench_summarize(sample_paths, categorized, os.path.join(scratch_dir, "summaries"))
+    operations["organize"] = bench_organize(sample_paths, categorized, scratch_dir)
+    return {
+        "files": file_count,
+        "bytes": sum(os.path.getsize(file_path) for file_path in file_paths),
+        "sample": len(sample_paths),
+        "generate_seconds": round(generate_seconds, 4) if generate_seconds is not None else None,
+        "operations": operations,
+    }
+
+
+def _run_vault_isolated(*args):
+    # Runs in a freshly spawned process, so the peak RSS belongs to this vault alone.
+    report = run_vault(*args)
+    report["peak_rss_mb"] = peak_rss_mb()
+    return report
+
+
+def _p50_latencies(report):
+    # Flattens {'<size>': {'<operation path>': p50}} for comparison between reports.
+    flattened = {}
+    for vault in report["vaults"]:
+        stack = [("", vault["operations"])]
+        while stack:
+            prefix, node = stack.pop()
+            if "latency_ms" in node:
+                flattened[(vault["files"], prefix)] = node["latency_ms"]["p50"]
+                continue
+            for name, child in node.items():
+                if isinstance(child, dict):
+                    stack.append((f"{prefix}.{name}" if prefix else name, child))
+    return flattened
+
+
+def compare_reports(baseline, current, tolerance):
+    """
+    Lists the operations whose p50 latency grew by more than `tolerance` (0.2 = 20%).
+    """
+    before, after = _p50_latencies(baseline), _p50_latencies(current)
+    regressions = []
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        if old and new and new > old * (1 + tolerance):
+            regressions.append({"files": key[0], "operation": key[1], "baseline_p50_ms": old,
+                                "current_p50_ms": new, "ratio": round(new / old, 3)})
+    return regressions
+
+
+def run(vault_sizes, seed=0, sample=10000, max_bytes=8192, query_count=20, scan_queries=3, work_dir=None):
+    keep = work_dir is not None
+    work_dir = work_dir or tempfile.mkdtemp(prefix="md_organizer_bench_")
+    os.makedirs(work_dir, exist_ok=True)
+    try:
+        vaults = []
+        for file_count in vault_sizes:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                vaults.append(executor.submit(_run_vault_isolated, work_dir, file_count, seed, sample, max_bytes,
+                                              query_count, scan_queries).result())
+    finally:
+        if not keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return {
+        "benchmark": "markdown_organizer",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {"seed": seed, "sample": sample, "max_bytes": max_bytes,
+                       "queries": query_count, "scan_queries": scan_queries},
+        "vaults": vaults,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark markdown-organizer operations on synthetic vaults.")
+    parser.add_argument("--vault-sizes", type=int, nargs="+", default=[10, 10000, 1000000],
+                        help="Number of files in each generated vault.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic vaults and queries.")
+    parser.add_argument("--sample", type=int, default=10000,
+                        help="Files per vault used for categorize, summarize and organize.")
+    parser.add_argument("--max-bytes", type=int, default=8192, help="Largest synthetic file size.")
+    parser.add_argument("--queries", type=int, default=20, help="Indexed search queries per vault.")
+    parser.add_argument("--scan-queries", type=int, default=3, help="Full-scan search queries per vault.")
+    parser.add_argument("--work-dir", help="Keep generated vaults here and reuse them on later runs.")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare p50 latencies against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p50 latency growth (0.2 = 20%%).")
+    parser.add_argument("--check", action="store_true", help="Fail if --baseline shows a regression.")
+    args = parser.parse_args()
+
+    report = run(args.vault_sizes, args.seed, args.sample, args.max_bytes, args.queries, args.scan_queries,
+                 args.work_dir)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            report["regressions"] = compare_reports(json.load(f), report, args.tolerance)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if args.check and report.get("regressions"):
+        sys.exit(1)
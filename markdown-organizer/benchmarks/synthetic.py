@@ -0,0 +1,84 @@
+# benchmarks/synthetic.py
+import math
+import os
+import random
+from typing import List
+
+WORDS = (
+    "model data training network layer gradient loss function vector matrix "
+    "python code system design server request cache index query search result "
+    "article summary category note knowledge graph token parser heading section "
+    "the a of and to in is for with on that this by from as are be it"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 18))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    return " ".join(_sentence(rng) for _ in range(rng.randint(2, 6)))
+
+
+def synthetic_markdown(target_bytes: int, seed: int = 0, max_heading_depth: int = 4) -> str:
+    """
+    Builds a deterministic Markdown document of roughly `target_bytes` bytes, mixing
+    headings (up to `max_heading_depth` levels), paragraphs, lists and fenced code.
+    """
+    rng = random.Random(seed)
+    blocks: List[str] = [f"# {_sentence(rng)[:-1]}"]
+    size = len(blocks[0])
+    while size < target_bytes:
+        kind = rng.random()
+        if kind < 0.1:
+            depth = rng.randint(2, max(2, max_heading_depth))
+            block = f"{'#' * depth} {' '.join(rng.choice(WORDS) for _ in range(rng.randint(2, 5)))}"
+        elif kind < 0.2:
+            block = "\n".join(f"- {_sentence(rng)}" for _ in range(rng.randint(2, 6)))
+        elif kind < 0.27:
+            lines = [f"{rng.choice(WORDS)} = {rng.randint(0, 1000)}" for _ in range(rng.randint(2, 10))]
+            block = "```python\n" + "\n".join(lines) + "\n```"
+        else:
+            block = _paragraph(rng)
+        blocks.append(block)
+        size += len(block) + 2
+    return "\n\n".join(blocks) + "\n"
+
+
+def write_synthetic_file(file_path: str, target_bytes: int, seed: int = 0, max_heading_depth: int = 4) -> int:
+    """
+    Writes `synthetic_markdown` output to file_path and returns the number of bytes written.
+    """
+    content = synthetic_markdown(target_bytes, seed, max_heading_depth)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return len(content.encode('utf-8'))
+
+
+def vault_file_path(base_dir: str, index: int, files_per_dir: int = 1000) -> str:
+    return os.path.join(base_dir, f"batch_{index // files_per_dir:05d}", f"note_{index:07d}.md")
+
+
+def write_synthetic_vault(base_dir: str, file_count: int, seed: int = 0, min_bytes: int = 200,
+                          max_bytes: int = 8192, max_heading_depth: int = 6,
+                          files_per_dir: int = 1000) -> List[str]:
+    """
+    Writes a deterministic vault of `file_count` Markdown files under base_dir, spread
+    over subdirectories of `files_per_dir` files. File sizes are log-uniform between
+    `min_bytes` and `max_bytes` and each file gets a heading depth between 2 and
+    `max_heading_depth`, so the vault mixes short notes with longer, deeper articles.
+    Returns the file paths in index order.
+    """
+    rng = random.Random(seed)
+    low, high = math.log(min_bytes), math.log(max(min_bytes, max_bytes))
+    paths = []
+    for index in range(file_count):
+        file_path = vault_file_path(base_dir, index, files_per_dir)
+        if index % files_per_dir == 0:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        target_bytes = int(math.exp(rng.uniform(low, high)))
+        depth = rng.randint(2, max(2, max_heading_depth))
+        write_synthetic_file(file_path, target_bytes, seed=rng.getrandbits(32), max_heading_depth=depth)
+        paths.append(file_path)
+    return paths
@@ -0,0 +1,148 @@
+# scripts/answer_cache.py
+import hashlib
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    content_hash TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY (content_hash, prompt_version, model)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used_at);
+"""
+
+def versioned(prompt_version: str, *params: Any) -> str:
+    """
+    Extends a prompt template version with a short digest of the parameters that change
+    the prompt text (category list, token budget, language, ...), so answers to
+    different variants of the same template are cached separately.
+    """
+    if not params:
+        return prompt_version
+    digest = hashlib.sha256(repr(params).encode('utf-8')).hexdigest()[:12]
+    return f"{prompt_version}:{digest}"
+
+class AnswerCache:
+    """
+    Persistent cache of LLM answers keyed by (content hash, prompt version, model).
+
+    Entries older than `ttl_seconds` are treated as missing and removed. When the stored
+    responses exceed `max_bytes`, the least recently used entries are evicted down to 90%
+    of the budget. Prompt dicts built by the prompt builders carry 'content_hash' and
+    'prompt_version', so `get_for_prompt` / `put_for_prompt` can be used directly on them.
+    """
+
+    def __init__(self, cache_path: str, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(cache_path)
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+        self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM answers").fetchone()[0]
+
+    def __enter__(self) -> "AnswerCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, content_hash: str, prompt_version: str, model: str) -> Optional[str]:
+        key = (content_hash, prompt_version, model)
+        row = self.conn.execute(
+            "SELECT response, size, created_at FROM answers "
+            "WHERE content_hash = ? AND prompt_version = ? AND model = ?", key
+        ).fetchone()
+        if row is None:
+            return None
+        response, size, created_at = row
+        now = time.time()
+        with self.conn:
+            if self._expired(created_at, now):
+                self.conn.execute(
+                    "DELETE FROM answers WHERE content_hash = ? AND prompt_version = ? AND model = ?", key
+                )
+                self._total_bytes -= size
+                return None
+            self.conn.execute(
+                "UPDATE answers SET last_used_at = ? WHERE content_hash = ? AND prompt_version = ? AND model = ?",
+                (now, *key),
+            )
+        return response
+
+    def put(self, content_hash: str, prompt_version: str, model: str, response: str) -> None:
+        key = (content_hash, prompt_version, model)
+        size = len(response.encode('utf-8'))
+        now = time.time()
+        with self.conn:
+            previous = self.conn.execute(
+                "SELECT size FROM answers WHERE content_hash = ? AND prompt_version = ? AND model = ?", key
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)", (*key, response, size, now, now)
+            )
+        self._total_bytes += size - (previous[0] if previous else 0)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        # Least recently used first, down to 90% of the budget so eviction is not rerun on every put.
+        target = int(self.max_bytes * 0.9)
+        with self.conn:
+            self.purge_expired(commit=False)
+            total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM answers").fetchone()[0]
+            if total > target:
+                cutoff = None
+                for last_used_at, size in self.conn.execute("SELECT last_used_at, size FROM answers ORDER BY last_used_at"):
+                    total -= size
+                    cutoff = last_used_at
+                    if total <= target:
+                        break
+                self.conn.execute("DELETE FROM answers WHERE last_used_at <= ?", (cutoff,))
+        self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM answers").fetchone()[0]
+
+    def purge_expired(self, commit: bool = True) -> int:
+        """
+        Deletes every entry older than the TTL and returns how many were removed.
+        """
+        if self.ttl_seconds is None:
+            return 0
+        cursor = self.conn.execute("DELETE FROM answers WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        if commit:
+            self.conn.commit()
+            self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM answers").fetchone()[0]
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM answers")
+        self._total_bytes = 0
+
+    def get_for_prompt(self, prompt: Dict[str, Any], model: str) -> Optional[str]:
+        """
+        Looks up the cached answer for a prompt dict; None when it is not cacheable or missing.
+        """
+        if not prompt.get("content_hash") or not prompt.get("prompt_version"):
+            return None
+        return self.get(prompt["content_hash"], prompt["prompt_version"], model)
+
+    def put_for_prompt(self, prompt: Dict[str, Any], model: str, response: str) -> None:
+        if prompt.get("content_hash") and prompt.get("prompt_version"):
+            self.put(prompt["content_hash"], prompt["prompt_version"], model, response)
@@ -1,29 +1,48 @@
 # scripts/categorizer.py
 import json
 import os
-from typing import Dict, Any, List, Optional
-from .markdown_parser import parse_markdown # Relative import
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+from .answer_cache import versioned
+from .context_packer import pack_context
+from .local_classifier import DEFAULT_CONFIDENCE_THRESHOLD, classify_parsed, get_classifier
+from .markdown_parser import parse_markdown, parse_markdown_many # Relative import
+from .parallel import DEFAULT_CHUNK_SIZE
 
-def categorize_content_llm_prompt(file_path: str, categories_list: Optional[List[str]] = None) -> Dict[str, Any]:
+# Bump when the prompt template changes so cached answers are not reused.
+CATEGORIZE_PROMPT_VERSION = "categorize-1"
+# Token budget for the article content in a categorization prompt.
+CATEGORIZE_TOKEN_BUDGET = 500
+
+CATEGORY_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'resources', 'category_keywords.json')
+
+@lru_cache(maxsize=None)
+def load_category_config(config_path: str = CATEGORY_CONFIG_PATH) -> Dict[str, Any]:
     """
-    Prepares a prompt for an LLM to categorize the given Markdown file.
+    Loads `category_keywords.json` once per process; later calls reuse the parsed config.
+    """
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {} # Fallback
+
+def build_categorize_prompt(parsed_data: Dict[str, Any], file_path: str,
+                            categories_list: Optional[List[str]] = None,
+                            token_budget: int = CATEGORIZE_TOKEN_BUDGET) -> Dict[str, Any]:
+    """
+    Builds the categorization prompt from an already parsed article, packing the most
+    informative sections into about `token_budget` tokens.
     """
-    parsed_data = parse_markdown(file_path)
     if "error" in parsed_data:
         return parsed_data
 
-    plain_text = parsed_data.get("plain_text", "")
+    content = pack_context(parsed_data, token_budget)
     title = parsed_data.get("title", os.path.basename(file_path))
 
     if not categories_list:
-        # Load default suggested categories (assuming it's in the same skill's resources)
-        # In a real scenario, this would use a more robust path
-        try:
-            with open(os.path.join(os.path.dirname(__file__), '..', 'resources', 'category_keywords.json'), 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                categories_list = config.get("suggested_categories", [])
-        except Exception as e:
-            categories_list = [] # Fallback
+        # Load default suggested categories from the skill's resources
+        categories_list = load_category_config().get("suggested_categories", [])
 
     categories_str = ", ".join(categories_list) if categories_list else "General, Uncategorized"
 
@@ -37,11 +56,86 @@ Suggested Categories: {categories_str}
 Article Title: {title}
 ---
 Article Content:
-{plain_text[:2000]} # Limit content for prompt length, adjust as needed.
+{content}
 ---
 Provide your response as a comma-separated list of categories, for example: "Machine Learning, Deep Learning".
 """
-    return {"llm_prompt": prompt, "file_path": file_path, "title": title}
+    return {
+        "llm_prompt": prompt,
+        "file_path": file_path,
+        "title": title,
+        "content_hash": parsed_data.get("content_hash"),
+        "prompt_version": versioned(CATEGORIZE_PROMPT_VERSION, categories_str, token_budget),
+    }
+
+def categorize_content_llm_prompt(file_path: str, categories_list: Optional[List[str]] = None,
+                                  token_budget: int = CATEGORIZE_TOKEN_BUDGET) -> Dict[str, Any]:
+    """
+    Prepares a prompt for an LLM to categorize the given Markdown file.
+    """
+    return build_categorize_prompt(parse_markdown(file_path), file_path, categories_list, token_budget)
+
+def categorize_content_llm_prompts(file_paths: Iterable[str], categories_list: Optional[List[str]] = None,
+                                   workers: Optional[int] = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                   token_budget: int = CATEGORIZE_TOKEN_BUDGET) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yields categorization prompts for many files, in input order.
+    Files that fail to parse yield their error dict with the 'file_path' added.
+    """
+    for file_path, parsed_data in parse_markdown_many(file_paths, workers, chunk_size):
+        if "error" in parsed_data:
+            yield {**parsed_data, "file_path": file_path}
+        else:
+            yield build_categorize_prompt(parsed_data, file_path, categories_list, token_budget)
+
+def categorize_parsed(parsed_data: Dict[str, Any], file_path: str, categories_list: Optional[List[str]] = None,
+                      confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> Dict[str, Any]:
+    """
+    Categorizes an already parsed article locally when the keyword classifier is
+    confident enough, otherwise falls back to an LLM prompt.
+
+    Local results look like {'categories': [...], 'confidences': {...}, 'source': 'local', ...};
+    fallbacks are the usual prompt dict with 'source': 'llm' and the local guesses attached.
+    """
+    if "error" in parsed_data:
+        return parsed_data
+
+    config = load_category_config()
+    local = classify_parsed(parsed_data, get_classifier(config, categories_list))
+    title = parsed_data.get("title", os.path.basename(file_path))
+    if local["categories"] and local["confidence"] >= confidence_threshold:
+        return {
+            "categories": local["categories"],
+            "confidences": local["confidences"],
+            "file_path": file_path,
+            "title": title,
+            "source": "local",
+        }
+
+    result = build_categorize_prompt(parsed_data, file_path, categories_list)
+    result["confidences"] = local["confidences"]
+    result["source"] = "llm"
+    return result
+
+def categorize_content(file_path: str, categories_list: Optional[List[str]] = None,
+                       confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> Dict[str, Any]:
+    """
+    Categorizes the given Markdown file offline when possible; see `categorize_parsed`.
+    """
+    return categorize_parsed(parse_markdown(file_path), file_path, categories_list, confidence_threshold)
+
+def categorize_contents(file_paths: Iterable[str], categories_list: Optional[List[str]] = None,
+                        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+                        workers: Optional[int] = 1,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yields `categorize_content` results for many files, in input order.
+    """
+    for file_path, parsed_data in parse_markdown_many(file_paths, workers, chunk_size):
+        if "error" in parsed_data:
+            yield {**parsed_data, "file_path": file_path}
+        else:
+            yield categorize_parsed(parsed_data, file_path, categories_list, confidence_threshold)
 
 # The actual categorization logic will be handled by the agent (LLM) after receiving this prompt.
 # This script prepares the input for the LLM.
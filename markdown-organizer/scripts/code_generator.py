@@ -1,16 +1,24 @@
 # scripts/code_generator.py
 import os
-from .markdown_parser import parse_markdown # Relative import
+from .answer_cache import versioned
+from .context_packer import pack_context
+from .markdown_parser import parse_markdown, parse_markdown_many # Relative import
+from .parallel import DEFAULT_CHUNK_SIZE
 
-def generate_code_llm_prompt(file_path, language="Python"):
+# Bump when the prompt template changes so cached answers are not reused.
+CODE_PROMPT_VERSION = "generate_code-1"
+# Token budget for the article content in a code-generation prompt.
+CODE_TOKEN_BUDGET = 2000
+
+def build_code_prompt(parsed_data, file_path, language="Python", token_budget=CODE_TOKEN_BUDGET):
     """
-    Prepares a prompt for an LLM to generate code based on the given Markdown article.
+    Builds the code-generation prompt from an already parsed article, packing the most
+    informative sections into about `token_budget` tokens.
     """
-    parsed_data = parse_markdown(file_path)
     if "error" in parsed_data:
         return parsed_data
 
-    plain_text = parsed_data.get("plain_text", "")
+    content = pack_context(parsed_data, token_budget)
     title = parsed_data.get("title", os.path.basename(file_path))
 
     prompt = f"""
@@ -21,8 +29,33 @@ Focus on correctness and readability.
 Article Title: {title}
 ---
 Article Content:
-{plain_text[:8000]} # Limit content for prompt length, adjust as needed.
+{content}
 ---
 Please provide only the code block.
 """
-    return {"llm_prompt": prompt, "file_path": file_path, "title": title, "language": language}
+    return {
+        "llm_prompt": prompt,
+        "file_path": file_path,
+        "title": title,
+        "language": language,
+        "content_hash": parsed_data.get("content_hash"),
+        "prompt_version": versioned(CODE_PROMPT_VERSION, language, token_budget),
+    }
+
+def generate_code_llm_prompt(file_path, language="Python", token_budget=CODE_TOKEN_BUDGET):
+    """
+    Prepares a prompt for an LLM to generate code based on the given Markdown article.
+    """
+    return build_code_prompt(parse_markdown(file_path), file_path, language, token_budget)
+
+def generate_code_llm_prompts(file_paths, language="Python", workers=1, chunk_size=DEFAULT_CHUNK_SIZE,
+                              token_budget=CODE_TOKEN_BUDGET):
+    """
+    Lazily yields code-generation prompts for many files, in input order.
+    Files that fail to parse yield their error dict with the 'file_path' added.
+    """
+    for file_path, parsed_data in parse_markdown_many(file_paths, workers, chunk_size):
+        if "error" in parsed_data:
+            yield {**parsed_data, "file_path": file_path}
+        else:
+            yield build_code_prompt(parsed_data, file_path, language, token_budget)
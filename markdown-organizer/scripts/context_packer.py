@@ -0,0 +1,149 @@
+# scripts/context_packer.py
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+from .parse_cache import content_hash
+
+# Word pieces of up to four characters plus individual punctuation marks: a cheap,
+# slightly pessimistic stand-in for a BPE tokenizer on English prose and code.
+_TOKEN_PIECE = re.compile(r"\w{1,4}|[^\w\s]")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD = re.compile(r"\w+")
+
+PACK_CACHE_SIZE = 1024
+OMISSION_MARKER = "[...]"
+# Sections are only truncated into budgets at least this large; smaller leftovers go to shorter sections.
+MIN_TRUNCATED_TOKENS = 16
+
+# Sections whose heading matches one of these are packed last.
+BOILERPLATE_HEADINGS = re.compile(
+    r"^(table of contents|contents|toc|license|licence|changelog|change log|acknowledg(e)?ments?|"
+    r"references|see also|further reading|footnotes|related( posts| notes)?|tags|navigation)$",
+    re.IGNORECASE,
+)
+
+_cache: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximates the number of LLM tokens in `text` with a single regex pass.
+    """
+    return len(_TOKEN_PIECE.findall(text))
+
+def split_sections(parsed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Cuts the parsed plain text at the heading offsets recorded by the parser.
+    Returns [{'heading', 'level', 'ordinal', 'text'}]; text before the first heading
+    is a section with level 0 and an empty heading.
+    """
+    plain_text = parsed_data.get("plain_text", "")
+    headings = [h for h in parsed_data.get("headings", []) if 'offset' in h]
+    sections = []
+    if not headings or headings[0]['offset'] > 0:
+        end = headings[0]['offset'] if headings else len(plain_text)
+        sections.append({"heading": "", "level": 0, "text": plain_text[:end].strip()})
+    for index, heading in enumerate(headings):
+        end = headings[index + 1]['offset'] if index + 1 < len(headings) else len(plain_text)
+        sections.append({"heading": heading['text'], "level": heading['level'],
+                         "text": plain_text[heading['offset']:end].strip()})
+    sections = [section for section in sections if section["text"]]
+    for ordinal, section in enumerate(sections):
+        section["ordinal"] = ordinal
+    return sections
+
+def score_section(section: Dict[str, Any], section_count: int) -> float:
+    """
+    Ranks a section for inclusion: the introduction and shallow headings first, earlier
+    sections before later ones, and varied text before repetitive text. Boilerplate
+    sections (licenses, tables of contents, link lists, ...) score lowest.
+    """
+    if BOILERPLATE_HEADINGS.match(section["heading"].strip(" #:")):
+        return 0.0
+    level_weight = 1.0 if section["level"] <= 1 else 1.0 / section["level"]
+    position_weight = 1.0 - section["ordinal"] / (section_count + 1)
+    words = _WORD.findall(section["text"].lower())
+    variety = len(set(words)) / len(words) if words else 0.0
+    return level_weight + position_weight + variety
+
+def _truncate(text: str, budget: int) -> str:
+    # Keeps whole sentences (or lines) while they fit, so the cut never lands mid-sentence.
+    kept = []
+    used = 0
+    for sentence in _SENTENCE_END.split(text):
+        cost = estimate_tokens(sentence)
+        if used + cost > budget:
+            if not kept:
+                # A single over-long sentence: fall back to cutting between words.
+                for word in sentence.split():
+                    used += estimate_tokens(word)
+                    if used > budget:
+                        break
+                    kept.append(word)
+            break
+        kept.append(sentence)
+        used += cost
+    return " ".join(kept)
+
+def pack_sections(sections: List[Dict[str, Any]], token_budget: int) -> str:
+    """
+    Greedily fills `token_budget` with the highest scoring sections, truncating the first
+    one that does not fit at a sentence boundary, and returns them in document order.
+    Gaps left by skipped sections are marked with `OMISSION_MARKER`.
+    """
+    ranked = sorted(sections, key=lambda s: (-score_section(s, len(sections)), s["ordinal"]))
+    chosen: Dict[int, str] = {}
+    remaining = token_budget
+    for section in ranked:
+        cost = estimate_tokens(section["text"])
+        if cost <= remaining:
+            chosen[section["ordinal"]] = section["text"]
+            remaining -= cost
+        elif remaining >= MIN_TRUNCATED_TOKENS:
+            truncated = _truncate(section["text"], remaining)
+            if truncated:
+                chosen[section["ordinal"]] = truncated + " " + OMISSION_MARKER
+                remaining -= estimate_tokens(truncated) + 1
+        if remaining <= 0:
+            break
+
+    parts = []
+    previous = -1
+    for ordinal in sorted(chosen):
+        if ordinal != previous + 1 and not (parts and parts[-1].endswith(OMISSION_MARKER)):
+            parts.append(OMISSION_MARKER)
+        parts.append(chosen[ordinal])
+        previous = ordinal
+    if parts and previous != sections[-1]["ordinal"] and not parts[-1].endswith(OMISSION_MARKER):
+        parts.append(OMISSION_MARKER)
+    return "\n\n".join(parts)
+
+def pack_context(parsed_data: Dict[str, Any], token_budget: int) -> str:
+    """
+    Returns the most informative part of an article's plain text that fits in roughly
+    `token_budget` tokens. Articles that already fit are returned unchanged. Results are
+    cached per (content hash, budget), so the prompts built for one article share the work.
+    """
+    plain_text = parsed_data.get("plain_text", "")
+    key = (parsed_data.get("content_hash") or content_hash(plain_text), token_budget)
+    with _cache_lock:
+        packed = _cache.get(key)
+        if packed is not None:
+            _cache.move_to_end(key)
+            return packed
+
+    if estimate_tokens(plain_text) <= token_budget:
+        packed = plain_text
+    else:
+        packed = pack_sections(split_sections(parsed_data), token_budget)
+
+    with _cache_lock:
+        _cache[key] = packed
+        if len(_cache) > PACK_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return packed
+
+def clear_pack_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,155 @@
+# scripts/dedup.py
+import glob
+import hashlib
+import os
+import random
+import re
+from array import array
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .markdown_parser import parse_markdown
+from .parallel import DEFAULT_CHUNK_SIZE, parallel_map
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+# 16 bands of 8 rows: pairs become candidates from a Jaccard similarity of about 0.7.
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.8
+
+# Fixed seed so signatures are comparable across processes and runs.
+_PERMUTATION_SEED = 1
+
+@lru_cache(maxsize=8)
+def _permutation_masks(num_perm: int) -> Tuple[int, ...]:
+    rng = random.Random(_PERMUTATION_SEED)
+    return tuple(rng.getrandbits(64) for _ in range(num_perm))
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> List[int]:
+    """
+    Hashes every run of `size` consecutive lowercased words to a 64-bit integer.
+    Texts shorter than `size` words form a single shingle.
+    """
+    words = TOKEN_PATTERN.findall(text.lower())
+    if not words:
+        return []
+    count = max(1, len(words) - size + 1)
+    return list({
+        int.from_bytes(hashlib.blake2b(" ".join(words[i:i + size]).encode('utf-8'), digest_size=8).digest(), 'little')
+        for i in range(count)
+    })
+
+def minhash_signature(hashes: List[int], num_perm: int = NUM_PERM) -> array:
+    """
+    Computes the MinHash signature of a set of shingle hashes. Each of the `num_perm`
+    hash functions XORs the (already uniformly mixed) shingle hash with a random 64-bit
+    mask, which keeps the inner loop to one C-level `min(map(...))` per function.
+    """
+    return array('Q', [min(map(mask.__xor__, hashes)) for mask in _permutation_masks(num_perm)])
+
+def estimate_similarity(sig_a: array, sig_b: array) -> float:
+    """
+    Estimates the Jaccard similarity of two documents from their signatures.
+    """
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+def _file_signature(file_path: str, num_perm: int, shingle_size: int) -> Optional[array]:
+    parsed_data = parse_markdown(file_path)
+    if "error" in parsed_data:
+        return None
+    hashes = shingles(parsed_data["plain_text"], shingle_size)
+    return minhash_signature(hashes, num_perm) if hashes else None
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+def cluster_signatures(signatures: List[array], bands: int = DEFAULT_BANDS,
+                       threshold: float = DEFAULT_THRESHOLD) -> List[List[int]]:
+    """
+    Groups signatures into clusters of near-duplicates with locality-sensitive hashing.
+
+    Each signature is cut into `bands` bands; documents sharing any band land in the same
+    bucket and become candidates. Candidates are confirmed by their estimated similarity
+    (>= `threshold`) and merged with union-find, so only documents that collide in some
+    bucket are ever compared. Returns clusters of two or more indices, smallest index first.
+    """
+    if not signatures:
+        return []
+    rows = len(signatures[0]) // bands
+    if rows < 1:
+        raise ValueError(f"Cannot split {len(signatures[0])} permutations into {bands} bands")
+
+    union_find = _UnionFind(len(signatures))
+    for band in range(bands):
+        start = band * rows
+        buckets: Dict[bytes, List[int]] = {}
+        for index, signature in enumerate(signatures):
+            buckets.setdefault(signature[start:start + rows].tobytes(), []).append(index)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            # Compare each member with one representative per group seen in this bucket,
+            # instead of every pair, so a bucket of k copies costs O(k) comparisons.
+            representatives = [members[0]]
+            for index in members[1:]:
+                for representative in representatives:
+                    if union_find.find(index) == union_find.find(representative):
+                        break
+                    if estimate_similarity(signatures[index], signatures[representative]) >= threshold:
+                        union_find.union(index, representative)
+                        break
+                else:
+                    representatives.append(index)
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(signatures)):
+        clusters.setdefault(union_find.find(index), []).append(index)
+    return sorted((members for members in clusters.values() if len(members) > 1), key=lambda m: m[0])
+
+def find_duplicates(file_paths: Iterable[str], threshold: float = DEFAULT_THRESHOLD,
+                    num_perm: int = NUM_PERM, bands: int = DEFAULT_BANDS, shingle_size: int = SHINGLE_SIZE,
+                    workers: Optional[int] = 1, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Dict[str, Any]]:
+    """
+    Reports clusters of near-duplicate Markdown files.
+
+    Signatures are computed from the parsed plain text (in a process pool when `workers`
+    > 1) and clustered with `cluster_signatures`, so the cost grows with the number of
+    documents rather than the number of pairs. Returns [{'files': [...], 'similarity': s}],
+    where `s` is the lowest estimated similarity between a cluster member and its first file.
+    Files that cannot be read or contain no words are skipped.
+    """
+    file_paths = list(file_paths)
+    signer = partial(_file_signature, num_perm=num_perm, shingle_size=shingle_size)
+    signed = [(file_path, signature)
+              for file_path, signature in zip(file_paths, parallel_map(signer, file_paths, workers, chunk_size))
+              if signature is not None]
+    signatures = [signature for _, signature in signed]
+
+    results = []
+    for members in cluster_signatures(signatures, bands, threshold):
+        first = signatures[members[0]]
+        results.append({
+            "files": [signed[index][0] for index in members],
+            "similarity": round(min(estimate_similarity(first, signatures[index]) for index in members[1:]), 4),
+        })
+    return results
+
+def find_duplicates_in_dir(base_dir: str, **kwargs: Any) -> List[Dict[str, Any]]:
+    """
+    Runs `find_duplicates` over every `*.md` file under base_dir.
+    """
+    return find_duplicates(sorted(glob.glob(os.path.join(base_dir, '**', '*.md'), recursive=True)), **kwargs)
@@ -0,0 +1,266 @@
+# scripts/llm_pipeline.py
+import asyncio
+import os
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from .organizer import organize_files_bulk, safe_category
+from .prompt_batch import build_llm_prompts
+from .summarizer import generate_summary_files
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_DELAY = 0.5
+MAX_CATEGORIES = 3
+
+class CompletionBackend:
+    """
+    Interface for LLM completion backends. Subclasses implement `complete`, which
+    receives the prompt text and returns the model's answer; any exception it raises
+    is treated as a transient failure and retried by `LLMPipeline`.
+    """
+
+    model = "unknown"
+
+    async def complete(self, prompt: str) -> str:
+        raise NotImplementedError
+
+class MockBackend(CompletionBackend):
+    """
+    Local stand-in for a real backend, for tests and benchmarks. Answers come from
+    `responder(prompt)` when given; otherwise categorization prompts are answered with
+    their first suggested category and all other prompts with the article title.
+    `latency` seconds are awaited per call and a `failure_rate` fraction of calls raise.
+    """
+
+    model = "mock"
+
+    def __init__(self, responder: Optional[Callable[[str], str]] = None, latency: float = 0.0,
+                 failure_rate: float = 0.0, seed: int = 0):
+        self.responder = responder or self._default_response
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._rng = random.Random(seed)
+
+    @staticmethod
+    def _default_response(prompt: str) -> str:
+        suggested = re.search(r"^Suggested Categories: ([^,\n]+)", prompt, re.MULTILINE)
+        if suggested:
+            return suggested.group(1).strip()
+        title = re.search(r"^Article Title: (.*)$", prompt, re.MULTILINE)
+        return f"Summary of {title.group(1).strip()}." if title else "Mock response."
+
+    async def complete(self, prompt: str) -> str:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failure_rate and self._rng.random() < self.failure_rate:
+            raise RuntimeError("Mock backend failure")
+        return self.responder(prompt)
+
+class RateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per second with bursts of up to `burst`.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class LLMPipeline:
+    """
+    Fans prompt dicts (as produced by the prompt builders) out to a `CompletionBackend`.
+
+    At most `concurrency` requests are in flight; with `rate_limit` (requests per second)
+    a shared token bucket spaces them out. Failed or timed-out calls are retried up to
+    `max_retries` times with exponential backoff and jitter. Each result is the prompt
+    dict plus a 'response' (or an 'error' once retries are exhausted); prompts that
+    already carry an 'error' pass through untouched.
+
+    With a `cache` (`answer_cache.AnswerCache`) prompts whose (content hash, prompt
+    version, backend model) was answered before are served from it without a request,
+    marked 'cached': True, and new answers are stored.
+    """
+
+    def __init__(self, backend: CompletionBackend, concurrency: int = DEFAULT_CONCURRENCY,
+                 max_retries: int = DEFAULT_MAX_RETRIES, retry_delay: float = DEFAULT_RETRY_DELAY,
+                 rate_limit: Optional[float] = None, timeout: Optional[float] = None, cache=None):
+        self.backend = backend
+        self.cache = cache
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.rate_limit = rate_limit
+        self.timeout = timeout
+        self.stats = {"completed": 0, "failed": 0, "retries": 0, "cached": 0}
+
+    async def _call(self, limiter: Optional[RateLimiter], prompt: str) -> str:
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await limiter.acquire()
+            try:
+                if self.timeout is None:
+                    return await self.backend.complete(prompt)
+                return await asyncio.wait_for(self.backend.complete(prompt), self.timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if attempt >= self.max_retries:
+                    raise
+                self.stats["retries"] += 1
+                await asyncio.sleep(self.retry_delay * (2 ** attempt) * (0.5 + random.random()))
+                attempt += 1
+
+    async def _process(self, limiter: Optional[RateLimiter], item: Dict[str, Any]) -> Dict[str, Any]:
+        if "error" in item or "llm_prompt" not in item:
+            return item
+        if self.cache is not None:
+            response = self.cache.get_for_prompt(item, self.backend.model)
+            if response is not None:
+                self.stats["cached"] += 1
+                return {**item, "response": response, "cached": True}
+        try:
+            response = await self._call(limiter, item["llm_prompt"])
+        except Exception as e:
+            self.stats["failed"] += 1
+            return {**item, "error": f"LLM request failed after {self.max_retries + 1} attempts: {e}"}
+        self.stats["completed"] += 1
+        if self.cache is not None:
+            self.cache.put_for_prompt(item, self.backend.model, response)
+        return {**item, "response": response}
+
+    async def stream(self, prompts: Iterable[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields results as they finish (not in input order). Prompts are pulled from the
+        iterable lazily, so a whole vault never has to be turned into prompts up front.
+        """
+        limiter = RateLimiter(self.rate_limit, self.concurrency) if self.rate_limit else None
+        prompts = iter(prompts)
+        pending = set()
+        for item in prompts:
+            pending.add(asyncio.ensure_future(self._process(limiter, item)))
+            if len(pending) >= self.concurrency:
+                break
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item = next(prompts, None)
+                    if item is not None:
+                        pending.add(asyncio.ensure_future(self._process(limiter, item)))
+                    yield task.result()
+        finally:
+            # The consumer stopped early: do not leave requests running in the background.
+            for task in pending:
+                task.cancel()
+
+    async def run(self, prompts: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Completes every prompt and returns the results in input order.
+        """
+        indexed = ({**item, "_index": index} for index, item in enumerate(prompts))
+        results = [result async for result in self.stream(indexed)]
+        results.sort(key=lambda result: result["_index"])
+        for result in results:
+            del result["_index"]
+        return results
+
+def parse_categories(response: str, limit: int = MAX_CATEGORIES) -> List[str]:
+    """
+    Turns a categorization answer such as '"Machine Learning, Deep Learning"' into a list.
+    Categories become directory names, so any that are not a safe relative path
+    (see `organizer.safe_category`, e.g. '../../escaped') are dropped.
+    """
+    categories = []
+    for part in response.strip().strip('"\'').split(","):
+        category = safe_category(part.strip().strip('"\'.'))
+        if category and category not in categories:
+            categories.append(category)
+    return categories[:limit]
+
+async def process_vault(file_paths: Iterable[str], backend: CompletionBackend, base_dir: str,
+                        output_dir: Optional[str] = None, store=None, journal_path: Optional[str] = None,
+                        categories_list: Optional[List[str]] = None,
+                        concurrency: int = DEFAULT_CONCURRENCY, max_retries: int = DEFAULT_MAX_RETRIES,
+                        rate_limit: Optional[float] = None, timeout: Optional[float] = None,
+                        workers: Optional[int] = 1, cache=None) -> Dict[str, Any]:
+    """
+    Categorizes and summarizes every file through the LLM pipeline, then organizes them
+    with `organize_files_bulk` (under the first returned category) and, with an
+    `output_dir`, writes one summary file per category with `generate_summary_files`.
+
+    Prompts are built lazily (parsing with `workers` processes) and all categorize and
+    summarize requests share one bounded, rate-limited pipeline. With a `store`
+    (`metadata_store.MetadataStore`) the moves and summaries are recorded there too; with
+    a `cache` (`answer_cache.AnswerCache`) unchanged files reuse their earlier answers.
+    Returns {'organized': {...}, 'summary_files': {...}, 'errors': [...], 'stats': {...}}.
+    """
+    pipeline = LLMPipeline(backend, concurrency, max_retries, rate_limit=rate_limit, timeout=timeout, cache=cache)
+    prompts = build_llm_prompts(file_paths, tasks=("categorize", "summarize"),
+                                categories_list=categories_list, workers=workers)
+
+    started = time.perf_counter()
+    articles: Dict[str, Dict[str, Any]] = {}
+    errors = []
+    async for result in pipeline.stream(prompts):
+        if "error" in result:
+            errors.append({"file_path": result.get("file_path"), "task": result.get("task"), "error": result["error"]})
+            continue
+        article = articles.setdefault(result["file_path"], {"title": result.get("title", "")})
+        if result["task"] == "categorize":
+            article["categories"] = parse_categories(result["response"])
+        else:
+            article["summary"] = result["response"].strip()
+
+    moves: List[Tuple[str, str]] = []
+    for file_path, article in articles.items():
+        if article.get("categories"):
+            moves.append((file_path, article["categories"][0]))
+        elif "categories" in article:
+            errors.append({"file_path": file_path, "task": "categorize", "error": "No usable category in response"})
+    organized = organize_files_bulk(moves, base_dir, journal_path=journal_path, store=store)
+    errors.extend(organized["errors"])
+
+    categories: Dict[str, List[Dict[str, str]]] = {}
+    for move in organized["moved"]:
+        article = articles[move["src"]]
+        summary = article.get("summary", "")
+        if store is not None and summary:
+            store.set_summary(move["dst"], summary)
+        categories.setdefault(article["categories"][0], []).append(
+            {"title": article["title"], "path": move["dst"], "summary": summary})
+
+    summary_files = {}
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        summary_files = generate_summary_files(categories, output_dir=output_dir)
+    return {
+        "organized": organized,
+        "summary_files": summary_files,
+        "errors": errors,
+        "stats": {**pipeline.stats, "seconds": round(time.perf_counter() - started, 4)},
+    }
+
+def run_vault_pipeline(file_paths: Sequence[str], backend: CompletionBackend, base_dir: str,
+                       **kwargs: Any) -> Dict[str, Any]:
+    """
+    Synchronous entry point for `process_vault`.
+    """
+    return asyncio.run(process_vault(file_paths, backend, base_dir, **kwargs))
@@ -0,0 +1,122 @@
+# scripts/local_classifier.py
+import math
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# A document needs roughly this many keyword hits before its confidence approaches 1.
+EVIDENCE_SCALE = 8.0
+DEFAULT_CONFIDENCE_THRESHOLD = 0.5
+# Secondary categories are only reported when at least this fraction as confident as the top one.
+RELATIVE_CUTOFF = 0.5
+
+def _terms(text: str) -> List[str]:
+    """
+    Lowercased unigrams plus adjacent bigrams (joined by a space), so multi-word
+    keywords such as "neural network" match as a single term.
+    """
+    words = TOKEN_PATTERN.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+class KeywordClassifier:
+    """
+    Offline TF-IDF classifier over category keyword centroids.
+
+    Each category's centroid is the unit-normalized TF-IDF vector of its name and
+    keywords, where IDF is computed across categories so terms shared by many
+    categories count for less. Documents are scored by cosine similarity against every
+    centroid at once through a term -> [(category, weight)] inverted map, so scoring is
+    linear in document length and independent of the number of categories.
+    """
+
+    def __init__(self, category_keywords: Dict[str, List[str]]):
+        self.categories = list(category_keywords)
+        centroid_terms = []
+        for name in self.categories:
+            terms = set(_terms(name))
+            for keyword in category_keywords[name]:
+                terms.update(t for t in _terms(keyword) if " " in t or len(keyword.split()) == 1)
+            centroid_terms.append(terms)
+
+        document_frequency: Dict[str, int] = {}
+        for terms in centroid_terms:
+            for term in terms:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+
+        category_count = len(self.categories)
+        self._term_weights: Dict[str, List[Tuple[int, float]]] = {}
+        for index, terms in enumerate(centroid_terms):
+            weights = {term: math.log(1.0 + category_count / document_frequency[term]) for term in terms}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term, weight in weights.items():
+                self._term_weights.setdefault(term, []).append((index, weight / norm))
+
+    def classify(self, text: str) -> Dict[str, Any]:
+        """
+        Returns {'categories': [(name, confidence), ...] best first, 'hits': n}.
+
+        Confidence is each category's share of the total cosine similarity, scaled by
+        how much keyword evidence the document contains (`EVIDENCE_SCALE`).
+        """
+        counts: Dict[str, int] = {}
+        for term in _terms(text):
+            if term in self._term_weights:
+                counts[term] = counts.get(term, 0) + 1
+        if not counts:
+            return {"categories": [], "hits": 0}
+
+        # Dot products against unit centroids; the shared document norm cancels out
+        # when similarities are turned into shares below.
+        scores = [0.0] * len(self.categories)
+        for term, count in counts.items():
+            tf = 1.0 + math.log(count)
+            for index, weight in self._term_weights[term]:
+                scores[index] += tf * weight
+        total = sum(scores)
+        hits = sum(counts.values())
+        evidence = 1.0 - math.exp(-hits / EVIDENCE_SCALE)
+
+        ranked = sorted(
+            ((self.categories[index], score / total * evidence)
+             for index, score in enumerate(scores) if score > 0),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return {
+            "categories": [(name, round(confidence, 4)) for name, confidence in ranked],
+            "hits": hits,
+        }
+
+@lru_cache(maxsize=8)
+def _cached_classifier(keyword_items: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> KeywordClassifier:
+    return KeywordClassifier({name: list(keywords) for name, keywords in keyword_items})
+
+def get_classifier(config: Dict[str, Any], categories_list: Optional[List[str]] = None) -> KeywordClassifier:
+    """
+    Returns a (cached) classifier for the config's `category_keywords`, optionally
+    restricted to `categories_list`. Categories without keywords are matched by name.
+    """
+    category_keywords = config.get("category_keywords", {})
+    names = categories_list or list(category_keywords)
+    keyword_items = tuple((name, tuple(category_keywords.get(name, ()))) for name in names)
+    return _cached_classifier(keyword_items)
+
+def classify_parsed(parsed_data: Dict[str, Any], classifier: KeywordClassifier, top_n: int = 3) -> Dict[str, Any]:
+    """
+    Classifies a parsed article from its title, headings and plain text.
+    Returns {'categories': [...], 'confidences': {name: confidence}, 'confidence': top}.
+    """
+    text = " ".join([
+        parsed_data.get("title", ""),
+        " ".join(heading['text'] for heading in parsed_data.get("headings", [])),
+        parsed_data.get("plain_text", ""),
+    ])
+    ranked = classifier.classify(text)["categories"][:top_n]
+    if ranked:
+        ranked = [(name, confidence) for name, confidence in ranked if confidence >= ranked[0][1] * RELATIVE_CUTOFF]
+    return {
+        "categories": [name for name, _ in ranked],
+        "confidences": dict(ranked),
+        "confidence": ranked[0][1] if ranked else 0.0,
+    }
@@ -1,11 +1,39 @@
 # scripts/markdown_parser.py
-from markdown_it import MarkdownIt
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+from .parallel import DEFAULT_CHUNK_SIZE, parallel_map
+from .parse_cache import (DEFAULT_DISK_MAX_BYTES, DEFAULT_MAX_ENTRIES, DEFAULT_MEMORY_MAX_BYTES, ParseCache,
+                          content_hash)
 
-def parse_markdown(file_path: str) -> Dict[str, Any]:
+_markdown_it = None # markdown_it.MarkdownIt, created on first parse
+_parse_cache = ParseCache()
+
+def _get_markdown_it():
+    # One parser instance is reused for every document instead of being rebuilt per call.
+    # markdown_it is imported here so cache hits and non-parsing commands never load it.
+    global _markdown_it
+    if _markdown_it is None:
+        from markdown_it import MarkdownIt
+        _markdown_it = MarkdownIt()
+    return _markdown_it
+
+def configure_parse_cache(max_entries: int = DEFAULT_MAX_ENTRIES, disk_dir: Optional[str] = None,
+                          disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+                          memory_max_bytes: int = DEFAULT_MEMORY_MAX_BYTES) -> ParseCache:
+    """
+    Replaces the process-wide parse cache, e.g. to enable the on-disk tier.
+    """
+    global _parse_cache
+    _parse_cache = ParseCache(max_entries, disk_dir, disk_max_bytes, memory_max_bytes)
+    return _parse_cache
+
+def get_parse_cache() -> ParseCache:
+    return _parse_cache
+
+def parse_markdown(file_path: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Parses a Markdown file and extracts its content, headings, and plain text.
+    Results are cached by content hash, so unchanged content is only parsed once.
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -13,35 +41,84 @@ def parse_markdown(file_path: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Failed to read file {file_path}: {e}"}
 
-    md = MarkdownIt()
-    tokens = md.parse(md_content)
+    return parse_markdown_content(md_content, file_path, use_cache)
+
+def _parse_with_path(file_path: str) -> Tuple[str, Dict[str, Any]]:
+    return file_path, parse_markdown(file_path)
+
+def parse_markdown_many(file_paths: Iterable[str], workers: Optional[int] = 1,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Parses many Markdown files, yielding (file_path, parsed_data) in input order.
+    With `workers` > 1 (or None for one per CPU) files are parsed in a process pool.
+    """
+    return parallel_map(_parse_with_path, file_paths, workers, chunk_size)
+
+def parse_markdown_content(md_content: str, file_path: str, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Parses already-loaded Markdown content; `file_path` is only used for the fallback title.
+    """
+    key = content_hash(md_content)
+    cached = _parse_cache.get(key) if use_cache else None
+    if cached is None:
+        cached = _parse_tokens(md_content)
+        if use_cache:
+            _parse_cache.put(key, cached)
+
+    # The cached entry is shared by every caller; hand out copies so mutating a result cannot change the cache.
+    headings = [dict(heading) for heading in cached["headings"]]
+    return {
+        "full_content": md_content,
+        "plain_text": cached["plain_text"],
+        "headings": headings,
+        "title": headings[0]['text'] if headings else os.path.basename(file_path).replace('.md', ''),
+        "content_hash": key,
+    }
+
+def _parse_tokens(md_content: str) -> Dict[str, Any]:
+    tokens = _get_markdown_it().parse(md_content)
 
     plain_text_parts = []
+    plain_text_length = 0 # Length of " ".join(plain_text_parts) so far
     headings = []
     current_heading_level = 0
-    current_heading_text = ""
+    current_heading_line = 0
 
+    # Single pass over the block tokens: heading state is carried from the
+    # heading_open token instead of looking back through the token list.
     for token in tokens:
         if token.type == 'heading_open':
-            current_heading_level = token.markup.count('#')
-        elif token.type == 'inline' and token.children and tokens[tokens.index(token)-1].type == 'heading_open':
-            current_heading_text = token.content
-            headings.append({'level': current_heading_level, 'text': current_heading_text})
-        elif token.type == 'text':
-            plain_text_parts.append(token.content)
-        elif token.type == 'paragraph_open':
-            # Collect text within paragraphs
-            pass
-        elif token.type == 'fence': # Code blocks
-            # Optionally include code blocks in plain text, or exclude
-            plain_text_parts.append(f"\n```\n{token.content}\n```\n")
-        # Add more token types if needed to extract specific content
-
-    plain_text_content = " ".join(plain_text_parts).strip()
-    
-    return {
-        "full_content": md_content,
-        "plain_text": plain_text_content,
-        "headings": headings,
-        "title": headings[0]['text'] if headings else os.path.basename(file_path).replace('.md', '')
-    }
+            current_heading_level = int(token.tag[1:]) # 'h1'..'h6', also covers setext headings
+            current_heading_line = token.map[0] + 1 if token.map else 0
+        elif token.type == 'heading_close':
+            current_heading_level = 0
+        elif token.type == 'inline':
+            if current_heading_level and token.children:
+                headings.append({
+                    'level': current_heading_level,
+                    'text': token.content,
+                    'line': current_heading_line,
+                    'offset': plain_text_length + (1 if plain_text_parts else 0),
+                })
+            inline_parts = []
+            for child in token.children or ():
+                if child.type in ('text', 'code_inline'):
+                    inline_parts.append(child.content)
+                elif child.type in ('softbreak', 'hardbreak'):
+                    inline_parts.append(" ")
+            if inline_parts:
+                plain_text_length += len("".join(inline_parts)) + (1 if plain_text_parts else 0)
+                plain_text_parts.append("".join(inline_parts))
+        elif token.type in ('fence', 'code_block'): # Code blocks
+            part = f"\n```\n{token.content}\n```\n"
+            plain_text_length += len(part) + (1 if plain_text_parts else 0)
+            plain_text_parts.append(part)
+
+    joined = " ".join(plain_text_parts)
+    plain_text_content = joined.strip()
+    # Heading 'offset' is where the heading text starts in plain_text.
+    leading = len(joined) - len(joined.lstrip())
+    for heading in headings:
+        heading['offset'] = max(0, heading['offset'] - leading)
+    return {"plain_text": plain_text_content, "headings": headings}
+
@@ -0,0 +1,225 @@
+# scripts/metadata_store.py
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .markdown_parser import parse_markdown
+
+SCHEMA_VERSION = "1"
+CATEGORY_SEPARATOR = "/"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS articles (
+    path TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    category TEXT NOT NULL,
+    summary TEXT,
+    content_hash TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_category ON articles (category, path);
+"""
+
+_COLUMNS = ("path", "title", "category", "summary", "content_hash", "updated_at")
+
+def normalize_category(category: str) -> str:
+    """
+    Canonical form of a hierarchical category: segments separated by a single '/',
+    without surrounding whitespace or empty segments ('ML / Deep Learning/' -> 'ML/Deep Learning').
+    """
+    segments = [segment.strip() for segment in category.replace(os.sep, CATEGORY_SEPARATOR).split(CATEGORY_SEPARATOR)]
+    return CATEGORY_SEPARATOR.join(segment for segment in segments if segment)
+
+def parent_categories(category: str) -> List[str]:
+    """
+    Returns every ancestor of a category, outermost first ('a/b/c' -> ['a', 'a/b']).
+    """
+    segments = category.split(CATEGORY_SEPARATOR)
+    return [CATEGORY_SEPARATOR.join(segments[:depth]) for depth in range(1, len(segments))]
+
+def _subtree_bounds(category: str) -> Tuple[str, str]:
+    # Every descendant of 'a/b' sorts between 'a/b/' and 'a/b0' ('0' follows '/'), so
+    # subtree queries are index range scans instead of LIKE patterns.
+    return category + CATEGORY_SEPARATOR, category + chr(ord(CATEGORY_SEPARATOR) + 1)
+
+class MetadataStore:
+    """
+    SQLite store of organized articles: path, title, hierarchical category, summary and
+    content hash. Category listings, per-category statistics and summary files are
+    answered from it instead of walking and re-parsing the organized directory tree.
+
+    Paths are stored as absolute paths; categories in `normalize_category` form.
+    """
+
+    def __init__(self, store_path: str):
+        self.store_path = store_path
+        self.conn = sqlite3.connect(store_path)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)", (SCHEMA_VERSION,)
+            )
+
+    def __enter__(self) -> "MetadataStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def upsert_article(self, path: str, category: str, title: str, summary: Optional[str] = None,
+                       content_hash: Optional[str] = None) -> None:
+        """
+        Inserts or replaces an article's record. When `summary` is None an existing
+        summary is kept as long as the content hash did not change.
+        """
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO articles (path, title, category, summary, content_hash, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (path) DO UPDATE SET
+                    title = excluded.title,
+                    category = excluded.category,
+                    summary = COALESCE(excluded.summary,
+                                       CASE WHEN articles.content_hash IS excluded.content_hash
+                                            THEN articles.summary END),
+                    content_hash = excluded.content_hash,
+                    updated_at = excluded.updated_at
+                """,
+                (os.path.abspath(path), title, normalize_category(category), summary, content_hash, time.time()),
+            )
+
+    def record_file(self, path: str, category: str, summary: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Records an article from its file, taking the title and content hash from the
+        (cached) parse. Returns the parse error dict if the file cannot be read.
+        """
+        parsed_data = parse_markdown(path)
+        if "error" in parsed_data:
+            return parsed_data
+        self.upsert_article(path, category, parsed_data["title"], summary, parsed_data["content_hash"])
+        return {"path": os.path.abspath(path)}
+
+    def move_articles(self, moves: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        """
+        Applies (src, dst, category) moves in one transaction. Known articles keep their
+        title, summary and hash (and category when it is None); unknown ones are recorded
+        from the file at `dst`.
+        """
+        unknown = []
+        with self.conn:
+            for src, dst, category in moves:
+                src, dst = os.path.abspath(src), os.path.abspath(dst)
+                self.conn.execute("DELETE FROM articles WHERE path = ? AND ? != ?", (dst, src, dst))
+                updated = self.conn.execute(
+                    "UPDATE articles SET path = ?, category = COALESCE(?, category), updated_at = ? WHERE path = ?",
+                    (dst, normalize_category(category) if category is not None else None, time.time(), src),
+                ).rowcount
+                if not updated and category is not None:
+                    unknown.append((dst, category))
+        for dst, category in unknown:
+            self.record_file(dst, category)
+
+    def set_summary(self, path: str, summary: str) -> bool:
+        with self.conn:
+            return self.conn.execute(
+                "UPDATE articles SET summary = ?, updated_at = ? WHERE path = ?",
+                (summary, time.time(), os.path.abspath(path)),
+            ).rowcount > 0
+
+    def remove_article(self, path: str) -> bool:
+        with self.conn:
+            return self.conn.execute("DELETE FROM articles WHERE path = ?", (os.path.abspath(path),)).rowcount > 0
+
+    def get_article(self, path: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM articles WHERE path = ?", (os.path.abspath(path),)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def list_articles(self, category: Optional[str] = None, recursive: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Yields article records ordered by category and path. With a `category`, only that
+        category (and, if `recursive`, its subcategories) is listed.
+        """
+        query = f"SELECT {', '.join(_COLUMNS)} FROM articles"
+        params: Tuple[str, ...] = ()
+        if category is not None:
+            category = normalize_category(category)
+            if recursive:
+                low, high = _subtree_bounds(category)
+                query += " WHERE category = ? OR (category >= ? AND category < ?)"
+                params = (category, low, high)
+            else:
+                query += " WHERE category = ?"
+                params = (category,)
+        for row in self.conn.execute(query + " ORDER BY category, path", params):
+            yield dict(row)
+
+    def category_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns {category: {'articles', 'summarized', 'total_articles', 'total_summarized',
+        'last_updated'}} for every category and each of its ancestors. 'articles' counts
+        only the category itself, 'total_*' include all subcategories.
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+
+        def entry(category: str) -> Dict[str, Any]:
+            return stats.setdefault(category, {
+                "articles": 0, "summarized": 0, "total_articles": 0, "total_summarized": 0, "last_updated": None,
+            })
+
+        rows = self.conn.execute(
+            "SELECT category, COUNT(*), COUNT(summary), MAX(updated_at) FROM articles GROUP BY category"
+        )
+        for category, articles, summarized, last_updated in rows:
+            own = entry(category)
+            own["articles"], own["summarized"] = articles, summarized
+            for name in parent_categories(category) + [category]:
+                node = entry(name)
+                node["total_articles"] += articles
+                node["total_summarized"] += summarized
+                node["last_updated"] = max(node["last_updated"] or last_updated, last_updated)
+        return dict(sorted(stats.items()))
+
+    def category_tree(self) -> List[Dict[str, Any]]:
+        """
+        Returns the categories as a tree: a list of root nodes, each
+        {'name', 'category', 'articles', 'total_articles', 'children': [...]}, sorted by name.
+        """
+        nodes: Dict[str, Dict[str, Any]] = {}
+        roots = []
+        for category, stats in self.category_stats().items():
+            node = nodes[category] = {
+                "name": category.rsplit(CATEGORY_SEPARATOR, 1)[-1],
+                "category": category,
+                "articles": stats["articles"],
+                "total_articles": stats["total_articles"],
+                "children": [],
+            }
+            parents = parent_categories(category)
+            # category_stats is sorted, so every parent is created before its children.
+            (nodes[parents[-1]]["children"] if parents else roots).append(node)
+        return roots
+
+    def articles_by_category(self, recursive: bool = False) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Returns {category: [{'title', 'path', 'summary'}]} in the shape expected by
+        `summarizer.generate_summary_files`. With `recursive`, every ancestor category
+        also lists the articles of its subcategories.
+        """
+        categories: Dict[str, List[Dict[str, str]]] = {}
+        for article in self.list_articles():
+            item = {"title": article["title"], "path": article["path"], "summary": article["summary"] or ""}
+            names = [article["category"]] + (parent_categories(article["category"]) if recursive else [])
+            for name in names:
+                categories.setdefault(name, []).append(item)
+        return dict(sorted(categories.items()))
@@ -0,0 +1,175 @@
+# scripts/multi_search.py
+import codecs
+import glob
+import os
+import re
+from collections import deque
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .parallel import DEFAULT_CHUNK_SIZE, parallel_map
+
+# Bytes read per window; the automaton state carries over, so matches may span windows.
+SCAN_WINDOW_BYTES = 1 << 20
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over byte patterns, compiled to a dense transition table
+    (256 entries per state) so scanning costs one table lookup per input byte no
+    matter how many patterns there are.
+    """
+
+    def __init__(self, patterns: Iterable[bytes]):
+        self.patterns: List[bytes] = list(patterns)
+        goto: List[Dict[int, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for byte in pattern:
+                next_state = goto[state].get(byte)
+                if next_state is None:
+                    next_state = goto[state][byte] = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # Breadth-first construction of failure links, folded directly into the table.
+        table = [0] * (256 * len(goto))
+        fail = [0] * len(goto)
+        for byte, state in goto[0].items():
+            table[byte] = state
+        pending = deque(goto[0].values())
+        while pending:
+            state = pending.popleft()
+            base = state * 256
+            fallback = fail[state] * 256
+            table[base:base + 256] = table[fallback:fallback + 256]
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for byte, next_state in goto[state].items():
+                fail[next_state] = table[fallback + byte]
+                table[base + byte] = next_state
+                pending.append(next_state)
+
+        self._table = table
+        self._outputs = outputs
+        first_bytes = sorted({pattern[0] for pattern in self.patterns if pattern})
+        self._first_byte = re.compile(b"[" + b"".join(re.escape(bytes([b])) for b in first_bytes) + b"]") \
+            if first_bytes else None
+
+    def scan(self, data: bytes, state: int = 0, offset: int = 0) -> Tuple[List[Tuple[int, int]], int]:
+        """
+        Feeds `data` (located at `offset` in the whole stream) through the automaton,
+        starting from `state`. Returns ([(pattern_index, start_offset), ...], end_state).
+        """
+        matches = []
+        table, outputs, first_byte = self._table, self._outputs, self._first_byte
+        if first_byte is None:
+            return matches, state
+        position, end = 0, len(data)
+        while position < end:
+            if state == 0:
+                # Nothing partially matched: jump straight to the next byte that can start a pattern.
+                found = first_byte.search(data, position)
+                if found is None:
+                    break
+                position = found.start()
+            state = table[state * 256 + data[position]]
+            position += 1
+            if outputs[state]:
+                for index in outputs[state]:
+                    matches.append((index, offset + position - len(self.patterns[index])))
+        return matches, state
+
+@lru_cache(maxsize=8)
+def _automaton(patterns: Tuple[bytes, ...]) -> AhoCorasick:
+    # Built once per process for a given term set, including inside pool workers.
+    return AhoCorasick(patterns)
+
+class _FoldTable(dict):
+    # str.translate table folding each character to its casefolded (or lowercase) form,
+    # but only when that is a single character with the same UTF-8 length, so byte
+    # offsets in the folded text stay the offsets in the file. Filled lazily.
+    def __missing__(self, code):
+        char = chr(code)
+        size = len(char.encode('utf-8', 'surrogateescape'))
+        folded = char
+        for candidate in (char.casefold(), char.lower()):
+            if len(candidate) == 1 and len(candidate.encode('utf-8', 'surrogateescape')) == size:
+                folded = candidate
+                break
+        self[code] = folded
+        return folded
+
+_FOLD_TABLE = _FoldTable()
+
+def fold_case(text: str) -> bytes:
+    """
+    Case-folds `text` character by character and returns it as UTF-8; the result has
+    the same byte length as the original, so match offsets need no mapping back.
+    """
+    return text.translate(_FOLD_TABLE).encode('utf-8', 'surrogateescape')
+
+def _normalize_terms(terms: Iterable[str]) -> Tuple[Tuple[bytes, ...], Dict[bytes, List[str]]]:
+    by_pattern: Dict[bytes, List[str]] = {}
+    for term in terms:
+        pattern = fold_case(term)
+        if pattern and term not in by_pattern.get(pattern, ()):
+            by_pattern.setdefault(pattern, []).append(term)
+    return tuple(sorted(by_pattern)), by_pattern
+
+def scan_file(patterns: Tuple[bytes, ...], file_path: str,
+              window_bytes: int = SCAN_WINDOW_BYTES) -> Dict[bytes, List[int]]:
+    """
+    Scans one file in a single pass and returns {pattern: [byte offsets]} for the
+    patterns that occur. Windows are folded like `fold_case` (pure-ASCII windows with the
+    faster `bytes.lower()`), so patterns must be `fold_case` output.
+    """
+    automaton = _automaton(patterns)
+    found: Dict[bytes, List[int]] = {}
+    state, offset = 0, 0
+    # Holds back a UTF-8 sequence split across windows; invalid bytes pass through unchanged.
+    decoder = codecs.getincrementaldecoder('utf-8')('surrogateescape')
+    with open(file_path, 'rb') as f:
+        while True:
+            window = f.read(window_bytes)
+            if window.isascii() and not decoder.getstate()[0]:
+                folded = window.lower()
+            else:
+                folded = fold_case(decoder.decode(window, final=not window))
+            matches, state = automaton.scan(folded, state, offset)
+            for index, start in matches:
+                found.setdefault(patterns[index], []).append(start)
+            offset += len(folded)
+            if not window:
+                break
+    return found
+
+def search_terms(terms: Iterable[str], base_dir: str, workers: Optional[int] = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Searches every Markdown file under base_dir for all `terms` at once.
+
+    One automaton is built over all terms and each file is read once. Returns
+    {file_path: {term: {'count': n, 'offsets': [byte offsets]}}} for files with at least
+    one match, in file order. Terms and text are case-folded character by character,
+    so matching ignores case beyond ASCII too ('ÜbEr' finds 'über' and 'ÜBER').
+    """
+    patterns, by_pattern = _normalize_terms(terms)
+    if not patterns:
+        return {}
+    markdown_files = glob.glob(os.path.join(base_dir, '**', '*.md'), recursive=True)
+    scans = parallel_map(partial(scan_file, patterns), markdown_files, workers, chunk_size)
+
+    results = {}
+    for file_path, found in zip(markdown_files, scans):
+        if not found:
+            continue
+        per_term: Dict[str, List[int]] = {}
+        for pattern, offsets in found.items():
+            for term in by_pattern[pattern]:
+                per_term.setdefault(term, []).extend(offsets)
+        results[file_path] = {}
+        for term, offsets in per_term.items():
+            offsets = sorted(set(offsets))
+            results[file_path][term] = {"count": len(offsets), "offsets": offsets}
+    return results
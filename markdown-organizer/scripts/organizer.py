@@ -1,34 +1,264 @@
 # scripts/organizer.py
+import errno
+import json
 import os
 import shutil
+from typing import Optional
 
-def organize_files(file_path: str, category: str, base_dir: str) -> str:
+def safe_category(category: str) -> Optional[str]:
+    """
+    Returns a category in the canonical 'a/b' form if it is safe to use as a relative
+    directory under base_dir, or None if it is not: absolute paths, drive prefixes
+    ('C:'), '.' / '..' segments and empty segments are rejected.
+    """
+    category = category.strip()
+    if not category or os.path.isabs(category) or category[0] in '/\\' or os.path.splitdrive(category)[0]:
+        return None
+    segments = [segment.strip() for segment in category.replace('\\', '/').split('/')]
+    if any(segment in ('', '.', '..') or ':' in segment for segment in segments):
+        return None
+    return '/'.join(segments)
+
+def _inside(path, base_dir):
+    # Resolves symlinks too, so a category directory linking out of the vault is refused.
+    base = os.path.realpath(base_dir)
+    return os.path.commonpath([base, os.path.realpath(path)]) == base
+
+def organize_files(file_path: str, category: str, base_dir: str, store=None) -> str:
     """
     Organizes a Markdown file into a category-specific subdirectory.
+    Hierarchical categories ('Programming/Python') become nested directories.
 
     If a file with the same name already exists in the destination,
     it renames the file being moved to avoid overwriting (e.g., 'file.md' -> 'file (1).md').
+    A category that would resolve outside `base_dir` raises ValueError.
+    With a `store` (`metadata_store.MetadataStore`) the move is also recorded there.
     """
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"Source file not found: {file_path}")
 
     category_dir = os.path.join(base_dir, category)
+    if not _inside(category_dir, base_dir):
+        raise ValueError(f"Category {category!r} resolves outside {base_dir}")
     os.makedirs(category_dir, exist_ok=True)
 
-    file_name = os.path.basename(file_path)
-    new_file_path = os.path.join(category_dir, file_name)
-
     # Prevent overwriting
-    counter = 1
-    while os.path.exists(new_file_path):
-        name, extension = os.path.splitext(file_name)
-        new_file_name = f"{name} ({counter}){extension}"
-        new_file_path = os.path.join(category_dir, new_file_name)
-        counter += 1
+    new_file_path = _unique_path(os.path.join(category_dir, os.path.basename(file_path)))
 
     try:
         shutil.move(file_path, new_file_path)
-        return new_file_path
     except Exception as e:
         # Re-raise with a more informative message
         raise IOError(f"Failed to move file from {file_path} to {new_file_path}: {e}")
+    if store is not None:
+        store.move_articles([(file_path, new_file_path, category)])
+    return new_file_path
+
+def _unique_path(path):
+    # 'file.md' -> 'file (1).md', 'file (2).md', ... until the name is free.
+    directory, file_name = os.path.split(path)
+    name, extension = os.path.splitext(file_name)
+    counter = 1
+    while os.path.exists(path):
+        path = os.path.join(directory, f"{name} ({counter}){extension}")
+        counter += 1
+    return path
+
+def plan_organize(moves, base_dir):
+    """
+    Resolves the destination of every (file_path, category) pair without touching any file.
+
+    Each category directory is listed once and name collisions (including collisions
+    between files of the same batch) are resolved in memory, using the same
+    'file (1).md' scheme as `organize_files`. Returns a list of {'src', 'dst'} dicts in
+    input order; sources that do not exist, and categories that would resolve outside
+    `base_dir`, are reported with an 'error' instead.
+    """
+    taken = {}
+    next_suffix = {}
+    plan = []
+    for file_path, category in moves:
+        if not os.path.isfile(file_path):
+            plan.append({"src": file_path, "dst": None, "error": f"Source file not found: {file_path}"})
+            continue
+
+        category_dir = os.path.join(base_dir, category)
+        names = taken.get(category_dir)
+        if names is None:
+            if not _inside(category_dir, base_dir):
+                plan.append({"src": file_path, "dst": None,
+                             "error": f"Category {category!r} resolves outside {base_dir}"})
+                continue
+            names = taken[category_dir] = set(os.listdir(category_dir)) if os.path.isdir(category_dir) else set()
+
+        file_name = os.path.basename(file_path)
+        new_file_name = file_name
+        if new_file_name in names:
+            name, extension = os.path.splitext(file_name)
+            counter = next_suffix.get((category_dir, file_name), 1)
+            new_file_name = f"{name} ({counter}){extension}"
+            while new_file_name in names:
+                counter += 1
+                new_file_name = f"{name} ({counter}){extension}"
+            next_suffix[(category_dir, file_name)] = counter + 1
+        names.add(new_file_name)
+        plan.append({"src": file_path, "dst": os.path.join(category_dir, new_file_name)})
+    return plan
+
+def _move(src, dst):
+    # A plain rename is atomic and avoids copying; across filesystems it fails with EXDEV.
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+def _append_journal(journal, record):
+    if journal is not None:
+        journal.write(json.dumps(record) + "\n")
+        journal.flush()
+
+def _read_journal(journal_path):
+    # 'moving' records are written before each rename (with the resolved destination),
+    # 'done' records after it.
+    plan, moving, done, rolled_back, complete = [], set(), set(), set(), False
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break # A torn last line from an interrupted write
+            if record["type"] == "plan":
+                plan = record["moves"]
+            elif record["type"] == "moving":
+                moving.add(record["index"])
+                plan[record["index"]]["dst"] = record["dst"]
+            elif record["type"] == "done":
+                done.add(record["index"])
+            elif record["type"] == "rolled_back":
+                rolled_back.add(record["index"])
+            elif record["type"] == "complete":
+                complete = True
+    # A move journaled as 'moving' whose source is gone and whose recorded destination
+    # exists was renamed before an interruption cut off its 'done' record.
+    interrupted = {
+        index for index in moving - done
+        if not os.path.exists(plan[index]["src"]) and os.path.exists(plan[index]["dst"])
+    }
+    return plan, done | interrupted, rolled_back, complete
+
+def _read_journal_base_dir(journal_path):
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        return json.loads(f.readline())["base_dir"]
+
+def _execute_plan(plan, done, journal):
+    moved, errors = [], []
+    for index, move in enumerate(plan):
+        if move.get("error"):
+            errors.append({"src": move["src"], "error": move["error"]})
+            continue
+        src, dst = move["src"], move["dst"]
+        if index in done:
+            moved.append({"src": src, "dst": dst})
+            continue
+        try:
+            os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+            # A file may have appeared at the planned destination since planning (e.g.
+            # before a resume); never overwrite it, pick the next free name instead.
+            dst = _unique_path(dst)
+            # Write-ahead: the destination is journaled before the rename, so a resume
+            # or rollback only ever trusts a location this run recorded.
+            _append_journal(journal, {"type": "moving", "index": index, "dst": os.path.abspath(dst)})
+            _move(src, dst)
+        except Exception as e:
+            errors.append({"src": src, "error": f"Failed to move file from {src} to {dst}: {e}"})
+            continue
+        _append_journal(journal, {"type": "done", "index": index})
+        moved.append({"src": src, "dst": dst})
+    _append_journal(journal, {"type": "complete"})
+    return {"moved": moved, "errors": errors}
+
+def _record_moves(store, moved, base_dir):
+    # The category of each move is the destination directory relative to base_dir.
+    store.move_articles(
+        (move["src"], move["dst"], os.path.relpath(os.path.dirname(move["dst"]), base_dir)) for move in moved
+    )
+
+def organize_files_bulk(moves, base_dir, journal_path=None, store=None):
+    """
+    Organizes many files at once. `moves` is an iterable of (file_path, category) pairs.
+
+    Destinations are planned up front with `plan_organize`, then files are moved with
+    `os.rename` when source and target share a filesystem. If `journal_path` is given,
+    the plan (with absolute paths) and every completed move are appended to it as JSON
+    lines (each destination before its rename), so an interrupted run can be finished
+    with `resume_organize` or undone with `rollback_organize` from any working directory.
+    A journal is only overwritten once its run is complete or fully rolled back;
+    otherwise FileExistsError is raised. With a `store`
+    (`metadata_store.MetadataStore`) all completed moves are recorded there in one transaction.
+    Returns {'moved': [{'src', 'dst'}], 'errors': [...], 'journal_path'}.
+    """
+    plan = plan_organize(moves, base_dir)
+    if journal_path is None:
+        result = _execute_plan(plan, set(), None)
+    else:
+        if os.path.exists(journal_path):
+            _, done, rolled_back, complete = _read_journal(journal_path)
+            if not (done <= rolled_back if rolled_back else complete):
+                raise FileExistsError(
+                    f"Journal {journal_path} holds an unfinished run or rollback; "
+                    "resume or roll it back first")
+        journaled = [
+            {**move, "src": os.path.abspath(move["src"]), "dst": move["dst"] and os.path.abspath(move["dst"])}
+            for move in plan
+        ]
+        with open(journal_path, 'w', encoding='utf-8') as journal:
+            _append_journal(journal, {"type": "plan", "base_dir": os.path.abspath(base_dir), "moves": journaled})
+            result = _execute_plan(plan, set(), journal)
+    if store is not None:
+        _record_moves(store, result["moved"], base_dir)
+    result["journal_path"] = journal_path
+    return result
+
+def resume_organize(journal_path, store=None):
+    """
+    Finishes the moves recorded in a journal that were not completed.
+    """
+    plan, done, rolled_back, complete = _read_journal(journal_path)
+    if complete or rolled_back:
+        return {"moved": [], "errors": [], "journal_path": journal_path}
+    with open(journal_path, 'a', encoding='utf-8') as journal:
+        result = _execute_plan(plan, done, journal)
+    if store is not None:
+        _record_moves(store, result["moved"], _read_journal_base_dir(journal_path))
+    result["journal_path"] = journal_path
+    return result
+
+def rollback_organize(journal_path, store=None):
+    """
+    Moves every file recorded as done in the journal back to its original location,
+    most recent first. With a `store`, restored articles get their original path back
+    (and keep their category). Returns {'restored': [{'src', 'dst'}], 'errors': [...]}.
+    """
+    plan, done, rolled_back, _ = _read_journal(journal_path)
+    restored, errors = [], []
+    with open(journal_path, 'a', encoding='utf-8') as journal:
+        for index in sorted(done - rolled_back, reverse=True):
+            src, dst = plan[index]["src"], plan[index]["dst"]
+            try:
+                if os.path.exists(src):
+                    raise FileExistsError(f"Original location is occupied: {src}")
+                os.makedirs(os.path.dirname(src) or ".", exist_ok=True)
+                _move(dst, src)
+            except Exception as e:
+                errors.append({"src": dst, "error": f"Failed to restore {dst} to {src}: {e}"})
+                continue
+            _append_journal(journal, {"type": "rolled_back", "index": index})
+            restored.append({"src": dst, "dst": src})
+    if store is not None:
+        store.move_articles((move["src"], move["dst"], None) for move in restored)
+    return {"restored": restored, "errors": errors, "journal_path": journal_path}
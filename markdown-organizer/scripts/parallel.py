@@ -0,0 +1,36 @@
+# scripts/parallel.py
+import os
+from multiprocessing import Pool
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CHUNK_SIZE = 16
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Normalizes a worker count: None means one worker per CPU, anything below 1 means 1.
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+def parallel_map(func: Callable[[T], R], items: Iterable[T], workers: Optional[int] = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[R]:
+    """
+    Applies `func` to every item and yields the results in input order.
+
+    With more than one worker the items are sharded into chunks of `chunk_size` across a
+    process pool and results are streamed back as soon as the next one in order is ready,
+    so output is deterministic regardless of which worker finishes first. `func` must be
+    picklable (a module-level function or a functools.partial of one).
+    """
+    workers = resolve_workers(workers)
+    if workers == 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with Pool(processes=workers) as pool:
+        yield from pool.imap(func, items, chunksize=max(1, chunk_size))
@@ -0,0 +1,157 @@
+# scripts/parse_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Bump when the parser output changes so stale on-disk entries are ignored.
+PARSER_VERSION = "4"
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_MAX_BYTES = 256 * 1024 * 1024
+
+def content_hash(md_content: str) -> str:
+    """
+    Returns the SHA-256 hex digest used to key parse results.
+    """
+    return hashlib.sha256(md_content.encode('utf-8')).hexdigest()
+
+class ParseCache:
+    """
+    Two-tier cache of parse results keyed by content hash.
+
+    The first tier is an in-process LRU holding up to `max_entries` results and about
+    `memory_max_bytes` of parsed text; a single result larger than that budget is not
+    kept in memory at all, so huge documents do not pin their text in the process. When
+    `disk_dir` is set, results are also written there as JSON and the directory is kept
+    under `disk_max_bytes` by evicting the least recently used files. Only the
+    content-derived fields are cached; callers re-attach `full_content` and the
+    path-derived fallback title.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, disk_dir: Optional[str] = None,
+                 disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES, memory_max_bytes: int = DEFAULT_MEMORY_MAX_BYTES):
+        self.max_entries = max_entries
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memory_sizes: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        entry = self._disk_get(key)
+        if entry is not None:
+            self._memory_put(key, entry)
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        self._memory_put(key, entry)
+        self._disk_put(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_sizes.clear()
+            self._memory_bytes = 0
+        if self.disk_dir:
+            for path, _, _ in self._disk_entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._disk_bytes = 0
+
+    @staticmethod
+    def _entry_size(entry: Dict[str, Any]) -> int:
+        # Rough resident size: the text dominates; each heading adds its text plus dict overhead.
+        return len(entry.get("plain_text", "")) + sum(len(h.get("text", "")) + 200 for h in entry.get("headings", ()))
+
+    def _memory_put(self, key: str, entry: Dict[str, Any]) -> None:
+        size = self._entry_size(entry)
+        with self._lock:
+            self._memory_bytes -= self._memory_sizes.pop(key, 0)
+            self._memory.pop(key, None)
+            if size > self.memory_max_bytes:
+                return
+            self._memory[key] = entry
+            self._memory_sizes[key] = size
+            self._memory_bytes += size
+            while len(self._memory) > self.max_entries or self._memory_bytes > self.memory_max_bytes:
+                evicted, _ = self._memory.popitem(last=False)
+                self._memory_bytes -= self._memory_sizes.pop(evicted)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{PARSER_VERSION}-{key}.json")
+
+    def _disk_entries(self):
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith('.json'):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield entry.path, st.st_size, st.st_mtime_ns
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path) # Mark as recently used for eviction.
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def _disk_put(self, key: str, entry: Dict[str, Any]) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        data = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        if len(data) > self.disk_max_bytes:
+            return
+        try:
+            previous_size = os.path.getsize(path)
+        except OSError:
+            previous_size = 0
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self._disk_bytes += len(data) - previous_size
+        if self._disk_bytes > self.disk_max_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        # Evict down to 90% of the budget so a full cache is not rescanned on every put.
+        target = self.disk_max_bytes * 0.9
+        entries = sorted(self._disk_entries(), key=lambda item: item[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._disk_bytes = total
@@ -0,0 +1,48 @@
+# scripts/prompt_batch.py
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from .categorizer import CATEGORIZE_TOKEN_BUDGET, build_categorize_prompt, load_category_config
+from .code_generator import CODE_TOKEN_BUDGET, build_code_prompt
+from .markdown_parser import parse_markdown_many
+from .parallel import DEFAULT_CHUNK_SIZE
+from .summarizer import SUMMARIZE_TOKEN_BUDGET, build_summarize_prompt
+
+PROMPT_TASKS = ("categorize", "summarize", "generate_code")
+DEFAULT_TOKEN_BUDGETS = {
+    "categorize": CATEGORIZE_TOKEN_BUDGET,
+    "summarize": SUMMARIZE_TOKEN_BUDGET,
+    "generate_code": CODE_TOKEN_BUDGET,
+}
+
+def build_llm_prompts(file_paths: Iterable[str], tasks: Sequence[str] = PROMPT_TASKS,
+                      categories_list: Optional[List[str]] = None, language: str = "Python",
+                      workers: Optional[int] = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      token_budgets: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yields prompt dicts for every requested task of every file.
+
+    Each file is parsed once and the result shared by all of its prompts; the category
+    config is loaded once for the whole batch. Every yielded dict carries a 'task' key
+    naming the prompt builder it came from. Files that fail to parse yield a single
+    error dict with 'file_path' and 'task': None. `token_budgets` overrides the
+    per-task content budgets in `DEFAULT_TOKEN_BUDGETS`.
+    """
+    unknown = set(tasks) - set(PROMPT_TASKS)
+    if unknown:
+        raise ValueError(f"Unknown prompt task(s): {', '.join(sorted(unknown))}")
+    if "categorize" in tasks and not categories_list:
+        categories_list = load_category_config().get("suggested_categories", [])
+    budgets = {**DEFAULT_TOKEN_BUDGETS, **(token_budgets or {})}
+
+    for file_path, parsed_data in parse_markdown_many(file_paths, workers, chunk_size):
+        if "error" in parsed_data:
+            yield {**parsed_data, "file_path": file_path, "task": None}
+            continue
+        for task in tasks:
+            if task == "categorize":
+                prompt = build_categorize_prompt(parsed_data, file_path, categories_list, budgets[task])
+            elif task == "summarize":
+                prompt = build_summarize_prompt(parsed_data, file_path, budgets[task])
+            else:
+                prompt = build_code_prompt(parsed_data, file_path, language, budgets[task])
+            prompt["task"] = task
+            yield prompt
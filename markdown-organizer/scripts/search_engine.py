@@ -1,18 +1,89 @@
 # scripts/search_engine.py
 import os
 import glob
+from functools import partial
+from .parallel import DEFAULT_CHUNK_SIZE, parallel_map
+from .search_index import SearchIndex
 
-def search_articles(query, base_dir):
+# Characters read per window when scanning files; peak memory per file stays around this size.
+SCAN_WINDOW_CHARS = 1 << 20
+
+def _file_contains(query, file_path, window_chars=SCAN_WINDOW_CHARS):
+    """
+    Case-insensitive substring test that reads the file in fixed-size windows.
+
+    Only the current window is lowercased. The last len(query) - 1 characters of each
+    window are carried into the next one, so matches spanning a window boundary are
+    still found without ever building a lowered copy of the whole file.
+    """
+    needle = query.lower()
+    if not needle:
+        return True
+    overlap = len(needle) - 1
+    tail = ""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        while True:
+            window = f.read(window_chars)
+            if not window:
+                return False
+            buffer = tail + window
+            if needle in buffer.lower():
+                return True
+            tail = buffer[-overlap:] if overlap else ""
+
+def search_articles(query, base_dir, index_path=None, refresh_index=False,
+                    workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
     """
     Searches for the query within Markdown files in the specified base directory.
-    This is a simple placeholder for a more sophisticated search.
+
+    Without `index_path` every file is scanned for the raw, case-insensitive substring,
+    reading `SCAN_WINDOW_CHARS` characters at a time so huge files use constant memory.
+    With `index_path` the query is answered from the on-disk inverted index instead
+    (whole-word terms, multi-word queries matched as a phrase); pass `refresh_index=True`
+    to pick up added, modified or removed files before querying. An index that has never
+    been built is built on first use, so an empty result always means "no matches".
+
+    `workers` > 1 (or None for one per CPU) spreads the file scan, or the index refresh,
+    across a process pool in chunks of `chunk_size` files; results keep the serial order.
     """
-    results = []
+    if index_path is not None:
+        with SearchIndex(index_path) as index:
+            if refresh_index or not index.is_built:
+                index.update(base_dir, workers=workers, chunk_size=chunk_size)
+            return [os.path.join(base_dir, path) for path in index.lookup(query)]
+
     markdown_files = glob.glob(os.path.join(base_dir, '**', '*.md'), recursive=True)
+    matches = parallel_map(partial(_file_contains, query), markdown_files, workers, chunk_size)
+    return [file_path for file_path, matched in zip(markdown_files, matches) if matched]
+
+def rank_articles(query, base_dir, index_path, top_k=10, refresh_index=False,
+                  workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Returns the `top_k` articles most relevant to the query, ranked by BM25 over the
+    on-disk index, as a list of {'path': ..., 'score': ...} dicts (best first).
+    Hits in headings and the title weigh more than hits in the body.
+    """
+    with SearchIndex(index_path) as index:
+        if refresh_index or not index.is_built:
+            index.update(base_dir, workers=workers, chunk_size=chunk_size)
+        return [
+            {"path": os.path.join(base_dir, hit["path"]), "score": hit["score"]}
+            for hit in index.rank(query, top_k)
+        ]
 
-    for file_path in markdown_files:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if query.lower() in content.lower():
-                results.append(file_path)
-    return results
+def search_sections(query, base_dir, index_path, limit=None, refresh_index=False,
+                    workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Section-level search over the on-disk index. Each hit is a dict with the article
+    'path', the enclosing 'heading_path', the section's 'start_line'/'end_line', the
+    'line' of the first match, a 'snippet' around it and the number of 'matches' in
+    that section. Results are served from section data stored in the index, so no
+    article is re-opened or re-parsed.
+    """
+    with SearchIndex(index_path) as index:
+        if refresh_index or not index.is_built:
+            index.update(base_dir, workers=workers, chunk_size=chunk_size)
+        hits = index.lookup_sections(query, limit)
+    for hit in hits:
+        hit["path"] = os.path.join(base_dir, hit["path"])
+    return hits
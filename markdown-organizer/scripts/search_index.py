@@ -0,0 +1,521 @@
+# scripts/search_index.py
+import heapq
+import json
+import math
+import os
+import re
+import sqlite3
+import zlib
+from array import array
+from bisect import bisect_right
+from itertools import groupby
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .markdown_parser import parse_markdown_content
+from .parallel import DEFAULT_CHUNK_SIZE, parallel_map
+
+SCHEMA_VERSION = "3"
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# BM25 parameters and per-field weights used by `SearchIndex.rank`.
+BM25_K1 = 1.2
+BM25_B = 0.75
+FIELD_WEIGHTS = {"body": 1.0, "headings": 2.0, "title": 3.0}
+
+# Characters of context shown around a match in section results.
+SNIPPET_CHARS = 160
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    heading_length INTEGER NOT NULL,
+    title_length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    heading_tf INTEGER NOT NULL,
+    title_tf INTEGER NOT NULL,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc_id ON postings (doc_id);
+CREATE TABLE IF NOT EXISTS collection_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    doc_count INTEGER NOT NULL,
+    total_length INTEGER NOT NULL,
+    total_heading_length INTEGER NOT NULL,
+    total_title_length INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO collection_stats VALUES (0, 0, 0, 0, 0);
+CREATE TABLE IF NOT EXISTS sections (
+    doc_id INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    first_position INTEGER NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL,
+    heading_path TEXT NOT NULL,
+    text BLOB NOT NULL,
+    PRIMARY KEY (doc_id, ordinal)
+) WITHOUT ROWID;
+"""
+
+_TABLES = ("meta", "documents", "postings", "collection_stats", "sections")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into lowercased word terms, the unit stored in the index.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def split_sections(content: str, headings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Splits a document into sections at the heading lines reported by the parser.
+    Each section has 1-based inclusive 'start_line'/'end_line', its 'heading_path'
+    (enclosing heading texts, outermost first) and its 'text'. Text before the first
+    heading becomes a section with an empty heading path.
+    """
+    lines = content.split('\n')
+    boundaries = [(heading['line'], heading) for heading in headings if heading.get('line')]
+    sections = []
+    if not boundaries or boundaries[0][0] > 1:
+        sections.append({"start_line": 1, "heading_path": [], "heading": None})
+    stack: List[Dict[str, Any]] = []
+    for line, heading in boundaries:
+        while stack and stack[-1]['level'] >= heading['level']:
+            stack.pop()
+        stack.append(heading)
+        sections.append({"start_line": line, "heading_path": [h['text'] for h in stack], "heading": heading})
+    for index, section in enumerate(sections):
+        next_start = sections[index + 1]["start_line"] if index + 1 < len(sections) else len(lines) + 1
+        section["end_line"] = max(section["start_line"], next_start - 1)
+        section["text"] = "\n".join(lines[section["start_line"] - 1:section["end_line"]])
+        del section["heading"]
+    return sections
+
+
+def analyze_document(content: str, file_path: str) -> Dict[str, Any]:
+    """
+    Tokenizes a document into the per-term statistics stored in the index:
+    body positions plus term frequencies within the headings and title
+    extracted by `parse_markdown_content`, and the section boundaries used
+    to answer section-level queries.
+    """
+    parsed_data = parse_markdown_content(content, file_path)
+
+    # Sections split on line boundaries and terms never span lines, so tokenizing
+    # section by section yields the same positions as tokenizing the whole document.
+    body_terms: Dict[str, array] = {}
+    sections = []
+    position = 0
+    for ordinal, section in enumerate(split_sections(content, parsed_data["headings"])):
+        sections.append((
+            ordinal, position, section["start_line"], section["end_line"],
+            json.dumps(section["heading_path"], ensure_ascii=False),
+            zlib.compress(section["text"].encode('utf-8')),
+        ))
+        for term in tokenize(section["text"]):
+            positions = body_terms.get(term)
+            if positions is None:
+                positions = body_terms[term] = array('I')
+            positions.append(position)
+            position += 1
+
+    heading_terms = tokenize(" ".join(heading['text'] for heading in parsed_data["headings"]))
+    title_terms = tokenize(parsed_data["title"])
+    heading_tf: Dict[str, int] = {}
+    for term in heading_terms:
+        heading_tf[term] = heading_tf.get(term, 0) + 1
+    title_tf: Dict[str, int] = {}
+    for term in title_terms:
+        title_tf[term] = title_tf.get(term, 0) + 1
+
+    postings = []
+    for term in body_terms.keys() | heading_tf.keys() | title_tf.keys():
+        positions = body_terms.get(term, array('I'))
+        postings.append(
+            (term, len(positions), heading_tf.get(term, 0), title_tf.get(term, 0), positions.tobytes())
+        )
+    return {
+        "length": position,
+        "heading_length": len(heading_terms),
+        "title_length": len(title_terms),
+        "postings": postings,
+        "sections": sections,
+    }
+
+
+def read_and_analyze(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads and analyzes one file; returns None if it cannot be read as UTF-8 text.
+    Kept at module level so it can be dispatched to worker processes.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return analyze_document(content, file_path)
+
+
+def iter_markdown_files(base_dir: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Yields (path relative to base_dir, stat result) for every `*.md` file under base_dir.
+    Hidden files and directories are skipped, matching `glob('**/*.md')`.
+    """
+    pending = [""]
+    while pending:
+        rel_dir = pending.pop()
+        try:
+            entries = list(os.scandir(os.path.join(base_dir, rel_dir)))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+            try:
+                if entry.is_dir():
+                    pending.append(rel_path)
+                elif entry.name.endswith('.md') and entry.is_file():
+                    yield rel_path, entry.stat()
+            except OSError:
+                continue
+
+
+class SearchIndex:
+    """
+    On-disk inverted index (term -> postings with positions) over a directory of Markdown files.
+
+    Documents are keyed by their path relative to the indexed directory and are only
+    re-tokenized when their mtime or size changes, so `update` reads just the files that
+    were added or modified since the previous run.
+    """
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self.conn = sqlite3.connect(index_path)
+        self._ensure_schema()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _ensure_schema(self) -> None:
+        version = None
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            version = row[0] if row else None
+        except sqlite3.OperationalError:
+            pass
+        if version != SCHEMA_VERSION:
+            # An index written by another schema version is simply rebuilt from scratch.
+            with self.conn:
+                for table in _TABLES:
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)", (SCHEMA_VERSION,)
+            )
+
+    def update(self, base_dir: str, workers: Optional[int] = 1,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, int]:
+        """
+        Brings the index in line with the Markdown files currently under base_dir.
+        Returns counts of added, updated, removed and unchanged documents.
+
+        Changed files are read and tokenized with `parallel_map`, so `workers` > 1
+        (or None for one per CPU) spreads a cold build across processes.
+        """
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        known = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self.conn.execute("SELECT path, mtime_ns, size FROM documents")
+        }
+        changed = []
+        for rel_path, st in iter_markdown_files(base_dir):
+            previous = known.pop(rel_path, None)
+            if previous == (st.st_mtime_ns, st.st_size):
+                stats["unchanged"] += 1
+            else:
+                changed.append((rel_path, st, previous is not None))
+
+        analyses = parallel_map(
+            read_and_analyze,
+            [os.path.join(base_dir, rel_path) for rel_path, _, _ in changed],
+            workers,
+            chunk_size,
+        )
+        with self.conn:
+            for (rel_path, st, existed), analysis in zip(changed, analyses):
+                if analysis is None:
+                    self.remove_file(rel_path)
+                    continue
+                self.store_document(rel_path, st, analysis)
+                stats["updated" if existed else "added"] += 1
+            for rel_path in known:
+                self.remove_file(rel_path)
+                stats["removed"] += 1
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('built', '1')")
+        return stats
+
+    @property
+    def is_built(self) -> bool:
+        """
+        True once `update` has run on this index (with the current schema version).
+        """
+        return self.conn.execute("SELECT 1 FROM meta WHERE key = 'built'").fetchone() is not None
+
+    def index_file(self, base_dir: str, rel_path: str, st: Optional[os.stat_result] = None) -> bool:
+        """
+        (Re)indexes a single file. Returns False if the file could not be read.
+        """
+        file_path = os.path.join(base_dir, rel_path)
+        try:
+            if st is None:
+                st = os.stat(file_path)
+        except OSError:
+            analysis = None
+        else:
+            analysis = read_and_analyze(file_path)
+        if analysis is None:
+            self.remove_file(rel_path)
+            return False
+
+        self.store_document(rel_path, st, analysis)
+        return True
+
+    def store_document(self, rel_path: str, st: os.stat_result, analysis: Dict[str, Any]) -> None:
+        """
+        Writes the output of `analyze_document` for a file, replacing any previous entry.
+        """
+        self.remove_file(rel_path)
+        cursor = self.conn.execute(
+            "INSERT INTO documents (path, mtime_ns, size, length, heading_length, title_length) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (rel_path, st.st_mtime_ns, st.st_size,
+             analysis["length"], analysis["heading_length"], analysis["title_length"]),
+        )
+        doc_id = cursor.lastrowid
+        self.conn.executemany(
+            "INSERT INTO postings (term, doc_id, tf, heading_tf, title_tf, positions) VALUES (?, ?, ?, ?, ?, ?)",
+            ((term, doc_id, tf, heading_tf, title_tf, positions)
+             for term, tf, heading_tf, title_tf, positions in analysis["postings"]),
+        )
+        self.conn.executemany(
+            "INSERT INTO sections (doc_id, ordinal, first_position, start_line, end_line, heading_path, text) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((doc_id, *section) for section in analysis["sections"]),
+        )
+        self._adjust_stats(1, analysis["length"], analysis["heading_length"], analysis["title_length"])
+
+    def _adjust_stats(self, docs: int, length: int, heading_length: int, title_length: int) -> None:
+        self.conn.execute(
+            "UPDATE collection_stats SET doc_count = doc_count + ?, total_length = total_length + ?, "
+            "total_heading_length = total_heading_length + ?, total_title_length = total_title_length + ? "
+            "WHERE id = 0",
+            (docs, length, heading_length, title_length),
+        )
+
+    def remove_file(self, rel_path: str) -> None:
+        """
+        Drops a document and its postings from the index, if present.
+        """
+        row = self.conn.execute(
+            "SELECT doc_id, length, heading_length, title_length FROM documents WHERE path = ?", (rel_path,)
+        ).fetchone()
+        if row is None:
+            return
+        doc_id, length, heading_length, title_length = row
+        self.conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self.conn.execute("DELETE FROM sections WHERE doc_id = ?", (doc_id,))
+        self.conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+        self._adjust_stats(-1, -length, -heading_length, -title_length)
+
+    def _postings(self, term: str) -> Dict[int, bytes]:
+        return {
+            doc_id: positions
+            for doc_id, positions in self.conn.execute(
+                "SELECT doc_id, positions FROM postings WHERE term = ? AND tf > 0", (term,)
+            )
+        }
+
+    def _match_positions(self, query: str) -> Dict[int, List[int]]:
+        """
+        Maps each matching doc_id to the positions where the query (as a phrase) starts.
+        """
+        query_terms = tokenize(query)
+        if not query_terms:
+            return {}
+
+        postings = {}
+        for term in set(query_terms):
+            postings[term] = self._postings(term)
+            if not postings[term]:
+                return {}
+
+        # Intersect starting from the rarest term to keep the candidate set small.
+        rarest = min(postings.values(), key=len)
+        matches = {}
+        for doc_id in rarest:
+            if all(doc_id in p for p in postings.values()):
+                starts = self._phrase_starts(doc_id, query_terms, postings)
+                if starts:
+                    matches[doc_id] = starts
+        return matches
+
+    def _paths(self, doc_ids: List[int]) -> Dict[int, str]:
+        paths = {}
+        for start in range(0, len(doc_ids), 500):
+            chunk = doc_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            paths.update(self.conn.execute(
+                f"SELECT doc_id, path FROM documents WHERE doc_id IN ({placeholders})", chunk
+            ))
+        return paths
+
+    def lookup(self, query: str) -> List[str]:
+        """
+        Returns the relative paths of documents containing every term of the query.
+        Multi-term queries are matched as a phrase using the stored positions.
+        """
+        matches = self._match_positions(query)
+        return sorted(self._paths(list(matches)).values())
+
+    def lookup_sections(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Returns one result per section containing the query, ordered by path and position:
+        {'path', 'heading_path', 'start_line', 'end_line', 'line', 'snippet', 'matches'}.
+        Everything comes from the stored section boundaries and text; no file is read.
+        """
+        matches = self._match_positions(query)
+        paths = self._paths(list(matches))
+        results = []
+        for doc_id in sorted(matches, key=paths.get):
+            sections = self.conn.execute(
+                "SELECT first_position, start_line, end_line, heading_path, text FROM sections "
+                "WHERE doc_id = ? ORDER BY ordinal", (doc_id,)
+            ).fetchall()
+            first_positions = [row[0] for row in sections]
+            hits: Dict[int, List[int]] = {}
+            for start in matches[doc_id]:
+                hits.setdefault(bisect_right(first_positions, start) - 1, []).append(start)
+            for section_index in sorted(hits):
+                first_position, start_line, end_line, heading_path, text = sections[section_index]
+                text = zlib.decompress(text).decode('utf-8')
+                line, snippet = self._snippet(text, start_line, hits[section_index][0] - first_position)
+                results.append({
+                    "path": paths[doc_id],
+                    "heading_path": json.loads(heading_path),
+                    "start_line": start_line,
+                    "end_line": end_line,
+                    "line": line,
+                    "snippet": snippet,
+                    "matches": len(hits[section_index]),
+                })
+                if limit is not None and len(results) >= limit:
+                    return results
+        return results
+
+    @staticmethod
+    def _snippet(text: str, start_line: int, token_offset: int) -> Tuple[int, str]:
+        offset = 0
+        for index, match in enumerate(TOKEN_PATTERN.finditer(text)):
+            if index == token_offset:
+                offset = match.start()
+                break
+        begin = max(0, offset - SNIPPET_CHARS // 2)
+        snippet = " ".join(text[begin:begin + SNIPPET_CHARS].split())
+        return start_line + text.count('\n', 0, offset), snippet
+
+    @staticmethod
+    def _phrase_starts(doc_id: int, query_terms: List[str], postings: Dict[str, Dict[int, bytes]]) -> List[int]:
+        term_positions = []
+        for term in query_terms:
+            positions = array('I')
+            positions.frombytes(postings[term][doc_id])
+            term_positions.append(positions)
+        following = [set(positions) for positions in term_positions[1:]]
+        return [
+            start for start in term_positions[0]
+            if all(start + offset in positions for offset, positions in enumerate(following, 1))
+        ]
+
+    def rank(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Returns the `top_k` documents for the query ranked by BM25, as dicts with
+        'path' (relative) and 'score'.
+
+        Term frequencies from the body, headings and title are combined with
+        `FIELD_WEIGHTS` (BM25F), each normalized by its own length statistics from the
+        collection store. Postings are streamed in document order and only the best
+        `top_k` candidates are kept in a bounded heap.
+        """
+        query_terms = sorted(set(tokenize(query)))
+        if not query_terms or top_k <= 0:
+            return []
+
+        doc_count, total_length, total_heading_length, total_title_length = self.conn.execute(
+            "SELECT doc_count, total_length, total_heading_length, total_title_length "
+            "FROM collection_stats WHERE id = 0"
+        ).fetchone()
+        if not doc_count:
+            return []
+        avg_lengths = (
+            total_length / doc_count or 1.0,
+            total_heading_length / doc_count or 1.0,
+            total_title_length / doc_count or 1.0,
+        )
+        weights = (FIELD_WEIGHTS["body"], FIELD_WEIGHTS["headings"], FIELD_WEIGHTS["title"])
+
+        idf = {}
+        for term in query_terms:
+            (df,) = self.conn.execute("SELECT COUNT(*) FROM postings WHERE term = ?", (term,)).fetchone()
+            idf[term] = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+
+        placeholders = ",".join("?" * len(query_terms))
+        rows = self.conn.execute(
+            "SELECT p.doc_id, d.path, p.term, p.tf, p.heading_tf, p.title_tf, "
+            "d.length, d.heading_length, d.title_length "
+            "FROM postings p JOIN documents d ON d.doc_id = p.doc_id "
+            f"WHERE p.term IN ({placeholders}) ORDER BY p.doc_id",
+            query_terms,
+        )
+
+        heap: List[Tuple[float, int, str]] = []
+        for doc_id, doc_rows in groupby(rows, key=lambda row: row[0]):
+            score = 0.0
+            path = ""
+            for _, path, term, *field_stats in doc_rows:
+                frequencies, lengths = field_stats[:3], field_stats[3:]
+                weighted_tf = sum(
+                    weight * tf / (1.0 - BM25_B + BM25_B * length / avg_length)
+                    for weight, tf, length, avg_length in zip(weights, frequencies, lengths, avg_lengths)
+                )
+                score += idf[term] * weighted_tf * (BM25_K1 + 1.0) / (weighted_tf + BM25_K1)
+            entry = (score, -doc_id, path)
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        return [
+            {"path": path, "score": score}
+            for score, _, path in sorted(heap, reverse=True)
+        ]
@@ -1,17 +1,25 @@
 # scripts/summarizer.py
-from jinja2 import Template
 import os
-from .markdown_parser import parse_markdown # Relative import
+from functools import lru_cache, partial
+from .answer_cache import versioned
+from .context_packer import pack_context
+from .markdown_parser import parse_markdown, parse_markdown_many # Relative import
+from .parallel import DEFAULT_CHUNK_SIZE, parallel_map, resolve_workers
 
-def summarize_content_llm_prompt(file_path):
+# Bump when the prompt template changes so cached answers are not reused.
+SUMMARIZE_PROMPT_VERSION = "summarize-1"
+# Token budget for the article content in a summarization prompt.
+SUMMARIZE_TOKEN_BUDGET = 1000
+
+def build_summarize_prompt(parsed_data, file_path, token_budget=SUMMARIZE_TOKEN_BUDGET):
     """
-    Prepares a prompt for an LLM to summarize the given Markdown file.
+    Builds the summarization prompt from an already parsed article, packing the most
+    informative sections into about `token_budget` tokens.
     """
-    parsed_data = parse_markdown(file_path)
     if "error" in parsed_data:
         return parsed_data
 
-    plain_text = parsed_data.get("plain_text", "")
+    content = pack_context(parsed_data, token_budget)
     title = parsed_data.get("title", os.path.basename(file_path))
 
     prompt = f"""
@@ -21,33 +29,124 @@ The summary should be about 3-5 sentences long and capture the main points of th
 Article Title: {title}
 ---
 Article Content:
-{plain_text[:4000]} # Limit content for prompt length, adjust as needed.
+{content}
 ---
 Provide only the summary text as your response.
 """
-    return {"llm_prompt": prompt, "file_path": file_path, "title": title}
+    return {
+        "llm_prompt": prompt,
+        "file_path": file_path,
+        "title": title,
+        "content_hash": parsed_data.get("content_hash"),
+        "prompt_version": versioned(SUMMARIZE_PROMPT_VERSION, token_budget),
+    }
+
+def summarize_content_llm_prompt(file_path, token_budget=SUMMARIZE_TOKEN_BUDGET):
+    """
+    Prepares a prompt for an LLM to summarize the given Markdown file.
+    """
+    return build_summarize_prompt(parse_markdown(file_path), file_path, token_budget)
+
+def summarize_content_llm_prompts(file_paths, workers=1, chunk_size=DEFAULT_CHUNK_SIZE,
+                                  token_budget=SUMMARIZE_TOKEN_BUDGET):
+    """
+    Lazily yields summarization prompts for many files, in input order.
+    Files that fail to parse yield their error dict with the 'file_path' added.
+    """
+    for file_path, parsed_data in parse_markdown_many(file_paths, workers, chunk_size):
+        if "error" in parsed_data:
+            yield {**parsed_data, "file_path": file_path}
+        else:
+            yield build_summarize_prompt(parsed_data, file_path, token_budget)
+
+DEFAULT_TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), '..', 'resources', 'summary_template.md')
+
+@lru_cache(maxsize=32)
+def _compile_template(template_path, mtime_ns):
+    # Keyed by mtime so an edited template is recompiled; unchanged ones compile once per process.
+    from jinja2 import Template # Deferred: only summary files need jinja2
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return Template(f.read())
 
-def generate_summary_file(articles_data, category_name, template_path=None, output_dir="."):
+def load_template(template_path=None):
+    """
+    Returns the compiled Jinja template, reusing the cached one while the file is unchanged.
+    """
+    if template_path is None:
+        template_path = DEFAULT_TEMPLATE_PATH
+    return _compile_template(os.path.abspath(template_path), os.stat(template_path).st_mtime_ns)
+
+def summary_file_name(category_name):
+    """
+    Flat file name of a category's summary ('Programming/Python' -> 'Programming_Python_summary.md').
+    """
+    return f"{category_name.replace('/', '_')}_summary.md"
+
+def _summary_file_names(category_names):
+    # Flattening can map different categories to one name ('A/B' and 'A_B'), and names
+    # differing only in case collide on case-insensitive filesystems. Categories are taken
+    # in sorted order so each keeps the same name from run to run; later ones get '_2', '_3', ...
+    names, taken = {}, set()
+    for category_name in sorted(category_names):
+        file_name = summary_file_name(category_name)
+        stem = file_name[:-len("_summary.md")]
+        counter = 2
+        while file_name.lower() in taken:
+            file_name = f"{stem}_{counter}_summary.md"
+            counter += 1
+        taken.add(file_name.lower())
+        names[category_name] = file_name
+    return names
+
+def generate_summary_file(articles_data, category_name, template_path=None, output_dir=".", file_name=None):
     """
     Generates a summary Markdown file for a given category using a template.
-    `articles_data` should be a list of dicts, each with 'title', 'path', and 'summary'.
+    `articles_data` should be an iterable of dicts, each with 'title', 'path', and 'summary'.
+    The file is named `file_name`, by default `summary_file_name(category_name)`.
+
+    The output is streamed to disk with Jinja's `generate()`, so the rendered summary is
+    never held in memory as a whole; pass a generator to avoid materializing the articles too.
     """
     if template_path is None:
-        template_path = os.path.join(os.path.dirname(__file__), '..', 'resources', 'summary_template.md')
+        template_path = DEFAULT_TEMPLATE_PATH
 
     try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
+        template = load_template(template_path)
     except Exception as e:
         return {"error": f"Failed to read template file {template_path}: {e}"}
 
-    template = Template(template_content)
-    summary_content = template.render(category_name=category_name, articles=articles_data)
-    
-    summary_file_path = os.path.join(output_dir, f"{category_name}_summary.md")
+    summary_file_path = os.path.join(output_dir, file_name or summary_file_name(category_name))
     try:
         with open(summary_file_path, 'w', encoding='utf-8') as f:
-            f.write(summary_content)
+            f.writelines(template.generate(category_name=category_name, articles=articles_data))
         return {"summary_file_path": summary_file_path}
     except Exception as e:
         return {"error": f"Failed to write summary file {summary_file_path}: {e}"}
+
+def _generate_category_summary(template_path, output_dir, item):
+    category_name, file_name, articles_data = item
+    return generate_summary_file(articles_data, category_name, template_path, output_dir, file_name)
+
+def generate_summary_files(categories, template_path=None, output_dir=".", workers=1, chunk_size=1):
+    """
+    Writes one summary file per category. `categories` maps category names to their
+    articles data (see `generate_summary_file`). With `workers` > 1 (or None for one per
+    CPU) categories are rendered in parallel processes. Categories whose flattened file
+    names would collide get distinct ones (see `_summary_file_names`).
+    Returns {category_name: result}.
+    """
+    file_names = _summary_file_names(categories)
+    parallel = resolve_workers(workers) > 1
+    # Generators cannot be pickled, so articles are materialized before going to a worker.
+    items = [(category_name, file_names[category_name], list(articles_data) if parallel else articles_data)
+             for category_name, articles_data in categories.items()]
+    results = parallel_map(partial(_generate_category_summary, template_path, output_dir), items, workers, chunk_size)
+    return {category_name: result for (category_name, _, _), result in zip(items, results)}
+
+def generate_store_summaries(store, template_path=None, output_dir=".", recursive=False, workers=1, chunk_size=1):
+    """
+    Writes one summary file per category recorded in a `metadata_store.MetadataStore`,
+    straight from the stored titles, paths and summaries; nothing is re-parsed. With
+    `recursive`, parent categories also list their subcategories' articles.
+    """
+    return generate_summary_files(store.articles_by_category(recursive), template_path, output_dir, workers, chunk_size)
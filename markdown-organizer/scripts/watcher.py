@@ -0,0 +1,199 @@
+# scripts/watcher.py
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from .markdown_parser import parse_markdown
+from .prompt_batch import build_llm_prompts
+from .search_index import SearchIndex, iter_markdown_files
+
+try:
+    from watchdog.observers import Observer
+except ImportError: # Optional dependency; the watcher falls back to polling.
+    Observer = None
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+DEFAULT_INTERVAL = 2.0
+
+def snapshot_markdown_files(base_dir: str) -> Snapshot:
+    """
+    Maps every `*.md` file under base_dir (relative path) to its (mtime_ns, size).
+    """
+    return {rel_path: (st.st_mtime_ns, st.st_size) for rel_path, st in iter_markdown_files(base_dir)}
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> Dict[str, List[str]]:
+    """
+    Compares two snapshots and returns sorted relative paths that were added, changed or removed.
+    """
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "changed": sorted(path for path in new.keys() & old.keys() if new[path] != old[path]),
+        "removed": sorted(old.keys() - new.keys()),
+    }
+
+class _EventCollector:
+    """
+    Receives watchdog events and records which Markdown paths are dirty. Directory
+    events (renames, deletions of whole folders) request a full rescan instead.
+    """
+
+    def __init__(self, base_dir: str):
+        self.base_dir = os.path.abspath(base_dir)
+        self.lock = threading.Lock()
+        self.dirty: Set[str] = set()
+        self.rescan = False
+
+    def dispatch(self, event) -> None:
+        with self.lock:
+            if event.is_directory:
+                if event.event_type in ("moved", "deleted", "created"):
+                    self.rescan = True
+                return
+            for path in (event.src_path, getattr(event, "dest_path", None)):
+                if not path or not path.endswith(".md"):
+                    continue
+                rel_path = os.path.relpath(os.path.abspath(path), self.base_dir)
+                # Match iter_markdown_files: hidden files and directories are not watched.
+                if not any(part.startswith('.') for part in rel_path.split(os.sep)):
+                    self.dirty.add(rel_path)
+
+    def take(self) -> Tuple[Set[str], bool]:
+        with self.lock:
+            dirty, rescan = self.dirty, self.rescan
+            self.dirty, self.rescan = set(), False
+        return dirty, rescan
+
+class VaultWatcher:
+    """
+    Long-running incremental watcher for a Markdown vault.
+
+    Changes are detected through watchdog (inotify on Linux) when it is installed and
+    `use_polling` is False, otherwise by polling mtimes and sizes every `interval`
+    seconds. Each batch of added, changed and removed files refreshes the parse cache
+    and the search index (if `index_path` is given) for just those files, and added or
+    changed files are put on `work_queue` for categorization and summarization.
+    """
+
+    def __init__(self, base_dir: str, index_path: Optional[str] = None, interval: float = DEFAULT_INTERVAL,
+                 use_polling: bool = False):
+        self.base_dir = base_dir
+        self.index_path = index_path
+        self.interval = interval
+        self.use_polling = use_polling or Observer is None
+        self.work_queue: "queue.Queue[str]" = queue.Queue()
+        self._snapshot: Snapshot = {}
+        self._collector: Optional[_EventCollector] = None
+        self._observer = None
+
+    def start(self) -> Dict[str, int]:
+        """
+        Starts the event observer, takes the baseline snapshot and syncs the index once.
+        Files present at start are not queued. Returns the index update counts, if any.
+        """
+        # Observer first, then snapshot, then sync: a file written at any point during
+        # start-up is either in the snapshot or reported by a later event/poll. Events for
+        # files the snapshot already covers are dropped when they are diffed against it.
+        if not self.use_polling:
+            self._collector = _EventCollector(self.base_dir)
+            self._observer = Observer()
+            self._observer.schedule(self._collector, self.base_dir, recursive=True)
+            self._observer.start()
+        self._snapshot = snapshot_markdown_files(self.base_dir)
+        stats = {}
+        if self.index_path:
+            with SearchIndex(self.index_path) as index:
+                stats = index.update(self.base_dir)
+        return stats
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def detect_changes(self) -> Dict[str, List[str]]:
+        """
+        Returns the changes since the previous call and advances the snapshot.
+        With an event observer only the paths reported dirty are re-stat'ed.
+        """
+        if self._collector is None:
+            new_snapshot = snapshot_markdown_files(self.base_dir)
+        else:
+            dirty, rescan = self._collector.take()
+            if rescan:
+                new_snapshot = snapshot_markdown_files(self.base_dir)
+            else:
+                new_snapshot = dict(self._snapshot)
+                for rel_path in dirty:
+                    try:
+                        st = os.stat(os.path.join(self.base_dir, rel_path))
+                        new_snapshot[rel_path] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        new_snapshot.pop(rel_path, None)
+        changes = diff_snapshots(self._snapshot, new_snapshot)
+        self._snapshot = new_snapshot
+        return changes
+
+    def apply_changes(self, changes: Dict[str, List[str]]) -> None:
+        """
+        Refreshes the parse cache and search index for the changed files and queues them.
+        """
+        touched = changes["added"] + changes["changed"]
+        if self.index_path:
+            with SearchIndex(self.index_path) as index, index.conn:
+                for rel_path in changes["removed"]:
+                    index.remove_file(rel_path)
+                for rel_path in touched:
+                    index.index_file(self.base_dir, rel_path)
+        for rel_path in touched:
+            file_path = os.path.join(self.base_dir, rel_path)
+            parse_markdown(file_path) # Warms the parse cache for the queued work.
+            self.work_queue.put(file_path)
+
+    def poll_once(self) -> Dict[str, List[str]]:
+        changes = self.detect_changes()
+        if any(changes.values()):
+            self.apply_changes(changes)
+        return changes
+
+    def run(self, stop_event: Optional[threading.Event] = None,
+            max_iterations: Optional[int] = None) -> Iterator[Dict[str, List[str]]]:
+        """
+        Watches until `stop_event` is set (or for `max_iterations` rounds), yielding every
+        non-empty batch of changes after it has been applied.
+        """
+        self.start()
+        iterations = 0
+        try:
+            while not (stop_event and stop_event.is_set()):
+                if max_iterations is not None and iterations >= max_iterations:
+                    break
+                iterations += 1
+                changes = self.poll_once()
+                if any(changes.values()):
+                    yield changes
+                if stop_event is not None:
+                    stop_event.wait(self.interval)
+                else:
+                    time.sleep(self.interval)
+        finally:
+            self.stop()
+
+    def drain_prompts(self, tasks: Sequence[str] = ("categorize", "summarize"), **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Yields prompts (see `build_llm_prompts`) for every file queued so far.
+        Files queued more than once are only prompted for once.
+        """
+        pending = []
+        seen = set()
+        while True:
+            try:
+                file_path = self.work_queue.get_nowait()
+            except queue.Empty:
+                break
+            if file_path not in seen and os.path.exists(file_path):
+                seen.add(file_path)
+                pending.append(file_path)
+        return build_llm_prompts(pending, tasks=tasks, **kwargs)
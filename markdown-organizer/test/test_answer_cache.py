@@ -0,0 +1,72 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts import answer_cache
+from scripts.answer_cache import AnswerCache, versioned
+
+class TestAnswerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, 'answers.sqlite')
+        self.now = 1000.0
+        patcher = mock.patch.object(answer_cache.time, 'time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_persistence(self):
+        with AnswerCache(self.cache_path) as cache:
+            self.assertIsNone(cache.get('h', 'v1', 'model'))
+            cache.put('h', 'v1', 'model', 'Python')
+            self.assertEqual(cache.get('h', 'v1', 'model'), 'Python')
+            self.assertIsNone(cache.get('h', 'v2', 'model'))
+            self.assertIsNone(cache.get('h', 'v1', 'other-model'))
+        with AnswerCache(self.cache_path) as cache:
+            self.assertEqual(cache.get('h', 'v1', 'model'), 'Python')
+
+    def test_ttl(self):
+        with AnswerCache(self.cache_path, ttl_seconds=60) as cache:
+            cache.put('a', 'v', 'm', 'old')
+            self.now += 30
+            cache.put('b', 'v', 'm', 'newer')
+            self.now += 45
+            self.assertIsNone(cache.get('a', 'v', 'm'))
+            self.assertEqual(cache.get('b', 'v', 'm'), 'newer')
+            self.now += 30
+            self.assertEqual(cache.purge_expired(), 1)
+            self.assertEqual(cache._total_bytes, 0)
+
+    def test_lru_eviction(self):
+        with AnswerCache(self.cache_path, max_bytes=100) as cache:
+            for index in range(4):
+                self.now += 1
+                cache.put(str(index), 'v', 'm', 'x' * 20)
+            self.now += 1
+            cache.get('0', 'v', 'm') # Now the most recently used
+            self.now += 1
+            cache.put('4', 'v', 'm', 'x' * 30)
+            # 110 bytes > 100: least recently used entries go until at most 90 bytes remain
+            self.assertEqual([key for key in '01234' if cache.get(key, 'v', 'm') is not None], ['0', '2', '3', '4'])
+            self.assertLessEqual(cache._total_bytes, 90)
+
+    def test_prompt_helpers(self):
+        prompt = {'content_hash': 'h', 'prompt_version': versioned('categorize-1', ('A', 'B'))}
+        self.assertNotEqual(prompt['prompt_version'], versioned('categorize-1', ('A',)))
+        self.assertEqual(versioned('categorize-1'), 'categorize-1')
+        with AnswerCache(self.cache_path) as cache:
+            cache.put_for_prompt(prompt, 'm', 'A')
+            self.assertEqual(cache.get_for_prompt(prompt, 'm'), 'A')
+            cache.put_for_prompt({'llm_prompt': 'no hash'}, 'm', 'ignored')
+            self.assertIsNone(cache.get_for_prompt({'llm_prompt': 'no hash'}, 'm'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import os
+import sys
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.code_generator import build_code_prompt
+from scripts.context_packer import (OMISSION_MARKER, clear_pack_cache, estimate_tokens, pack_context,
+                                    split_sections)
+from scripts.markdown_parser import parse_markdown_content
+
+def paragraph(topic, sentences):
+    return " ".join(f"Sentence {i} explains {topic} detail number {i}." for i in range(sentences))
+
+ARTICLE = f"""Intro paragraph about sorting algorithms.
+
+# Quicksort
+
+{paragraph("partitioning", 40)}
+
+## License
+
+{paragraph("licensing", 40)}
+
+## Complexity
+
+{paragraph("complexity", 40)}
+"""
+
+class TestContextPacker(unittest.TestCase):
+
+    def setUp(self):
+        clear_pack_cache()
+        self.parsed = parse_markdown_content(ARTICLE, 'sorting.md', use_cache=False)
+
+    def test_split_sections(self):
+        sections = split_sections(self.parsed)
+        self.assertEqual([(s['heading'], s['level'], s['ordinal']) for s in sections],
+                         [('', 0, 0), ('Quicksort', 1, 1), ('License', 2, 2), ('Complexity', 2, 3)])
+        self.assertEqual(sections[0]['text'], 'Intro paragraph about sorting algorithms.')
+        self.assertTrue(sections[3]['text'].startswith('Complexity'))
+
+    def test_short_articles_are_unchanged(self):
+        parsed = parse_markdown_content('# Tiny\n\nJust a line.\n', 'tiny.md', use_cache=False)
+        self.assertEqual(pack_context(parsed, 100), parsed['plain_text'])
+
+    def test_packing_respects_the_budget(self):
+        for budget in (50, 200, 400):
+            with self.subTest(budget=budget):
+                packed = pack_context(self.parsed, budget)
+                self.assertLessEqual(estimate_tokens(packed), budget + 2 * estimate_tokens(OMISSION_MARKER))
+                self.assertTrue(packed.startswith('Intro paragraph'))
+
+    def test_boilerplate_goes_last_and_truncation_keeps_sentences(self):
+        packed = pack_context(self.parsed, 400)
+        self.assertNotIn('licensing', packed)
+        self.assertIn('partitioning', packed)
+        self.assertIn(OMISSION_MARKER, packed)
+        # A truncated section ends on a whole sentence before its marker.
+        for part in packed.split('\n\n'):
+            if part.endswith(' ' + OMISSION_MARKER):
+                self.assertTrue(part[:-len(OMISSION_MARKER)].rstrip().endswith('.'))
+
+    def test_results_are_cached_per_budget(self):
+        first = pack_context(self.parsed, 200)
+        self.assertIs(pack_context(self.parsed, 200), first)
+        self.assertNotEqual(pack_context(self.parsed, 100), first)
+
+    def test_prompts_use_their_token_budget(self):
+        small = build_code_prompt(self.parsed, 'sorting.md', token_budget=100)
+        large = build_code_prompt(self.parsed, 'sorting.md', token_budget=2000)
+        self.assertLess(len(small['llm_prompt']), len(large['llm_prompt']))
+        self.assertNotEqual(small['prompt_version'], large['prompt_version'])
+
+if __name__ == '__main__':
+    unittest.main()
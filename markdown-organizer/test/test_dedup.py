@@ -0,0 +1,59 @@
+import unittest
+import os
+import random
+import sys
+import tempfile
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.dedup import cluster_signatures, estimate_similarity, find_duplicates_in_dir, minhash_signature, shingles
+
+def article(seed, words=300):
+    rng = random.Random(seed)
+    return " ".join(f"word{rng.randrange(5000)}" for _ in range(words))
+
+class TestDedup(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.base_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"# {name}\n\n{content}\n")
+        return path
+
+    def test_similarity_estimate(self):
+        text = article(1)
+        same = minhash_signature(shingles(text))
+        self.assertEqual(estimate_similarity(same, minhash_signature(shingles(text))), 1.0)
+        self.assertLess(estimate_similarity(same, minhash_signature(shingles(article(2)))), 0.2)
+
+    def test_clusters(self):
+        base, other = article(1), article(2)
+        near = base + ' with a few extra words at the end'
+        paths = [self.write('a.md', base), self.write('b.md', other), self.write('c.md', near),
+                 self.write('d.md', base), self.write('e.md', other)]
+
+        clusters = find_duplicates_in_dir(self.base_dir)
+        self.assertEqual([cluster['files'] for cluster in clusters],
+                         [[paths[0], paths[2], paths[3]], [paths[1], paths[4]]])
+        self.assertTrue(all(cluster['similarity'] >= 0.8 for cluster in clusters), clusters)
+
+    def test_unrelated_files_do_not_cluster(self):
+        for index in range(5):
+            self.write(f'{index}.md', article(index))
+        self.assertEqual(find_duplicates_in_dir(self.base_dir), [])
+
+    def test_band_validation(self):
+        self.assertEqual(cluster_signatures([]), [])
+        with self.assertRaises(ValueError):
+            cluster_signatures([minhash_signature(shingles(article(1)), num_perm=8)], bands=16)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import asyncio
+import os
+import sys
+import tempfile
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.answer_cache import AnswerCache
+from scripts.llm_pipeline import LLMPipeline, MockBackend, parse_categories, run_vault_pipeline
+from scripts.organizer import organize_files, plan_organize, safe_category
+
+class TestLLMPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.base_dir = os.path.join(self.root, 'vault')
+        self.output_dir = os.path.join(self.root, 'summaries')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_notes(self):
+        paths = []
+        for name, heading in (('py.md', 'Python generators'), ('rs.md', 'Rust ownership'), ('py2.md', 'Python typing')):
+            path = os.path.join(self.root, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f"# {heading}\n\nNotes about {heading.lower()}.\n")
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def responder(prompt):
+        if 'Categor' in prompt:
+            return '"Programming/Rust, Systems"' if 'Rust' in prompt else 'Programming/Python'
+        return 'A short summary.'
+
+    def test_run_in_input_order_with_retries(self):
+        backend = MockBackend(lambda prompt: prompt.upper(), failure_rate=0.3, seed=3)
+        pipeline = LLMPipeline(backend, concurrency=2, max_retries=10, retry_delay=0)
+        prompts = [{'llm_prompt': f'p{index}'} for index in range(20)] + [{'error': 'unparsable'}]
+        results = asyncio.run(pipeline.run(prompts))
+        self.assertEqual([result.get('response') for result in results[:20]], [f'P{index}' for index in range(20)])
+        self.assertEqual(results[20], {'error': 'unparsable'})
+        self.assertGreater(pipeline.stats['retries'], 0)
+        self.assertEqual(pipeline.stats['completed'], 20)
+
+    def test_exhausted_retries_become_errors(self):
+        pipeline = LLMPipeline(MockBackend(failure_rate=1.0), max_retries=1, retry_delay=0)
+        result, = asyncio.run(pipeline.run([{'llm_prompt': 'p'}]))
+        self.assertIn('after 2 attempts', result['error'])
+        self.assertEqual(pipeline.stats['failed'], 1)
+
+    def test_process_vault(self):
+        paths = self.write_notes()
+        result = run_vault_pipeline(paths, MockBackend(self.responder), self.base_dir, output_dir=self.output_dir)
+
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(sorted(os.path.relpath(move['dst'], self.base_dir) for move in result['organized']['moved']),
+                         [os.path.join('Programming', 'Python', 'py.md'), os.path.join('Programming', 'Python', 'py2.md'),
+                          os.path.join('Programming', 'Rust', 'rs.md')])
+        self.assertEqual(sorted(result['summary_files']), ['Programming/Python', 'Programming/Rust'])
+        with open(result['summary_files']['Programming/Python']['summary_file_path'], encoding='utf-8') as f:
+            summary = f.read()
+        self.assertIn('Python typing', summary)
+        self.assertIn('A short summary.', summary)
+        self.assertEqual(result['stats']['completed'], 6)
+
+    def test_cached_answers_skip_the_backend(self):
+        cache_path = os.path.join(self.root, 'answers.sqlite')
+        paths = self.write_notes()
+        with AnswerCache(cache_path) as cache:
+            run_vault_pipeline(paths, MockBackend(self.responder), self.base_dir, cache=cache)
+        moved = [os.path.join(dirpath, name) for dirpath, _, names in os.walk(self.base_dir) for name in names]
+
+        backend = MockBackend(self.responder)
+        with AnswerCache(cache_path) as cache:
+            result = run_vault_pipeline(moved, backend, os.path.join(self.root, 'again'), cache=cache)
+        self.assertEqual(backend.calls, 0)
+        self.assertEqual(result['stats']['cached'], 6)
+        self.assertEqual(len(result['organized']['moved']), 3)
+
+class TestCategorySafety(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.base_dir = os.path.join(self.root, 'vault')
+        os.makedirs(self.base_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.root, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_safe_category(self):
+        self.assertEqual(safe_category(' ML / Deep Learning '), 'ML/Deep Learning')
+        self.assertEqual(safe_category('A\\B'), 'A/B')
+        for hostile in ('../../escaped', 'a/../../b', '/etc', '\\\\server\\share', 'C:\\Windows', 'C:x', 'a//b', '.', ''):
+            self.assertIsNone(safe_category(hostile), hostile)
+
+    def test_parse_categories_drops_unsafe(self):
+        self.assertEqual(parse_categories('"../../escaped, Python, /tmp"'), ['Python'])
+
+    def test_organizer_refuses_to_leave_base_dir(self):
+        path = self.write('a.md', '# A\n')
+        with self.assertRaises(ValueError):
+            organize_files(path, '../escaped', self.base_dir)
+        plan = plan_organize([(path, '../../escaped')], self.base_dir)
+        self.assertIsNone(plan[0]['dst'])
+        self.assertIn('outside', plan[0]['error'])
+        self.assertTrue(os.path.exists(path))
+
+    def test_hostile_backend_response(self):
+        path = self.write('note.md', '# Note\n\nSome text.\n')
+        backend = MockBackend(lambda prompt: '../../escaped' if 'Categor' in prompt else 'Summary.')
+        result = run_vault_pipeline([path], backend, self.base_dir)
+
+        self.assertEqual(result['organized']['moved'], [])
+        self.assertTrue(any('category' in error['error'] for error in result['errors']))
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(sorted(os.listdir(self.root)), ['note.md', 'vault'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.categorizer import categorize_content, categorize_parsed
+from scripts.local_classifier import KeywordClassifier, classify_parsed, get_classifier
+
+KEYWORDS = {
+    "Cooking": ["recipe", "oven", "bake", "flour"],
+    "Gardening": ["soil", "seed", "compost", "prune"],
+    "Astronomy": ["telescope", "galaxy", "orbit", "neutron star"],
+}
+
+class TestKeywordClassifier(unittest.TestCase):
+
+    def setUp(self):
+        self.classifier = KeywordClassifier(KEYWORDS)
+
+    def test_predicts_the_matching_category(self):
+        result = self.classifier.classify("Bake the bread: mix flour, follow the recipe, heat the oven.")
+        self.assertEqual(result["categories"][0][0], "Cooking")
+        self.assertEqual(len(result["categories"]), 1)
+        self.assertEqual(result["hits"], 4)
+
+    def test_multi_word_keywords_and_names(self):
+        ranked = self.classifier.classify("A neutron star seen through a telescope, unlike any garden soil.")["categories"]
+        self.assertEqual([name for name, _ in ranked], ["Astronomy", "Gardening"])
+        self.assertGreater(ranked[0][1], ranked[1][1])
+        self.assertEqual(self.classifier.classify("gardening")["categories"][0][0], "Gardening")
+
+    def test_confidence_grows_with_evidence(self):
+        weak = self.classifier.classify("seed")["categories"][0][1]
+        strong = self.classifier.classify("seed soil compost prune seed soil compost prune")["categories"][0][1]
+        self.assertLess(weak, strong)
+        self.assertLessEqual(strong, 1.0)
+
+    def test_no_evidence(self):
+        self.assertEqual(self.classifier.classify("Nothing relevant here."), {"categories": [], "hits": 0})
+
+    def test_classify_parsed_uses_title_and_headings(self):
+        parsed = {"title": "Compost", "headings": [{"text": "Soil"}], "plain_text": "and a telescope"}
+        result = classify_parsed(parsed, self.classifier)
+        self.assertEqual(result["categories"], ["Gardening"]) # Astronomy falls below the relative cutoff
+        self.assertEqual(result["confidence"], result["confidences"]["Gardening"])
+
+    def test_get_classifier_is_cached_and_restricted(self):
+        config = {"category_keywords": KEYWORDS}
+        self.assertIs(get_classifier(config), get_classifier(config))
+        restricted = get_classifier(config, ["Astronomy", "Poetry"])
+        self.assertEqual(restricted.categories, ["Astronomy", "Poetry"])
+        self.assertEqual(restricted.classify("poetry")["categories"][0][0], "Poetry")
+
+class TestLocalFastPath(unittest.TestCase):
+
+    def test_confident_articles_are_categorized_locally(self):
+        parsed = {"title": "Training a neural network",
+                  "headings": [{"text": "Backpropagation"}],
+                  "plain_text": "Deep learning: every layer of the neural network is updated by backpropagation. " * 3}
+        result = categorize_parsed(parsed, "nn.md")
+        self.assertEqual(result["source"], "local")
+        self.assertEqual(result["categories"][0], "Deep Learning")
+        self.assertNotIn("llm_prompt", result)
+
+    def test_low_confidence_falls_back_to_the_llm(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "misc.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("# Thoughts\n\nA quiet afternoon.\n")
+            result = categorize_content(path)
+        self.assertEqual(result["source"], "llm")
+        self.assertIn("Article Title: Thoughts", result["llm_prompt"])
+        self.assertEqual(result["confidences"], {})
+
+    def test_threshold_forces_fallback(self):
+        parsed = {"title": "Pandas", "headings": [], "plain_text": "A dataframe with pandas."}
+        self.assertEqual(categorize_parsed(parsed, "p.md", confidence_threshold=1.01)["source"], "llm")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import os
+import sys
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.markdown_parser import parse_markdown_content
+
+DOCUMENT = """# Title
+
+Intro with **bold**, a [link](https://example.com) and `code`.
+
+Setext Heading
+--------------
+
+Line one
+line two
+
+```python
+print("hi")
+```
+
+### Deep *heading*
+"""
+
+class TestParseMarkdown(unittest.TestCase):
+
+    def parse(self, content, file_path='notes/example.md'):
+        return parse_markdown_content(content, file_path, use_cache=False)
+
+    def test_headings(self):
+        headings = self.parse(DOCUMENT)['headings']
+        self.assertEqual([(h['level'], h['text'], h['line']) for h in headings],
+                         [(1, 'Title', 1), (2, 'Setext Heading', 5), (3, 'Deep *heading*', 15)])
+
+    def test_heading_offsets_point_into_plain_text(self):
+        parsed = self.parse(DOCUMENT)
+        for heading in parsed['headings'][:2]:
+            self.assertTrue(parsed['plain_text'].startswith(heading['text'], heading['offset']), heading)
+
+    def test_plain_text_uses_inline_text(self):
+        plain_text = self.parse(DOCUMENT)['plain_text']
+        self.assertIn('Intro with bold, a link and code.', plain_text)
+        self.assertIn('Line one line two', plain_text)
+        self.assertIn('```\nprint("hi")\n\n```', plain_text)
+        self.assertNotIn('https://example.com', plain_text)
+        self.assertNotIn('**', plain_text)
+
+    def test_title_fallback_and_hash(self):
+        parsed = self.parse('No heading here.\n')
+        self.assertEqual(parsed['title'], 'example')
+        self.assertEqual(parsed['headings'], [])
+        self.assertEqual(parsed['content_hash'], self.parse('No heading here.\n', 'other.md')['content_hash'])
+        self.assertEqual(self.parse(DOCUMENT)['title'], 'Title')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.metadata_store import MetadataStore, normalize_category, parent_categories
+
+class TestMetadataStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.store_path = os.path.join(self.root, 'metadata.sqlite')
+        self.store = MetadataStore(self.store_path)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def test_normalize_category(self):
+        self.assertEqual(normalize_category(' ML / Deep Learning/ '), 'ML/Deep Learning')
+        self.assertEqual(parent_categories('a/b/c'), ['a', 'a/b'])
+
+    def test_round_trip_survives_reopening(self):
+        self.store.upsert_article(self.path('a.md'), 'ML/ Vision', 'A', 'About A', 'hash-a')
+        self.store.close()
+        self.store = MetadataStore(self.store_path)
+        article = self.store.get_article(self.path('a.md'))
+        self.assertEqual({key: article[key] for key in ('path', 'title', 'category', 'summary', 'content_hash')},
+                         {'path': self.path('a.md'), 'title': 'A', 'category': 'ML/Vision',
+                          'summary': 'About A', 'content_hash': 'hash-a'})
+
+    def test_summary_is_dropped_when_content_changes(self):
+        path = self.path('a.md')
+        self.store.upsert_article(path, 'ML', 'A', 'About A', 'v1')
+        self.store.upsert_article(path, 'ML', 'A renamed', None, 'v1')
+        self.assertEqual(self.store.get_article(path)['summary'], 'About A')
+        self.store.upsert_article(path, 'ML', 'A', None, 'v2') # The stored summary is now stale
+        self.assertIsNone(self.store.get_article(path)['summary'])
+        self.assertTrue(self.store.set_summary(path, 'New summary'))
+        self.assertFalse(self.store.set_summary(self.path('missing.md'), 'x'))
+
+    def test_moves_and_unknown_files(self):
+        self.store.upsert_article(self.path('a.md'), 'Inbox', 'A', 'About A', 'h')
+        new_file = self.path('b.md')
+        with open(new_file, 'w', encoding='utf-8') as f:
+            f.write('# Bee\n\nText.\n')
+        self.store.move_articles([(self.path('a.md'), self.path('ML/a.md'), 'ML'),
+                                  (self.path('inbox/b.md'), new_file, 'Bio')])
+        self.assertIsNone(self.store.get_article(self.path('a.md')))
+        moved = self.store.get_article(self.path('ML/a.md'))
+        self.assertEqual((moved['category'], moved['summary']), ('ML', 'About A'))
+        self.assertEqual(self.store.get_article(new_file)['title'], 'Bee')
+        # A None category keeps the current one (rollback)
+        self.store.move_articles([(self.path('ML/a.md'), self.path('a.md'), None)])
+        self.assertEqual(self.store.get_article(self.path('a.md'))['category'], 'ML')
+
+    def test_listings_and_stats(self):
+        for name, category, summary in (('a', 'ML', 's'), ('b', 'ML/Vision', None), ('c', 'ML/Vision', 's'),
+                                        ('d', 'MLOps', None)):
+            self.store.upsert_article(self.path(f'{name}.md'), category, name.upper(), summary)
+        self.assertEqual([a['title'] for a in self.store.list_articles('ML')], ['A', 'B', 'C'])
+        self.assertEqual([a['title'] for a in self.store.list_articles('ML', recursive=False)], ['A'])
+
+        stats = self.store.category_stats()
+        self.assertEqual(list(stats), ['ML', 'ML/Vision', 'MLOps'])
+        self.assertEqual((stats['ML']['articles'], stats['ML']['total_articles'], stats['ML']['total_summarized']),
+                         (1, 3, 2))
+        tree = self.store.category_tree()
+        self.assertEqual([node['name'] for node in tree], ['ML', 'MLOps'])
+        self.assertEqual([child['category'] for child in tree[0]['children']], ['ML/Vision'])
+
+        grouped = self.store.articles_by_category(recursive=True)
+        self.assertEqual([item['title'] for item in grouped['ML']], ['A', 'B', 'C'])
+        self.assertEqual(grouped['ML/Vision'][0]['summary'], '')
+
+if __name__ == '__main__':
+    unittest.main()
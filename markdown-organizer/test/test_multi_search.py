@@ -0,0 +1,71 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.multi_search import AhoCorasick, fold_case, scan_file, search_terms
+
+class TestMultiSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.base_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_overlapping_patterns(self):
+        automaton = AhoCorasick([b'he', b'she', b'hers'])
+        matches, _ = automaton.scan(b'ushers')
+        self.assertEqual(sorted(matches), [(0, 2), (1, 1), (2, 2)])
+
+    def test_counts_and_offsets(self):
+        path = self.write('notes/a.md', 'Python and python.\nRust, not PYTHON.\n')
+        self.write('b.md', 'Nothing to see.\n')
+        results = search_terms(['python', 'Rust', 'go lang'], self.base_dir)
+
+        self.assertEqual(list(results), [path])
+        self.assertEqual(results[path]['python'], {'count': 3, 'offsets': [0, 11, 29]})
+        self.assertEqual(results[path]['Rust'], {'count': 1, 'offsets': [19]})
+        self.assertNotIn('go lang', results[path])
+
+    def test_matches_span_windows(self):
+        path = self.write('a.md', 'xxxxxxxpattern')
+        self.assertEqual(scan_file((b'pattern',), path, window_bytes=4), {b'pattern': [7]})
+
+    def test_non_ascii_case_folding(self):
+        path = self.write('a.md', 'Über alles, über, ÜBER.')
+        results = search_terms(['Über', 'über'], self.base_dir)
+        offsets = [0, len('Über alles, '.encode('utf-8')), len('Über alles, über, '.encode('utf-8'))]
+        self.assertEqual(results[path]['Über'], {'count': 3, 'offsets': offsets})
+        self.assertEqual(results[path]['über'], results[path]['Über'])
+
+    def test_mixed_case_non_ascii(self):
+        path = self.write('a.md', 'Ωμέγα: über, üBeR und ÜBER. Σοφία, ΣΟΦΊΑ.')
+        results = search_terms(['ÜbEr', 'σοφία'], self.base_dir)
+        start = len('Ωμέγα: '.encode('utf-8'))
+        self.assertEqual(results[path]['ÜbEr']['offsets'],
+                         [start, start + len('über, '.encode('utf-8')), start + len('über, üBeR und '.encode('utf-8'))])
+        self.assertEqual(results[path]['σοφία']['count'], 2)
+        # Multi-byte characters split across windows are still folded and matched.
+        self.assertEqual(scan_file((fold_case('über'),), path, window_bytes=1)[fold_case('über')],
+                         results[path]['ÜbEr']['offsets'])
+
+    def test_workers(self):
+        for index in range(6):
+            self.write(f'{index}.md', f'term {index}\n')
+        self.assertEqual(search_terms(['term'], self.base_dir, workers=2, chunk_size=2),
+                         search_terms(['term'], self.base_dir))
+
+if __name__ == '__main__':
+    unittest.main()
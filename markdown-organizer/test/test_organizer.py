@@ -0,0 +1,183 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts import organizer
+from scripts.organizer import (organize_files, organize_files_bulk, plan_organize, resume_organize,
+                               rollback_organize)
+
+class TestOrganizer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.inbox = os.path.join(self.root, 'inbox')
+        self.base_dir = os.path.join(self.root, 'vault')
+        self.journal_path = os.path.join(self.root, 'moves.journal')
+        os.makedirs(self.inbox)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, path, content='x'):
+        path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def read(self, path):
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def test_organize_files_renames_on_collision(self):
+        self.write('vault/Python/a.md', 'existing')
+        moved = organize_files(self.write('inbox/a.md', 'new'), 'Python', self.base_dir)
+        self.assertEqual(moved, os.path.join(self.base_dir, 'Python', 'a (1).md'))
+        self.assertEqual(self.read(moved), 'new')
+
+    def test_plan_resolves_collisions_in_memory(self):
+        self.write('vault/Python/a.md')
+        first, second = self.write('inbox/a.md'), self.write('inbox/sub/a.md')
+        plan = plan_organize([(first, 'Python'), (second, 'Python'), ('missing.md', 'Python')], self.base_dir)
+        self.assertEqual([os.path.basename(move['dst']) for move in plan[:2]], ['a (1).md', 'a (2).md'])
+        self.assertIn('error', plan[2])
+        self.assertTrue(os.path.exists(first))
+
+    def test_bulk_and_rollback(self):
+        sources = [self.write(f'inbox/{name}.md', name) for name in ('a', 'b', 'c')]
+        result = organize_files_bulk(zip(sources, ['Python', 'Rust', 'Python/Async']), self.base_dir,
+                                     journal_path=self.journal_path)
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(self.read(os.path.join(self.base_dir, 'Python', 'Async', 'c.md')), 'c')
+        self.assertFalse(any(os.path.exists(source) for source in sources))
+
+        restored = rollback_organize(self.journal_path)
+        self.assertEqual(len(restored['restored']), 3)
+        self.assertEqual([self.read(source) for source in sources], ['a', 'b', 'c'])
+        self.assertEqual(rollback_organize(self.journal_path)['restored'], [])
+
+    def test_journal_uses_absolute_paths(self):
+        source = self.write('inbox/a.md')
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        try:
+            organize_files_bulk([(os.path.join('inbox', 'a.md'), 'Python')], 'vault', journal_path=self.journal_path)
+        finally:
+            os.chdir(cwd)
+        with open(self.journal_path, encoding='utf-8') as f:
+            plan = json.loads(f.readline())
+        self.assertEqual(plan['base_dir'], os.path.abspath(self.base_dir))
+        self.assertEqual(os.path.realpath(plan['moves'][0]['src']), os.path.realpath(source))
+        self.assertEqual(len(rollback_organize(self.journal_path)['restored']), 1)
+        self.assertTrue(os.path.exists(source))
+
+    def test_resume_after_interruption(self):
+        sources = [self.write(f'inbox/{name}.md', name) for name in ('a', 'b', 'c')]
+        real_move = organizer._move
+        calls = []
+
+        def failing_move(src, dst):
+            calls.append(src)
+            if len(calls) == 2:
+                raise KeyboardInterrupt # Simulated crash in the middle of the run
+            real_move(src, dst)
+
+        with mock.patch.object(organizer, '_move', failing_move):
+            with self.assertRaises(KeyboardInterrupt):
+                organize_files_bulk(zip(sources, ['Python'] * 3), self.base_dir, journal_path=self.journal_path)
+
+        # The unfinished journal is not overwritten by a new run
+        with self.assertRaises(FileExistsError):
+            organize_files_bulk([(sources[1], 'Rust')], self.base_dir, journal_path=self.journal_path)
+        # A file that appeared at a planned destination in the meantime is kept
+        self.write('vault/Python/b.md', 'intruder')
+
+        result = resume_organize(self.journal_path)
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(sorted(os.listdir(os.path.join(self.base_dir, 'Python'))), ['a.md', 'b (1).md', 'b.md', 'c.md'])
+        self.assertEqual(self.read(os.path.join(self.base_dir, 'Python', 'b.md')), 'intruder')
+        self.assertEqual(resume_organize(self.journal_path)['moved'], [])
+
+        rollback_organize(self.journal_path)
+        self.assertEqual([self.read(source) for source in sources], ['a', 'b', 'c'])
+        self.assertEqual(self.read(os.path.join(self.base_dir, 'Python', 'b.md')), 'intruder')
+
+    def test_rename_without_done_record_is_resumed_from_the_journal(self):
+        sources = [self.write(f'inbox/{name}.md', name) for name in ('a', 'b')]
+        real_move = organizer._move
+
+        def crash_after_rename(src, dst):
+            real_move(src, dst)
+            if src == sources[0]:
+                raise KeyboardInterrupt # Renamed, but the 'done' record was never written
+
+        with mock.patch.object(organizer, '_move', crash_after_rename):
+            with self.assertRaises(KeyboardInterrupt):
+                organize_files_bulk(zip(sources, ['Python'] * 2), self.base_dir, journal_path=self.journal_path)
+        with open(self.journal_path, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f][1:]
+        self.assertEqual(records, [{'type': 'moving', 'index': 0,
+                                    'dst': os.path.join(self.base_dir, 'Python', 'a.md')}])
+
+        result = resume_organize(self.journal_path)
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(len(result['moved']), 2)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.base_dir, 'Python'))), ['a.md', 'b.md'])
+        self.assertEqual(len(rollback_organize(self.journal_path)['restored']), 2)
+        self.assertEqual([self.read(source) for source in sources], ['a', 'b'])
+
+    def test_unjournaled_destination_is_not_trusted(self):
+        sources = [self.write(f'inbox/{name}.md', name) for name in ('a', 'b')]
+
+        def crash(src, dst):
+            raise KeyboardInterrupt
+
+        with mock.patch.object(organizer, '_move', crash):
+            with self.assertRaises(KeyboardInterrupt):
+                organize_files_bulk(zip(sources, ['Python'] * 2), self.base_dir, journal_path=self.journal_path)
+        # 'b.md' shows up at its planned destination and leaves the inbox by other means
+        os.rename(sources[1], self.write('elsewhere/b.md'))
+        self.write('vault/Python/b.md', 'not ours')
+
+        result = resume_organize(self.journal_path)
+        self.assertEqual([move['src'] for move in result['moved']], [sources[0]])
+        self.assertEqual(len(result['errors']), 1)
+        rollback_organize(self.journal_path)
+        self.assertEqual(self.read(os.path.join(self.base_dir, 'Python', 'b.md')), 'not ours')
+        self.assertTrue(os.path.exists(sources[0]))
+
+    def test_partly_rolled_back_journal_is_not_overwritten(self):
+        sources = [self.write(f'inbox/{name}.md', name) for name in ('a', 'b')]
+        organize_files_bulk(zip(sources, ['Python'] * 2), self.base_dir, journal_path=self.journal_path)
+        self.write('inbox/a.md', 'occupied') # Blocks restoring 'a.md'
+        self.assertEqual(len(rollback_organize(self.journal_path)['errors']), 1)
+
+        with self.assertRaises(FileExistsError):
+            organize_files_bulk([(self.write('inbox/c.md'), 'Rust')], self.base_dir, journal_path=self.journal_path)
+
+        os.remove(sources[0])
+        self.assertEqual(len(rollback_organize(self.journal_path)['restored']), 1)
+        result = organize_files_bulk([(self.write('inbox/c.md'), 'Rust')], self.base_dir,
+                                     journal_path=self.journal_path)
+        self.assertEqual(len(result['moved']), 1)
+
+    def test_rollback_of_relative_files_in_cwd(self):
+        cwd = os.getcwd()
+        os.chdir(self.inbox)
+        try:
+            self.write('inbox/a.md', 'a')
+            organize_files_bulk([('a.md', 'Python')], self.base_dir, journal_path=self.journal_path)
+            self.assertEqual(rollback_organize(self.journal_path)['errors'], [])
+            self.assertTrue(os.path.exists('a.md'))
+        finally:
+            os.chdir(cwd)
+
+if __name__ == '__main__':
+    unittest.main()
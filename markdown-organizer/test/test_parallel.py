@@ -0,0 +1,41 @@
+import unittest
+import os
+import sys
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.parallel import parallel_map, resolve_workers
+
+def square(value):
+    return value * value
+
+def fail_on_three(value):
+    if value == 3:
+        raise ValueError("three")
+    return value
+
+class TestParallelMap(unittest.TestCase):
+
+    def test_resolve_workers(self):
+        self.assertEqual(resolve_workers(None), os.cpu_count() or 1)
+        self.assertEqual(resolve_workers(0), 1)
+        self.assertEqual(resolve_workers(4), 4)
+
+    def test_order_is_kept(self):
+        items = list(range(50))
+        self.assertEqual(list(parallel_map(square, items)), [value * value for value in items])
+        self.assertEqual(list(parallel_map(square, iter(items), workers=3, chunk_size=4)),
+                         [value * value for value in items])
+
+    def test_errors_propagate(self):
+        for workers in (1, 2):
+            with self.assertRaises(ValueError):
+                list(parallel_map(fail_on_three, range(10), workers=workers, chunk_size=2))
+
+    def test_serial_mode_is_lazy(self):
+        results = parallel_map(fail_on_three, range(10))
+        self.assertEqual([next(results), next(results), next(results)], [0, 1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
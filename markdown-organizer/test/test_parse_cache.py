@@ -0,0 +1,93 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts import markdown_parser, parse_cache
+from scripts.markdown_parser import configure_parse_cache, parse_markdown_content
+from scripts.parse_cache import ParseCache
+
+def entry(text, headings=()):
+    return {"plain_text": text, "headings": [{"level": 1, "text": h, "line": 1, "offset": 0} for h in headings]}
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.disk_dir = os.path.join(self.tmp.name, 'cache')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lru_order(self):
+        cache = ParseCache(max_entries=2)
+        cache.put('a', entry('a'))
+        cache.put('b', entry('b'))
+        cache.get('a') # 'b' is now the least recently used
+        cache.put('c', entry('c'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+    def test_memory_byte_bound(self):
+        cache = ParseCache(max_entries=100, memory_max_bytes=1000)
+        for key in 'abc':
+            cache.put(key, entry('x' * 400))
+        self.assertEqual(list(cache._memory), ['b', 'c'])
+        self.assertEqual(cache._memory_bytes, 800)
+        cache.put('huge', entry('x' * 2000)) # Larger than the whole budget: not kept
+        self.assertIsNone(cache.get('huge'))
+        self.assertEqual(list(cache._memory), ['b', 'c'])
+        cache.put('b', entry('x' * 100)) # Replacing an entry updates the byte count
+        self.assertEqual(cache._memory_bytes, 500)
+
+    def test_disk_tier(self):
+        cache = ParseCache(max_entries=1, disk_dir=self.disk_dir)
+        cache.put('a', entry('alpha', ['Heading']))
+        cache.put('b', entry('bravo'))
+        self.assertEqual(cache.get('a'), entry('alpha', ['Heading'])) # From disk, after memory evicted it
+        self.assertEqual(ParseCache(disk_dir=self.disk_dir).get('b'), entry('bravo'))
+
+    def test_disk_eviction(self):
+        cache = ParseCache(max_entries=1, disk_dir=self.disk_dir, disk_max_bytes=1000)
+        for index, key in enumerate('abcd'):
+            cache.put(key, entry(key * 300))
+            os.utime(cache._disk_path(key), ns=(index * 10**9, index * 10**9))
+        self.assertLessEqual(cache._disk_bytes, 900)
+        self.assertEqual(sorted(name.split('-')[1][0] for name in os.listdir(self.disk_dir)), ['c', 'd'])
+
+    def test_parser_version_invalidates_disk_entries(self):
+        ParseCache(disk_dir=self.disk_dir).put('a', entry('alpha'))
+        original = parse_cache.PARSER_VERSION
+        parse_cache.PARSER_VERSION = original + '-next'
+        try:
+            self.assertIsNone(ParseCache(disk_dir=self.disk_dir).get('a'))
+        finally:
+            parse_cache.PARSER_VERSION = original
+
+    def test_clear(self):
+        cache = ParseCache(disk_dir=self.disk_dir)
+        cache.put('a', entry('alpha'))
+        cache.clear()
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(os.listdir(self.disk_dir), [])
+
+    def test_results_do_not_share_cached_objects(self):
+        previous = markdown_parser.get_parse_cache()
+        configure_parse_cache()
+        try:
+            content = '# Title\n\nBody.\n'
+            first = parse_markdown_content(content, 'a.md')
+            first['headings'][0]['text'] = 'MUTATED'
+            first['headings'].append({'text': 'extra'})
+            second = parse_markdown_content(content, 'a.md')
+            self.assertEqual(second['headings'], [{'level': 1, 'text': 'Title', 'line': 1, 'offset': 0}])
+            self.assertEqual(second['title'], 'Title')
+        finally:
+            markdown_parser._parse_cache = previous
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts import prompt_batch
+from scripts.categorizer import categorize_content_llm_prompts
+from scripts.code_generator import generate_code_llm_prompts
+from scripts.prompt_batch import build_llm_prompts
+from scripts.summarizer import summarize_content_llm_prompts
+
+class TestPromptBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name in ('quicksort', 'heaps'):
+            path = os.path.join(self.tmp.name, f'{name}.md')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f'# {name.title()}\n\nHow {name} works.\n')
+            self.paths.append(path)
+        self.missing = os.path.join(self.tmp.name, 'missing.md')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_one_prompt_per_task_and_file(self):
+        prompts = list(build_llm_prompts(self.paths, categories_list=['Algorithms', 'Data Structures']))
+        self.assertEqual([(os.path.basename(p['file_path']), p['task']) for p in prompts],
+                         [('quicksort.md', 'categorize'), ('quicksort.md', 'summarize'), ('quicksort.md', 'generate_code'),
+                          ('heaps.md', 'categorize'), ('heaps.md', 'summarize'), ('heaps.md', 'generate_code')])
+        self.assertIn('Suggested Categories: Algorithms, Data Structures', prompts[0]['llm_prompt'])
+        self.assertIn('Article Title: Quicksort', prompts[1]['llm_prompt'])
+        self.assertIn('The code should be in Python', prompts[2]['llm_prompt'])
+        self.assertTrue(all(p['content_hash'] == prompts[0]['content_hash'] for p in prompts[:3]))
+
+    def test_each_file_is_parsed_once(self):
+        with mock.patch.object(prompt_batch, 'parse_markdown_many', wraps=prompt_batch.parse_markdown_many) as parse:
+            prompts = list(build_llm_prompts(self.paths, tasks=('categorize', 'summarize')))
+        parse.assert_called_once()
+        self.assertEqual(len(prompts), 4)
+
+    def test_matches_single_task_builders(self):
+        prompts = list(build_llm_prompts(self.paths, categories_list=['A'], language='Rust'))
+        by_task = {task: [p['llm_prompt'] for p in prompts if p['task'] == task] for task in prompt_batch.PROMPT_TASKS}
+        self.assertEqual(by_task['categorize'], [p['llm_prompt'] for p in categorize_content_llm_prompts(self.paths, ['A'])])
+        self.assertEqual(by_task['summarize'], [p['llm_prompt'] for p in summarize_content_llm_prompts(self.paths)])
+        self.assertEqual(by_task['generate_code'],
+                         [p['llm_prompt'] for p in generate_code_llm_prompts(self.paths, language='Rust')])
+
+    def test_errors_and_validation(self):
+        prompts = list(build_llm_prompts([self.missing, self.paths[0]], tasks=('summarize',)))
+        self.assertEqual(prompts[0]['task'], None)
+        self.assertIn('error', prompts[0])
+        self.assertEqual(prompts[1]['task'], 'summarize')
+        with self.assertRaises(ValueError):
+            list(build_llm_prompts(self.paths, tasks=('translate',)))
+
+if __name__ == '__main__':
+    unittest.main()
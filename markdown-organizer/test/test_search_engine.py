@@ -0,0 +1,50 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.search_engine import _file_contains, search_articles
+
+class TestWindowedScan(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, rel_path, content):
+        path = os.path.join(self.base_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_match_across_window_boundaries(self):
+        path = self.write('a.md', 'x' * 10 + 'Borrow Checker' + 'y' * 10)
+        # Every window size splits the needle at a different offset, down to one character.
+        for window_chars in range(1, 30):
+            with self.subTest(window_chars=window_chars):
+                self.assertTrue(_file_contains('borrow checker', path, window_chars))
+                self.assertFalse(_file_contains('borrow checkers', path, window_chars))
+
+    def test_match_at_the_edges_and_empty_query(self):
+        path = self.write('a.md', 'Start middle End')
+        self.assertTrue(_file_contains('start', path, 4))
+        self.assertTrue(_file_contains('END', path, 4))
+        self.assertTrue(_file_contains('', path, 4))
+        self.assertFalse(_file_contains('x', self.write('empty.md', ''), 4))
+
+    def test_scan_matches_substrings(self):
+        rust = self.write('rust.md', 'A Python developer may find the borrow checker strict.\n')
+        self.write('lang/python.md', 'A generator expression is lazy.\n')
+        self.assertEqual(search_articles('BORROW CHECKER', self.base_dir), [rust])
+        self.assertEqual(search_articles('check', self.base_dir), [rust])
+        self.assertEqual(search_articles('ownership', self.base_dir), [])
+
+if __name__ == '__main__':
+    unittest.main()
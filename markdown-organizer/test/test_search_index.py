@@ -0,0 +1,101 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.search_engine import rank_articles, search_articles, search_sections
+from scripts.search_index import SearchIndex
+
+PYTHON_MD = """# Python Tips
+
+Intro about the language.
+
+## Generators
+
+A generator expression is lazy.
+Use a generator expression for large data.
+
+## Testing
+
+Write tests with unittest.
+"""
+
+RUST_MD = """# Rust Notes
+
+Ownership and borrowing. A Python developer may find the borrow checker strict.
+"""
+
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = os.path.join(self.tmp.name, 'vault')
+        os.makedirs(os.path.join(self.base_dir, 'lang'))
+        self.index_path = os.path.join(self.tmp.name, 'index.sqlite')
+        self.write('lang/python.md', PYTHON_MD)
+        self.write('rust.md', RUST_MD)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, rel_path, content):
+        path = os.path.join(self.base_dir, rel_path)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_update_is_incremental(self):
+        with SearchIndex(self.index_path) as index:
+            self.assertFalse(index.is_built)
+            self.assertEqual(index.update(self.base_dir), {'added': 2, 'updated': 0, 'removed': 0, 'unchanged': 0})
+            self.assertTrue(index.is_built)
+            self.assertEqual(index.update(self.base_dir)['unchanged'], 2)
+
+            time.sleep(0.01)
+            self.write('rust.md', '# Rust Notes\n\nLifetimes.\n')
+            os.remove(os.path.join(self.base_dir, 'lang', 'python.md'))
+            self.write('go.md', '# Go\n\nGoroutines.\n')
+            self.assertEqual(index.update(self.base_dir), {'added': 1, 'updated': 1, 'removed': 1, 'unchanged': 0})
+            self.assertEqual(index.lookup('lifetimes'), ['rust.md'])
+            self.assertEqual(index.lookup('ownership'), [])
+            self.assertEqual(index.lookup('generator'), [])
+
+    def test_lookup_terms_and_phrases(self):
+        with SearchIndex(self.index_path) as index:
+            index.update(self.base_dir)
+            self.assertEqual(index.lookup('python'), [os.path.join('lang', 'python.md'), 'rust.md'])
+            self.assertEqual(index.lookup('generator expression'), [os.path.join('lang', 'python.md')])
+            self.assertEqual(index.lookup('expression generator'), [])
+
+    def test_rank_prefers_title_hits(self):
+        hits = rank_articles('python', self.base_dir, self.index_path)
+        self.assertEqual([os.path.relpath(hit['path'], self.base_dir) for hit in hits],
+                         [os.path.join('lang', 'python.md'), 'rust.md'])
+        self.assertGreater(hits[0]['score'], hits[1]['score'])
+        self.assertEqual(rank_articles('python', self.base_dir, self.index_path, top_k=1)[0], hits[0])
+
+    def test_sections(self):
+        hits = search_sections('generator expression', self.base_dir, self.index_path)
+        self.assertEqual(len(hits), 1)
+        hit = hits[0]
+        self.assertEqual(hit['path'], os.path.join(self.base_dir, 'lang', 'python.md'))
+        self.assertEqual(hit['heading_path'], ['Python Tips', 'Generators'])
+        self.assertEqual(hit['line'], 7)
+        self.assertEqual(hit['matches'], 2)
+        self.assertIn('generator expression is lazy', hit['snippet'])
+
+    def test_unbuilt_index_is_built_on_first_use(self):
+        self.assertEqual(search_articles('borrowing', self.base_dir, index_path=self.index_path),
+                         [os.path.join(self.base_dir, 'rust.md')])
+        # A fresh file is only seen after a refresh
+        self.write('new.md', '# New\n\nborrowing again\n')
+        self.assertEqual(len(search_articles('borrowing', self.base_dir, index_path=self.index_path)), 1)
+        self.assertEqual(len(search_articles('borrowing', self.base_dir, index_path=self.index_path,
+                                             refresh_index=True)), 2)
+
+if __name__ == '__main__':
+    unittest.main()
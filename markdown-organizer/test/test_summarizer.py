@@ -0,0 +1,38 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.summarizer import generate_summary_files
+
+def articles(category):
+    return ({"title": f"{category} {i}", "path": f"{category}/{i}.md", "summary": f"About {i}."} for i in range(2))
+
+class TestGenerateSummaryFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_colliding_file_names(self):
+        results = generate_summary_files({"A_B": articles("A_B"), "A/B": articles("A/B")}, output_dir=self.output_dir)
+        paths = {category: result["summary_file_path"] for category, result in results.items()}
+        self.assertEqual({category: os.path.basename(path) for category, path in paths.items()},
+                         {"A/B": "A_B_summary.md", "A_B": "A_B_2_summary.md"})
+        with open(paths["A_B"], encoding='utf-8') as f:
+            self.assertIn("A_B 1", f.read())
+
+    def test_generators_with_workers(self):
+        categories = {name: articles(name) for name in ("Python", "Rust", "Go")}
+        results = generate_summary_files(categories, output_dir=self.output_dir, workers=2)
+        self.assertTrue(all("summary_file_path" in result for result in results.values()), results)
+        self.assertEqual(sorted(os.listdir(self.output_dir)), ["Go_summary.md", "Python_summary.md", "Rust_summary.md"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add the skill directory to the Python path so the scripts package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts import watcher
+from scripts.search_index import SearchIndex
+from scripts.watcher import VaultWatcher
+
+class TestVaultWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = os.path.join(self.tmp.name, 'vault')
+        os.makedirs(self.base_dir)
+        self.index_path = os.path.join(self.tmp.name, 'index.db')
+        self.write('a.md', '# A\n\nalpha\n')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        with open(os.path.join(self.base_dir, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def test_polling_detects_changes(self):
+        vault = VaultWatcher(self.base_dir, index_path=self.index_path, use_polling=True)
+        self.assertEqual(vault.start()['added'], 1)
+        self.write('b.md', '# B\n\nbravo\n')
+        os.remove(os.path.join(self.base_dir, 'a.md'))
+
+        changes = vault.poll_once()
+        self.assertEqual(changes, {'added': ['b.md'], 'changed': [], 'removed': ['a.md']})
+        self.assertEqual(vault.work_queue.get_nowait(), os.path.join(self.base_dir, 'b.md'))
+        with SearchIndex(self.index_path) as index:
+            self.assertEqual(index.lookup('bravo'), ['b.md'])
+            self.assertEqual(index.lookup('alpha'), [])
+
+    def test_file_written_during_initial_sync_is_not_lost(self):
+        write = self.write
+
+        class SlowIndex(SearchIndex):
+            def update(self, base_dir, *args, **kwargs):
+                stats = super().update(base_dir, *args, **kwargs)
+                write('late.md', '# Late\n\nlate arrival\n')
+                return stats
+
+        vault = VaultWatcher(self.base_dir, index_path=self.index_path, use_polling=True)
+        with mock.patch.object(watcher, 'SearchIndex', SlowIndex):
+            vault.start()
+        self.assertEqual(vault.poll_once()['added'], ['late.md'])
+        with SearchIndex(self.index_path) as index:
+            self.assertEqual(index.lookup('arrival'), ['late.md'])
+
+if __name__ == '__main__':
+    unittest.main()
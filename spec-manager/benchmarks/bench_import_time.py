@@ -0,0 +1,84 @@
+# spec-manager/benchmarks/bench_import_time.py
+"""
+Measures the cold-start cost of the spec-manager dispatcher and of each step's module.
+
+    python benchmarks/bench_import_time.py --repeats 5 --check
+
+Every measurement runs in a fresh interpreter. For the dispatcher (`main`) and each
+module in `main.COMMAND_MAP` the report gives the median import time and the heavy
+dependencies (requests, jinja2, jsonschema, yaml) the import pulled in; `list_projects`
+is also timed end to end as the agent runs it. With --check the script exits non-zero
+when importing `main` loads a heavy dependency or takes longer than --max-main-ms.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from main import COMMAND_MAP
+
+HEAVY_MODULES = ("requests", "jinja2", "jsonschema", "yaml")
+
+_PROBE = """
+import sys, time, json
+sys.path.insert(0, {scripts_dir!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": sorted(m for m in {heavy!r} if m in sys.modules)}}))
+"""
+
+
+def measure_import(module, repeats):
+    timings, heavy = [], []
+    for _ in range(repeats):
+        code = _PROBE.format(scripts_dir=SCRIPTS_DIR, module=module, heavy=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["seconds"])
+        heavy = result["heavy"]
+    return {"median_ms": round(statistics.median(timings) * 1000, 3), "heavy_modules": heavy}
+
+
+def measure_command(args, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(SCRIPTS_DIR, "main.py")] + args,
+                       capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    return {"median_ms": round(statistics.median(timings) * 1000, 3)}
+
+
+def run(repeats=5):
+    modules = sorted({module for module, _ in COMMAND_MAP.values()})
+    with tempfile.TemporaryDirectory() as base_directory:
+        list_projects = measure_command(
+            ["list_projects", "--kwargs", json.dumps({"base_directory": base_directory})], repeats)
+    return {
+        "benchmark": "import_time",
+        "python": sys.version.split()[0],
+        "main": measure_import("main", repeats),
+        "modules": {module: measure_import(module, repeats) for module in modules},
+        "list_projects_process": list_projects,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark spec-manager import and startup time.")
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh interpreters per measurement; the median is reported.")
+    parser.add_argument("--check", action="store_true", help="Fail if the dispatcher regresses.")
+    parser.add_argument("--max-main-ms", type=float, default=50.0, help="Largest acceptable median import time of main.")
+    args = parser.parse_args()
+
+    report = run(args.repeats)
+    print(json.dumps(report, indent=2))
+    if args.check and (report["main"]["heavy_modules"] or report["main"]["median_ms"] > args.max_main_ms):
+        sys.exit(1)
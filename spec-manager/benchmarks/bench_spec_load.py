@@ -0,0 +1,96 @@
+# spec-manager/benchmarks/bench_spec_load.py
+"""
+Measures how long it takes to load a large YAML spec.
+
+    python benchmarks/bench_spec_load.py --paths 2000 --repeats 3
+
+The script generates a synthetic OpenAPI document with --paths paths that all reference
+shared component schemas. It reports the median time for three loaders: PyYAML's
+pure-Python `SafeLoader`, the libyaml `CSafeLoader` that `utils.yaml_safe_load` uses
+when available, and `spec_document.load_spec_document` reading a warm on-disk snapshot.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import yaml
+
+from spec_document import clear_document_cache, load_spec_document
+
+
+def synthetic_spec(paths):
+    spec = {
+        "openapi": "3.0.3",
+        "info": {"title": "Synthetic API", "version": "1.0.0"},
+        "paths": {},
+        "components": {"schemas": {}},
+    }
+    for i in range(paths):
+        schema = f"Item{i % 50}"
+        spec["paths"][f"/items{i}/{{id}}"] = {
+            method: {
+                "summary": f"{method} item {i}",
+                "operationId": f"{method}Item{i}",
+                "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "string"}}],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": {"$ref": f"#/components/schemas/{schema}"}}},
+                    }
+                },
+            }
+            for method in ("get", "put", "delete")
+        }
+    for i in range(50):
+        spec["components"]["schemas"][f"Item{i}"] = {
+            "type": "object",
+            "properties": {f"field{j}": {"type": "string", "description": f"Field {j}"} for j in range(20)},
+        }
+    return yaml.safe_dump(spec, sort_keys=False)
+
+
+def median_ms(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return round(statistics.median(timings) * 1000, 3)
+
+
+def run(paths=2000, repeats=3):
+    content = synthetic_spec(paths)
+    report = {
+        "benchmark": "spec_load",
+        "python": sys.version.split()[0],
+        "spec_bytes": len(content.encode("utf-8")),
+        "libyaml": hasattr(yaml, "CSafeLoader"),
+        "pure_python_ms": median_ms(lambda: yaml.load(content, Loader=yaml.SafeLoader), repeats),
+    }
+    if report["libyaml"]:
+        report["libyaml_ms"] = median_ms(lambda: yaml.load(content, Loader=yaml.CSafeLoader), repeats)
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        load_spec_document(content, snapshot_dir=snapshot_dir)
+
+        def load_snapshot():
+            clear_document_cache() # Every repeat behaves like a new process with a warm snapshot
+            load_spec_document(content, snapshot_dir=snapshot_dir)
+
+        report["snapshot_ms"] = median_ms(load_snapshot, repeats)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark loading a large YAML spec.")
+    parser.add_argument("--paths", type=int, default=2000, help="Number of paths in the synthetic spec.")
+    parser.add_argument("--repeats", type=int, default=3, help="Loads per measurement; the median is reported.")
+    args = parser.parse_args()
+    print(json.dumps(run(args.paths, args.repeats), indent=2))
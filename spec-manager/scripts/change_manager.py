@@ -1,7 +1,7 @@
 # spec-manager/scripts/change_manager.py
 import os
 import json
-import yaml
+from utils import yaml_safe_load
 
 def create_change_proposal(proposed_changes_description, original_spec_content=None, output_dir=None):
     """
@@ -54,6 +54,8 @@ def archive_change_proposal(change_id, base_dir):
     Merges approved specification changes from a proposal into the main specification and archives the change files.
     This is a simplified implementation. A real-world scenario would involve complex merging logic.
     """
+    import yaml # Deferred: only archiving reads and writes YAML specs
+
     error = None
     success = False
     updated_main_spec_path = None
@@ -71,13 +73,13 @@ def archive_change_proposal(change_id, base_dir):
         main_spec_data = {}
         if os.path.exists(main_spec_path):
             with open(main_spec_path, 'r', encoding='utf-8') as f:
-                main_spec_data = yaml.safe_load(f)
+                main_spec_data = yaml_safe_load(f)
 
         # Load delta spec (simplified: just replace/add based on delta)
         delta_spec_data = {}
         if os.path.exists(delta_spec_path):
             with open(delta_spec_path, 'r', encoding='utf-8') as f:
-                delta_spec_data = yaml.safe_load(f)
+                delta_spec_data = yaml_safe_load(f)
             
             # Simple merge logic: for full implementation, use proper spec merging library
             # This example just shows a conceptual merge
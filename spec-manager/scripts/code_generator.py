@@ -1,7 +1,6 @@
 # spec-manager/scripts/code_generator.py
 import os
-from jinja2 import Environment, FileSystemLoader
-import json # For parsing spec content if it's JSON
+from spec_parser import parse_spec
 
 def generate_code_from_spec(spec_content, target_language, code_type="client", output_dir=None):
     """
@@ -11,14 +10,9 @@ def generate_code_from_spec(spec_content, target_language, code_type="client", o
         output_dir = os.path.join(os.getcwd(), "generated_code") # Default output to current working directory/generated_code
     os.makedirs(output_dir, exist_ok=True)
 
-    # In a real scenario, this would involve a proper spec parser to extract details
-    # For now, we'll assume a basic structure from the spec_parser.py
-    parsed_spec = {}
-    try:
-        parsed_spec = json.loads(spec_content) # Assuming JSON for simplicity in example
-    except json.JSONDecodeError:
-        # Fallback if not JSON, but proper parsing would be needed
-        pass
+    # parse_spec accepts raw JSON/YAML text or a SpecDocument loaded by an earlier step and
+    # resolves $refs, so templates see the actual parameter, body and response objects.
+    parsed_spec = parse_spec(spec_content).get('parsed_data', {})
 
     api_name = parsed_spec.get('info', {}).get('title', 'Your API')
     
@@ -29,6 +23,8 @@ def generate_code_from_spec(spec_content, target_language, code_type="client", o
     template_file = f"{target_language}/{code_type}.j2"
     
     try:
+        from jinja2 import Environment, FileSystemLoader # Deferred: only needed when rendering
+
         env = Environment(loader=FileSystemLoader(templates_path))
         # Add a custom filter to trim leading/trailing slashes and make valid Python identifiers
         env.filters['trim_leading_slash'] = lambda s: s.lstrip('/')
@@ -39,7 +35,7 @@ def generate_code_from_spec(spec_content, target_language, code_type="client", o
     # Render the template with spec data
     rendered_code = template.render(
         api_name=api_name,
-        endpoints=parsed_spec.get('paths', {}), # Pass the paths object directly
+        endpoints=parsed_spec.get('endpoints', {}),
         # You would pass more parsed data here as needed by the template
     )
 
@@ -1,7 +1,6 @@
 # spec-manager/scripts/doc_generator.py
 import os
-from jinja2 import Environment, FileSystemLoader
-import json # For parsing spec content if it's JSON
+from spec_parser import parse_spec
 
 def generate_docs_from_spec(spec_content, doc_format="Markdown", output_dir=None):
     """
@@ -11,14 +10,9 @@ def generate_docs_from_spec(spec_content, doc_format="Markdown", output_dir=None
         output_dir = os.path.join(os.getcwd(), "generated_docs") # Default output to current working directory/generated_docs
     os.makedirs(output_dir, exist_ok=True)
 
-    # In a real scenario, this would involve a proper spec parser to extract details
-    # For now, we'll assume a basic structure from the spec_parser.py
-    parsed_spec = {}
-    try:
-        parsed_spec = json.loads(spec_content) # Assuming JSON for simplicity in example
-    except json.JSONDecodeError:
-        # Fallback if not JSON, but proper parsing would be needed
-        pass
+    # parse_spec accepts raw JSON/YAML text or a SpecDocument loaded by an earlier step and
+    # resolves $refs, so templates see the actual parameter, body and response objects.
+    parsed_spec = parse_spec(spec_content).get('parsed_data', {})
 
     api_name = parsed_spec.get('info', {}).get('title', 'API Documentation')
     description = parsed_spec.get('info', {}).get('description', '')
@@ -28,6 +22,8 @@ def generate_docs_from_spec(spec_content, doc_format="Markdown", output_dir=None
     template_file = f"{doc_format.lower()}.j2"
 
     try:
+        from jinja2 import Environment, FileSystemLoader # Deferred: only needed when rendering
+
         env = Environment(loader=FileSystemLoader(templates_path))
         template = env.get_template(template_file)
     except Exception as e:
@@ -37,7 +33,7 @@ def generate_docs_from_spec(spec_content, doc_format="Markdown", output_dir=None
     rendered_docs = template.render(
         api_name=api_name,
         description=description,
-        endpoints=parsed_spec.get('paths', {}),
+        endpoints=parsed_spec.get('endpoints', {}),
         # You would pass more parsed data here as needed by the template
     )
 
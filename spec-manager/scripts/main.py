@@ -1,21 +1,39 @@
 import argparse
+import importlib
 import json
 import os
 import sys
 
-# Import functions from other scripts
-from project_initializer import init_spec_project, define_principles
-from spec_planner import generate_plan, breakdown_tasks
-from implementer import implement_change
-from spec_fetcher import fetch_spec
-from spec_parser import parse_spec
-from spec_validator import validate_spec
-from code_generator import generate_code_from_spec
-from doc_generator import generate_docs_from_spec
-from spec_comparer import compare_specs
-from spec_proposal_manager import create_change_proposal, archive_change_proposal
-from clarifier import clarify_requirements
-from project_finder import list_projects # New import for project discovery # New import for clarification
+# Step -> (module, function). Modules are imported only when their step runs, so a
+# call such as `list_projects` never loads requests, jinja2, jsonschema or yaml.
+COMMAND_MAP = {
+    "init": ("project_initializer", "init_spec_project"),
+    "define_principles": ("project_initializer", "define_principles"),
+    "proposal": ("spec_proposal_manager", "create_change_proposal"),
+    "plan": ("spec_planner", "generate_plan"),
+    "tasks": ("spec_planner", "breakdown_tasks"),
+    "implement": ("implementer", "implement_change"),
+    "archive": ("spec_proposal_manager", "archive_change_proposal"),
+    "fetch": ("spec_fetcher", "fetch_spec"),
+    "parse": ("spec_parser", "parse_spec"),
+    "validate": ("spec_validator", "validate_spec"),
+    "generate_code": ("code_generator", "generate_code_from_spec"),
+    "generate_docs": ("doc_generator", "generate_docs_from_spec"),
+    "compare": ("spec_comparer", "compare_specs"),
+    "clarify": ("clarifier", "clarify_requirements"),
+    "list_projects": ("project_finder", "list_projects"),
+}
+
+
+def resolve_command(step):
+    """
+    Returns the function implementing `step`, importing its module on first use, or None.
+    """
+    target = COMMAND_MAP.get(step)
+    if target is None:
+        return None
+    module_name, function_name = target
+    return getattr(importlib.import_module(module_name), function_name)
 
 
 def handle_result(result):
@@ -39,29 +57,20 @@ def run(step, **kwargs):
     """
     print(f"Dispatcher running step: {step} with args: {kwargs}", file=sys.stderr) # Print to stderr for debugging
 
-    COMMAND_MAP = {
-        "init": init_spec_project,
-        "define_principles": define_principles,
-        "proposal": create_change_proposal,
-        "plan": generate_plan,
-        "tasks": breakdown_tasks,
-        "implement": implement_change,
-        "archive": archive_change_proposal,
-        "fetch": fetch_spec,
-        "parse": parse_spec,
-        "validate": validate_spec,
-        "generate_code": generate_code_from_spec,
-        "generate_docs": generate_docs_from_spec,
-        "compare": compare_specs,
-        "clarify": clarify_requirements,
-        "list_projects": list_projects, # New list_projects step
-    }
-
-    command_func = COMMAND_MAP.get(step)
+    try:
+        command_func = resolve_command(step)
+    except ImportError as e:
+        return {"success": False, "message": f"Failed to load step '{step}': {str(e)}"}
 
     if not command_func:
         return {"success": False, "message": f"Unknown step: {step}"}
 
+    # Lazy ref views resolve on access and may be cyclic, so they cannot be printed as JSON
+    if step == "parse" and kwargs.get("ref_mode") == "lazy":
+        return {"success": False,
+                "message": "ref_mode 'lazy' is only available to in-process callers of parse_spec; "
+                           "use 'eager' or 'none' from the dispatcher."}
+
     # Default project_root to current working directory for 'init' step if not provided
     if step == "init" and "project_root" not in kwargs:
         kwargs["project_root"] = os.getcwd()
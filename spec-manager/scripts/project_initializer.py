@@ -1,7 +1,6 @@
 import os
 import argparse
 import json
-import yaml # Added for YAML handling
 
 def init_spec_project(project_root, git_enabled=False): # Added git_enabled parameter
     """
@@ -21,6 +20,7 @@ def init_spec_project(project_root, git_enabled=False): # Added git_enabled para
 
         # Create config.yaml and save git_enabled status
         config_path = os.path.join(openspec_dir, 'config.yaml')
+        import yaml # Deferred: only init writes YAML
         with open(config_path, 'w') as f:
             yaml.dump({'git_integration': {'enabled': git_enabled}}, f)
 
@@ -0,0 +1,241 @@
+# spec-manager/scripts/ref_resolver.py
+import os
+from collections.abc import Mapping, Sequence
+from urllib.parse import unquote
+from spec_document import SpecLoadError, load_spec_document
+
+# Reference chains (a $ref whose target is another $ref) longer than this are treated as cycles.
+MAX_REF_CHAIN = 64
+
+
+class RefResolver:
+    """
+    Resolves JSON References (`{"$ref": ...}`) in a decoded spec.
+
+    Local refs ('#/components/schemas/User') and relative-file refs
+    ('schemas/user.yaml#/User', relative to the referring file, or to `base_dir` for the
+    root document) are supported. Each target is resolved once and the result is shared
+    by every ref to it, so heavily reused components are neither copied nor re-resolved.
+    Subtrees without refs are returned as is, and the input is never modified.
+
+    `resolve` dereferences eagerly. Cycles are cut where `scan` finds them: walking the
+    document in order, a ref pointing back at a node still being walked (a cyclic schema)
+    is left as the original `{"$ref": ...}` dict, so the result stays finite and
+    JSON-serializable, and the same refs are kept whichever node is resolved first.
+    `lazy` instead returns read-only views that resolve refs as they are accessed. Refs
+    that cannot be resolved (missing file or pointer, remote URLs) are left in place and
+    listed in `unresolved`.
+    """
+
+    def __init__(self, document, base_dir=None):
+        self.document = document
+        self.base_dir = os.path.abspath(base_dir or os.getcwd())
+        self.unresolved = []
+        self._documents = {None: document}
+        self._targets = {}
+        self._walked = {}
+        self._cyclic_refs = set()
+        self._resolved = {}
+        self._views = {}
+
+    def _document(self, file_key):
+        if file_key not in self._documents:
+            with open(file_key, 'r', encoding='utf-8') as f:
+                self._documents[file_key] = load_spec_document(f.read()).data
+        return self._documents[file_key]
+
+    def _target(self, ref, current_file):
+        """
+        Returns ((file, pointer), target) for a ref, or None if it cannot be resolved.
+        """
+        key = (ref, current_file)
+        if key not in self._targets:
+            self._targets[key] = self._find_target(ref, current_file)
+        return self._targets[key]
+
+    def _find_target(self, ref, current_file):
+        file_part, _, pointer = ref.partition('#')
+        if file_part:
+            if '://' in file_part:
+                self.unresolved.append(ref)
+                return None
+            base = os.path.dirname(current_file) if current_file else self.base_dir
+            current_file = os.path.normpath(os.path.join(base, unquote(file_part)))
+        try:
+            node = self._document(current_file)
+            for token in pointer.split('/')[1:]:
+                token = unquote(token).replace('~1', '/').replace('~0', '~')
+                node = node[token] if isinstance(node, Mapping) else node[int(token)]
+        except (OSError, SpecLoadError, KeyError, IndexError, ValueError, TypeError):
+            self.unresolved.append(ref)
+            return None
+        return (current_file, pointer), node
+
+    def scan(self):
+        """
+        Walks everything reachable from the document once, following refs depth-first in
+        document order, and records the refs that close a cycle. Afterwards `unresolved`
+        lists every unresolvable ref in the document. `resolve` runs it automatically.
+        """
+        self._walk(self.document, None)
+        return self.unresolved
+
+    def _walk(self, node, current_file):
+        if not isinstance(node, (dict, list)) or id(node) in self._walked:
+            return
+        # A placeholder marks the node as being walked until all of its children are done;
+        # the raw node is kept alive with it so its id cannot be reused by another object.
+        self._walked[id(node)] = (node, False)
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            for key, value in node.items():
+                if key != '$ref' or not isinstance(ref, str):
+                    self._walk(value, current_file)
+            found = self._target(ref, current_file) if isinstance(ref, str) else None
+            if found is not None:
+                (target_file, _), target = found
+                walked = self._walked.get(id(target))
+                if walked is not None and not walked[1]:
+                    self._cyclic_refs.add(id(node)) # Points back at a node still being walked
+                else:
+                    self._walk(target, target_file)
+        else:
+            for item in node:
+                self._walk(item, current_file)
+        self._walked[id(node)] = (node, True)
+
+    def resolve(self, node=None, current_file=None):
+        """
+        Returns `node` (by default the whole document) with every resolvable ref replaced
+        by its shared, resolved target.
+        """
+        node = self.document if node is None else node
+        self.scan()
+        self._walk(node, current_file)
+        return self._resolve_node(node, current_file)
+
+    def _resolve_node(self, node, current_file):
+        if not isinstance(node, (dict, list)):
+            return node
+        # Memoized by the raw node, so a target reached through a $ref and through the
+        # tree itself (e.g. components/schemas/User) resolves to the same object.
+        memo = self._resolved.get(id(node))
+        if memo is not None:
+            return memo[1]
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str):
+                return self._resolve_ref(node, ref, current_file)
+            resolved = {key: self._resolve_node(value, current_file) for key, value in node.items()}
+            if all(resolved[key] is value for key, value in node.items()):
+                resolved = node
+        else:
+            resolved = [self._resolve_node(item, current_file) for item in node]
+            if all(new is old for new, old in zip(resolved, node)):
+                resolved = node
+        # The raw node is kept alive with its result so its id cannot be reused by another object.
+        self._resolved[id(node)] = (node, resolved)
+        return resolved
+
+    def _resolve_ref(self, node, ref, current_file):
+        found = self._target(ref, current_file)
+        if found is None or id(node) in self._cyclic_refs:
+            return node # Unresolvable, or closes a cycle: keep the reference
+        (target_file, _), target = found
+        return self._with_siblings(self._resolve_node(target, target_file), node, current_file)
+
+    def _with_siblings(self, resolved, node, current_file):
+        # OpenAPI 3.1 allows keys such as 'description' next to a $ref; they override the target's.
+        if len(node) == 1 or not isinstance(resolved, dict):
+            return resolved
+        siblings = {key: self._resolve_node(value, current_file) for key, value in node.items() if key != '$ref'}
+        return {**resolved, **siblings}
+
+    def lazy(self, node=None, current_file=None):
+        """
+        Returns a read-only view of `node` (by default the whole document) whose refs are
+        resolved when accessed. Views are cached, so a shared target is wrapped only once.
+        Until `scan` is called, `unresolved` only lists the refs accessed so far.
+        """
+        return self._view(self.document if node is None else node, current_file)
+
+    def _view(self, value, current_file):
+        if isinstance(value, dict) and isinstance(value.get('$ref'), str):
+            value, current_file = self._follow(value, current_file)
+            if isinstance(value, dict) and '$ref' in value:
+                return value # Unresolvable or cyclic
+        if not isinstance(value, (dict, list)):
+            return value
+        key = (id(value), current_file)
+        view = self._views.get(key)
+        if view is None:
+            view_class = LazyMapping if isinstance(value, dict) else LazySequence
+            view = self._views[key] = view_class(self, value, current_file)
+        return view
+
+    def _follow(self, node, current_file):
+        seen = set()
+        value = node
+        while isinstance(value, dict) and isinstance(value.get('$ref'), str):
+            found = self._target(value['$ref'], current_file)
+            if found is None or found[0] in seen or len(seen) >= MAX_REF_CHAIN:
+                return node, current_file
+            key, target = found
+            seen.add(key)
+            if len(value) > 1 and isinstance(target, dict):
+                target = {**target, **{k: v for k, v in value.items() if k != '$ref'}}
+            value, current_file = target, key[0]
+        return value, current_file
+
+
+class LazyMapping(Mapping):
+    """
+    Read-only mapping view used by `RefResolver.lazy`; refs are resolved on item access.
+    """
+
+    def __init__(self, resolver, node, current_file):
+        self._resolver = resolver
+        self._node = node
+        self._file = current_file
+
+    def __getitem__(self, key):
+        return self._resolver._view(self._node[key], self._file)
+
+    def __iter__(self):
+        return iter(self._node)
+
+    def __len__(self):
+        return len(self._node)
+
+    def __repr__(self):
+        return f"LazyMapping({list(self._node)!r})"
+
+
+class LazySequence(Sequence):
+    """
+    Read-only sequence view used by `RefResolver.lazy`; refs are resolved on item access.
+    """
+
+    def __init__(self, resolver, node, current_file):
+        self._resolver = resolver
+        self._node = node
+        self._file = current_file
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._resolver._view(item, self._file) for item in self._node[index]]
+        return self._resolver._view(self._node[index], self._file)
+
+    def __len__(self):
+        return len(self._node)
+
+    def __repr__(self):
+        return f"LazySequence(len={len(self._node)})"
+
+
+def resolve_refs(data, base_dir=None, lazy=False):
+    """
+    Shortcut for `RefResolver(data, base_dir).resolve()`, or `.lazy()` when `lazy` is true.
+    """
+    resolver = RefResolver(data, base_dir)
+    return resolver.lazy() if lazy else resolver.resolve()
@@ -1,22 +1,291 @@
 # spec-manager/scripts/spec_comparer.py
-import json
-import yaml
-from deepdiff import DeepDiff # Need to add deepdiff to requirements.txt
+import copy
+from spec_document import SpecLoadError, load_spec_document
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+# Top-level keys compared through the operation and component indexes instead of as plain subtrees.
+INDEXED_KEYS = ('paths', 'components', 'definitions', 'parameters', 'responses', 'securityDefinitions')
+
+# Swagger 2.0 keeps its reusable objects at the top level; OpenAPI 3 nests them under 'components'.
+SWAGGER_COMPONENT_KEYS = ('definitions', 'parameters', 'responses', 'securityDefinitions')
 
 def _load_spec_data(spec_content, spec_format=None):
-    if spec_format and spec_format.lower() in ['json', 'openapi', 'swagger']:
-        return json.loads(spec_content)
-    elif spec_format and spec_format.lower() in ['yaml', 'asyncapi']:
-        return yaml.safe_load(spec_content)
-    else: # Attempt to infer
-        try:
-            return json.loads(spec_content)
-        except json.JSONDecodeError:
-            return yaml.safe_load(spec_content)
+    return load_spec_document(spec_content, spec_format).data
+
+def _escape(token):
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+class _Fingerprints:
+    """
+    Order-sensitive structural hashes of subtrees, computed once per node, so identical
+    subtrees of the two specs are recognized without walking them.
+    """
+
+    def __init__(self):
+        self._memo = {}
+
+    def __call__(self, node):
+        if isinstance(node, dict):
+            key = id(node)
+            if key not in self._memo:
+                self._memo[key] = (node, hash(('d', frozenset((k, self(v)) for k, v in node.items()))))
+            return self._memo[key][1]
+        if isinstance(node, list):
+            key = id(node)
+            if key not in self._memo:
+                self._memo[key] = (node, hash(('l', tuple(self(item) for item in node))))
+            return self._memo[key][1]
+        return hash((type(node).__name__, node))
+
+class _Differ:
+    def __init__(self):
+        self.fingerprint = _Fingerprints()
+
+    def same(self, a, b):
+        # Equal fingerprints are confirmed structurally, so a hash collision cannot hide a change.
+        return a is b or (type(a) is type(b) and self.fingerprint(a) == self.fingerprint(b) and a == b)
+
+    def same_items(self, a, b):
+        """
+        True if two lists hold the same items, in any order.
+        """
+        if sorted(map(self.fingerprint, a)) != sorted(map(self.fingerprint, b)):
+            return False
+        candidates = {}
+        for item in b:
+            candidates.setdefault(self.fingerprint(item), []).append(item)
+        for item in a:
+            matches = candidates[self.fingerprint(item)]
+            index = next((i for i, other in enumerate(matches) if self.same(item, other)), None)
+            if index is None:
+                return False
+            del matches[index]
+        return True
+
+    def diff(self, a, b, pointer=''):
+        """
+        Returns the changes between two subtrees as [{'change', 'pointer', 'old', 'new'}].
+        Identical subtrees are skipped by fingerprint; lists that only differ in order are
+        treated as equal, and lists of different length are reported as a whole.
+        """
+        changes = []
+        self._diff(a, b, pointer, changes)
+        return changes
+
+    def _diff(self, a, b, pointer, changes):
+        if self.same(a, b):
+            return
+        if isinstance(a, dict) and isinstance(b, dict):
+            for key in a:
+                if key not in b:
+                    changes.append({"change": "removed", "pointer": f"{pointer}/{_escape(key)}", "old": a[key]})
+            for key, value in b.items():
+                if key not in a:
+                    changes.append({"change": "added", "pointer": f"{pointer}/{_escape(key)}", "new": value})
+                else:
+                    self._diff(a[key], value, f"{pointer}/{_escape(key)}", changes)
+        elif isinstance(a, list) and isinstance(b, list):
+            if self.same_items(a, b):
+                return # Same items in a different order
+            if len(a) == len(b):
+                for index, (item_a, item_b) in enumerate(zip(a, b)):
+                    self._diff(item_a, item_b, f"{pointer}/{index}", changes)
+            else:
+                changes.append({"change": "changed", "pointer": pointer, "old": a, "new": b})
+        else:
+            changes.append({"change": "changed", "pointer": pointer, "old": a, "new": b})
+
+    def diff_named(self, a, b, pointer=''):
+        """
+        Compares two {name: object} mappings and returns {'added', 'removed', 'changed'},
+        where 'changed' maps each name to its list of changes.
+        """
+        report = {"added": [], "removed": [], "changed": {}}
+        if self.same(a, b):
+            return report
+        report["removed"] = [name for name in a if name not in b]
+        for name, value in b.items():
+            if name not in a:
+                report["added"].append(name)
+            else:
+                changes = self.diff(a[name], value, f"{pointer}/{_escape(name)}")
+                if changes:
+                    report["changed"][name] = changes
+        return report
+
+def _operations(spec):
+    """
+    Indexes a spec's operations by (path, method).
+    """
+    operations = {}
+    paths = spec.get('paths')
+    for path, path_item in (paths.items() if isinstance(paths, dict) else ()):
+        if not isinstance(path_item, dict):
+            continue
+        for method, operation in path_item.items():
+            if method.lower() in HTTP_METHODS and isinstance(operation, dict):
+                operations[(path, method.lower())] = (path_item, operation)
+    return operations
+
+def _path_items(spec):
+    paths = spec.get('paths')
+    return {path: item for path, item in paths.items() if isinstance(item, dict)} if isinstance(paths, dict) else {}
+
+def _path_fields(path_item, with_parameters):
+    # Everything but the operations (summary, description, servers, a path-level $ref, ...).
+    # Path-level parameters are reported per operation when the path has operations.
+    return {key: value for key, value in path_item.items()
+            if key.lower() not in HTTP_METHODS and (with_parameters or key != 'parameters')}
+
+def _diff_paths(differ, old_paths, new_paths, old_operations, new_operations):
+    report = {"added": [], "removed": [], "changed": {}}
+    report["removed"] = [path for path in old_paths if path not in new_paths]
+    with_operations = {path for path, _ in old_operations} | {path for path, _ in new_operations}
+    for path, new_item in new_paths.items():
+        old_item = old_paths.get(path)
+        if old_item is None:
+            report["added"].append(path)
+        elif not differ.same(old_item, new_item):
+            with_parameters = path not in with_operations
+            changes = differ.diff(_path_fields(old_item, with_parameters), _path_fields(new_item, with_parameters),
+                                  f"/paths/{_escape(path)}")
+            if changes:
+                report["changed"][path] = changes
+    return report
+
+def _parameter_key(parameter):
+    if isinstance(parameter, dict) and '$ref' in parameter:
+        return f"$ref:{parameter['$ref']}"
+    if isinstance(parameter, dict):
+        return f"{parameter.get('name')}:{parameter.get('in')}"
+    return repr(parameter)
+
+def _parameters(path_item, operation):
+    # Path-level parameters apply to every operation unless the operation overrides them.
+    parameters = {}
+    for source in (path_item.get('parameters'), operation.get('parameters')):
+        for parameter in (source if isinstance(source, list) else ()):
+            parameters[_parameter_key(parameter)] = parameter
+    return parameters
+
+def _components(spec):
+    """
+    Returns {section: {name: object}} for the spec's reusable components.
+    """
+    if isinstance(spec.get('components'), dict):
+        return {section: objects for section, objects in spec['components'].items() if isinstance(objects, dict)}
+    return {section: spec[section] for section in SWAGGER_COMPONENT_KEYS if isinstance(spec.get(section), dict)}
+
+def _component_pointer(spec, section):
+    return f"/components/{_escape(section)}" if isinstance(spec.get('components'), dict) else f"/{_escape(section)}"
+
+def _diff_operation(differ, path, method, old, new):
+    (old_item, old_operation), (new_item, new_operation) = old, new
+    pointer = f"/paths/{_escape(path)}/{method}"
+    changed = {"path": path, "method": method}
+
+    parameters = differ.diff_named(_parameters(old_item, old_operation),
+                                   _parameters(new_item, new_operation), f"{pointer}/parameters")
+    if any(parameters.values()):
+        changed["parameters"] = parameters
+
+    request_body_key = 'requestBody'
+    if request_body_key in old_operation or request_body_key in new_operation:
+        request_body = differ.diff(old_operation.get(request_body_key), new_operation.get(request_body_key),
+                                   f"{pointer}/{request_body_key}")
+        if request_body:
+            changed["request_body"] = request_body
+
+    old_responses, new_responses = old_operation.get('responses'), new_operation.get('responses')
+    responses = differ.diff_named(old_responses if isinstance(old_responses, dict) else {},
+                                  new_responses if isinstance(new_responses, dict) else {}, f"{pointer}/responses")
+    if any(responses.values()):
+        changed["responses"] = responses
+
+    handled = ('parameters', 'requestBody', 'responses')
+    other = differ.diff({k: v for k, v in old_operation.items() if k not in handled},
+                        {k: v for k, v in new_operation.items() if k not in handled}, pointer)
+    if other:
+        changed["other"] = other
+    return changed
+
+def diff_specs(spec_a, spec_b):
+    """
+    Structural diff of two decoded OpenAPI/Swagger specs.
+
+    Operations are matched by (path, method) and components by section and name, so only
+    matching nodes are compared. Subtrees with equal fingerprints are skipped, which
+    keeps the diff close to linear in the size of the specs. `$ref`s are compared as
+    written; a change to a referenced component is reported under 'components'.
+
+    Returns {'has_changes', 'summary', 'paths': {'added', 'removed', 'changed'},
+    'operations': {'added', 'removed', 'changed'},
+    'components': {section: {'added', 'removed', 'changed'}}, 'other': [changes]}.
+    'paths' lists added and removed path items (with or without operations) and, under
+    'changed', the changes to each path item's own fields (summary, description, servers,
+    a path-level $ref; path-level parameters only for paths without operations).
+    Operation entries carry 'path' and 'method'; changed operations also list their
+    'parameters' (keyed 'name:in'), 'request_body', 'responses' and 'other' changes.
+    Each change is {'change': 'added'|'removed'|'changed', 'pointer', 'old', 'new'},
+    with JSON pointers into the old spec for removals and into the new one otherwise
+    (parameters are addressed by 'name:in' rather than by list index).
+    """
+    differ = _Differ()
+
+    old_operations, new_operations = _operations(spec_a), _operations(spec_b)
+    operations = {"added": [], "removed": [], "changed": []}
+    for path, method in old_operations:
+        if (path, method) not in new_operations:
+            operations["removed"].append({"path": path, "method": method})
+    for (path, method), new in new_operations.items():
+        old = old_operations.get((path, method))
+        if old is None:
+            operations["added"].append({"path": path, "method": method})
+        elif not (differ.same(old[1], new[1]) and differ.same(old[0].get('parameters'), new[0].get('parameters'))):
+            changed = _diff_operation(differ, path, method, old, new)
+            if len(changed) > 2:
+                operations["changed"].append(changed)
+
+    paths = _diff_paths(differ, _path_items(spec_a), _path_items(spec_b), old_operations, new_operations)
+
+    old_components, new_components = _components(spec_a), _components(spec_b)
+    components = {}
+    for section in sorted(set(old_components) | set(new_components)):
+        report = differ.diff_named(old_components.get(section, {}), new_components.get(section, {}),
+                                   _component_pointer(spec_b, section))
+        if any(report.values()):
+            components[section] = report
+
+    other = differ.diff({k: v for k, v in spec_a.items() if k not in INDEXED_KEYS},
+                        {k: v for k, v in spec_b.items() if k not in INDEXED_KEYS})
+
+    schemas = components.get('schemas') or components.get('definitions') or {"added": [], "removed": [], "changed": {}}
+    summary = {
+        "paths_added": len(paths["added"]),
+        "paths_removed": len(paths["removed"]),
+        "paths_changed": len(paths["changed"]),
+        "operations_added": len(operations["added"]),
+        "operations_removed": len(operations["removed"]),
+        "operations_changed": len(operations["changed"]),
+        "schemas_added": len(schemas["added"]),
+        "schemas_removed": len(schemas["removed"]),
+        "schemas_changed": len(schemas["changed"]),
+    }
+    return {
+        "has_changes": bool(any(paths.values()) or any(operations.values()) or components or other),
+        "summary": summary,
+        "paths": paths,
+        "operations": operations,
+        "components": components,
+        "other": other,
+    }
 
 def compare_specs(spec_content_a, spec_content_b, spec_format=None):
     """
-    Compares two API specifications to identify differences.
+    Compares two API specifications to identify differences (see `diff_specs`).
+    Either argument may be raw text or a `SpecDocument`. The report is a deep copy, so
+    its 'old'/'new' values never alias the shared document cache.
     """
     error = None
     diff_report = None
@@ -24,22 +293,15 @@ def compare_specs(spec_content_a, spec_content_b, spec_format=None):
     try:
         spec_a = _load_spec_data(spec_content_a, spec_format)
         spec_b = _load_spec_data(spec_content_b, spec_format)
-        
-        diff = DeepDiff(spec_a, spec_b, ignore_order=True, verbose_level=2)
-        
-        diff_report = {
-            "has_changes": bool(diff),
-            "details": diff.to_json() # DeepDiff provides a comprehensive JSON output
-        }
-
-    except (json.JSONDecodeError, yaml.YAMLError) as e:
-        error = f"Failed to parse spec content for comparison: Invalid JSON or YAML: {e}"
+        if not isinstance(spec_a, dict) or not isinstance(spec_b, dict):
+            return {"error": "Both specs must be JSON or YAML objects."}
+        diff_report = copy.deepcopy(diff_specs(spec_a, spec_b))
+
+    except SpecLoadError as e:
+        error = f"Failed to parse spec content for comparison: {e}"
     except Exception as e:
         error = f"An unexpected error occurred during spec comparison: {e}"
-    
+
     if error:
         return {"error": error}
     return {"diff_report": diff_report}
-
-# Note: This script requires the 'deepdiff' library.
-# It should be added to the skill's requirements.txt
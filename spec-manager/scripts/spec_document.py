@@ -0,0 +1,176 @@
+# spec-manager/scripts/spec_document.py
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+from utils import yaml_safe_load
+
+# Number of decoded specs kept per process, keyed by content hash.
+DOCUMENT_CACHE_SIZE = 32
+
+# Formats that name an encoding; anything else ('openapi', 'swagger', 'asyncapi', None) is sniffed.
+ENCODING_FORMATS = ('json', 'yaml')
+
+# Directory for on-disk snapshots of decoded specs; the `snapshot_dir` argument overrides it.
+SNAPSHOT_DIR_ENV = "SPEC_MANAGER_SNAPSHOT_DIR"
+
+# Bump when the snapshot layout changes so stale files are ignored.
+SNAPSHOT_VERSION = "1"
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class SpecLoadError(ValueError):
+    """
+    Raised when spec content cannot be decoded as JSON or YAML.
+    """
+
+
+class SpecDocument:
+    """
+    A decoded API specification, shared by the parse, validate, compare and generate steps
+    so the raw text is decoded only once.
+
+    `data` is the decoded object and must be treated as read-only: the same instance is
+    returned for identical content. `encoding` is 'json' or 'yaml' and `spec_type` is
+    'openapi', 'swagger' or 'asyncapi' when the document declares it.
+    """
+
+    def __init__(self, data: Any, encoding: str, content_hash: Optional[str] = None):
+        self.data = data
+        self.encoding = encoding
+        self.content_hash = content_hash
+        self.spec_type = None
+        if isinstance(data, dict):
+            for spec_type in ('openapi', 'swagger', 'asyncapi'):
+                if spec_type in data:
+                    self.spec_type = spec_type
+                    break
+
+    def __repr__(self):
+        return f"SpecDocument(encoding={self.encoding!r}, spec_type={self.spec_type!r}, content_hash={self.content_hash!r})"
+
+
+def spec_content_hash(spec_content: str) -> str:
+    return hashlib.sha256(spec_content.encode('utf-8')).hexdigest()
+
+
+def sniff_encoding(spec_content: str) -> str:
+    """
+    Guesses the encoding from the first non-blank character: JSON documents start with
+    '{' or '['. Everything else is treated as YAML, avoiding a failed JSON parse.
+    """
+    stripped = spec_content.lstrip()
+    return 'json' if stripped[:1] in ('{', '[') else 'yaml'
+
+
+def _decode(spec_content: str, encoding: str) -> Any:
+    if encoding == 'json':
+        try:
+            return json.loads(spec_content)
+        except json.JSONDecodeError as e:
+            raise SpecLoadError(f"Invalid JSON or YAML: {e}") from e
+    import yaml # Deferred: JSON specs never load PyYAML
+    try:
+        return yaml_safe_load(spec_content)
+    except yaml.YAMLError as e:
+        raise SpecLoadError(f"Invalid JSON or YAML: {e}") from e
+
+
+def _snapshot_path(snapshot_dir: str, content_hash: str, forced: Optional[str]) -> str:
+    return os.path.join(snapshot_dir, f"{content_hash}-{forced or 'auto'}-v{SNAPSHOT_VERSION}.pickle")
+
+
+def _read_snapshot(path: str) -> Optional[SpecDocument]:
+    try:
+        with open(path, 'rb') as f:
+            encoding, data = pickle.load(f)
+    except Exception:
+        # Missing, truncated or written by another version: decode the source instead.
+        return None
+    return SpecDocument(data, encoding)
+
+
+def _write_snapshot(path: str, document: SpecDocument) -> None:
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((document.encoding, document.data), f, protocol=5)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Snapshots are only an optimization; a read-only or full disk must not fail the step.
+        pass
+
+
+def load_spec_document(spec, spec_format: Optional[str] = None, snapshot_dir: Optional[str] = None) -> SpecDocument:
+    """
+    Returns the `SpecDocument` for `spec`, which may be raw JSON/YAML text, an already
+    decoded object, or a `SpecDocument` (returned as is).
+
+    A `spec_format` of 'json' or 'yaml' forces that decoder; any other value sniffs the
+    encoding with `sniff_encoding`, falling back to YAML (a superset of JSON) if a
+    sniffed JSON document does not decode. Decoded text is cached by content hash, so
+    later steps given the same text reuse the result. Raises `SpecLoadError`.
+
+    With a `snapshot_dir` (or the SPEC_MANAGER_SNAPSHOT_DIR environment variable) decoded
+    documents are also written there as pickle (protocol 5) files named by content hash,
+    so a later process loads an unchanged spec without decoding it. Snapshots are read
+    with `pickle`, so the directory must only be writable by trusted users.
+    """
+    if isinstance(spec, SpecDocument):
+        return spec
+    if not isinstance(spec, str):
+        return SpecDocument(spec, 'object')
+
+    forced = spec_format.lower() if spec_format and spec_format.lower() in ENCODING_FORMATS else None
+    key = (spec_content_hash(spec), forced)
+    with _cache_lock:
+        document = _cache.get(key)
+        if document is not None:
+            _cache.move_to_end(key)
+            return document
+
+    snapshot_dir = snapshot_dir or os.environ.get(SNAPSHOT_DIR_ENV)
+    snapshot_path = _snapshot_path(snapshot_dir, key[0], forced) if snapshot_dir else None
+    document = _read_snapshot(snapshot_path) if snapshot_path else None
+    if document is not None:
+        document.content_hash = key[0]
+        return _remember(key, document)
+
+    encoding = forced or sniff_encoding(spec)
+    try:
+        data = _decode(spec, encoding)
+    except SpecLoadError:
+        if forced or encoding == 'yaml':
+            raise
+        encoding = 'yaml'
+        data = _decode(spec, encoding)
+
+    document = SpecDocument(data, encoding, key[0])
+    if snapshot_path:
+        _write_snapshot(snapshot_path, document)
+    return _remember(key, document)
+
+
+def _remember(key, document: SpecDocument) -> SpecDocument:
+    with _cache_lock:
+        _cache[key] = document
+        if len(_cache) > DOCUMENT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return document
+
+
+def clear_document_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
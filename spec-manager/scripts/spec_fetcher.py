@@ -1,8 +1,6 @@
 # spec-manager/scripts/spec_fetcher.py
-import requests
 import os
-import yaml
-import json
+from spec_document import SpecLoadError, load_spec_document
 
 def fetch_spec(source_path, spec_format=None):
     """
@@ -13,14 +11,17 @@ def fetch_spec(source_path, spec_format=None):
 
     try:
         if source_path.startswith('http://') or source_path.startswith('https://'):
-            response = requests.get(source_path)
-            response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-            spec_content = response.text
+            import requests # Deferred: only remote fetches need it
+
+            try:
+                response = requests.get(source_path)
+                response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+                spec_content = response.text
+            except requests.exceptions.RequestException as e:
+                error = f"Failed to fetch remote spec from {source_path}: {e}"
         else:
             with open(source_path, 'r', encoding='utf-8') as f:
                 spec_content = f.read()
-    except requests.exceptions.RequestException as e:
-        error = f"Failed to fetch remote spec from {source_path}: {e}"
     except FileNotFoundError:
         error = f"Local spec file not found at {source_path}"
     except Exception as e:
@@ -29,17 +30,14 @@ def fetch_spec(source_path, spec_format=None):
     if error:
         return {"error": error}
 
-    # Attempt to infer format if not provided
+    # Attempt to infer format if not provided. Loading the document here also warms the
+    # shared cache, so the validate/parse/generate steps do not decode the content again.
     if spec_format is None and spec_content:
         try:
-            json.loads(spec_content)
-            spec_format = "OpenAPI" # Assuming JSON is often OpenAPI
-        except json.JSONDecodeError:
-            try:
-                yaml.safe_load(spec_content)
-                spec_format = "OpenAPI" # Assuming YAML is often OpenAPI
-            except yaml.YAMLError:
-                # Could be other formats, or invalid
-                pass
+            document = load_spec_document(spec_content)
+            spec_format = {"swagger": "Swagger", "asyncapi": "AsyncAPI"}.get(document.spec_type, "OpenAPI")
+        except SpecLoadError:
+            # Could be other formats, or invalid
+            pass
 
     return {"spec_content": spec_content, "spec_format": spec_format}
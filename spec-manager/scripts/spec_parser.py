@@ -1,26 +1,40 @@
 # spec-manager/scripts/spec_parser.py
-import json
-import yaml
+import copy
 from typing import Dict, Any, Optional
+from ref_resolver import RefResolver
+from spec_document import SpecLoadError, load_spec_document
 
-def parse_spec(spec_content: str, spec_format: Optional[str] = None) -> Dict[str, Any]:
+REF_MODES = ('eager', 'lazy', 'none')
+
+def parse_spec(spec_content, spec_format: Optional[str] = None, ref_mode: str = 'eager',
+               base_dir: Optional[str] = None) -> Dict[str, Any]:
     """
     Parses the given API specification content and extracts key information.
     Currently, this is a basic parser for OpenAPI/Swagger-like structures.
+    `spec_content` may be raw text or a `SpecDocument` (see `spec_document.load_spec_document`).
+
+    `$ref`s are resolved with `ref_resolver.RefResolver` according to `ref_mode`: 'eager'
+    (cyclic refs stay as `$ref`; the result is JSON-serializable), 'lazy' (read-only views
+    resolved on access, for in-process callers) or 'none'. Relative-file refs in the root
+    document are resolved against `base_dir` (default: the current directory). Refs that
+    could not be resolved are listed under 'unresolved_refs'.
+
+    Decoded documents are cached and shared per process, so in 'eager' and 'none' mode the
+    result is a deep copy that callers may modify freely.
     """
     parsed_data = {}
     error = None
 
     try:
-        if spec_format and spec_format.lower() in ['json', 'openapi', 'swagger']:
-            data = json.loads(spec_content)
-        elif spec_format and spec_format.lower() in ['yaml', 'asyncapi']:
-            data = yaml.safe_load(spec_content)
-        else: # Attempt to infer
-            try:
-                data = json.loads(spec_content)
-            except json.JSONDecodeError:
-                data = yaml.safe_load(spec_content)
+        if ref_mode not in REF_MODES:
+            return {"error": f"Unknown ref_mode '{ref_mode}'; expected one of {', '.join(REF_MODES)}"}
+        data = load_spec_document(spec_content, spec_format).data
+        resolver = RefResolver(data, base_dir)
+        if ref_mode == 'eager':
+            data = resolver.resolve()
+        elif ref_mode == 'lazy':
+            resolver.scan() # Only so 'unresolved_refs' is complete; views still resolve on access
+            data = resolver.lazy()
         
         # Basic extraction for OpenAPI/Swagger
         parsed_data['info'] = data.get('info', {})
@@ -45,9 +59,12 @@ def parse_spec(spec_content: str, spec_format: Optional[str] = None) -> Dict[str
         parsed_data['endpoints'] = endpoints
         
         parsed_data['components'] = data.get('components', {})
+        parsed_data['unresolved_refs'] = sorted(set(resolver.unresolved))
+        if ref_mode != 'lazy':
+            parsed_data = copy.deepcopy(parsed_data) # Detach from the shared document cache
 
-    except (json.JSONDecodeError, yaml.YAMLError) as e:
-        error = f"Failed to parse spec content: Invalid JSON or YAML: {e}"
+    except SpecLoadError as e:
+        error = f"Failed to parse spec content: {e}"
     except Exception as e:
         error = f"An unexpected error occurred during spec parsing: {e}"
     
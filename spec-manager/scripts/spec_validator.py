@@ -1,78 +1,151 @@
 # spec-manager/scripts/spec_validator.py
 import json
-import yaml
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from spec_document import SpecLoadError, load_spec_document
 
-# Placeholder for a proper schema loader
-# In a real implementation, you'd load the OpenAPI schema from resources
-def load_openapi_schema():
-    # For now, a very basic placeholder
-    # Later: load from spec-manager/resources/schemas/openapi_v3.json
-    return {
-        "type": "object",
-        "properties": {
-            "openapi": {"type": "string", "pattern": "^3\\.0\\.[0-9]+$"},
-            "info": {"type": "object", "required": ["title", "version"]},
-            "paths": {"type": "object"}
-        },
-        "required": ["openapi", "info", "paths"]
-    }
+SCHEMAS_DIR = os.path.join(os.path.dirname(__file__), '..', 'resources', 'schemas')
+
+# Official OpenAPI Initiative schemas shipped in resources/schemas, by specification version.
+SCHEMA_FILES = {
+    "2.0": "swagger_v2.json",
+    "3.0": "openapi_v3.json",
+    "3.1": "openapi_v3_1.json",
+}
+
+def spec_version(spec_data):
+    """
+    Returns the key into `SCHEMA_FILES` for a decoded spec ('2.0', '3.0', '3.1'), the
+    declared version if no schema is shipped for it, or None if it declares none.
+    """
+    if "openapi" in spec_data:
+        declared = str(spec_data["openapi"])
+        return next((version for version in ("3.0", "3.1") if declared.startswith(version + ".")), declared)
+    if "swagger" in spec_data:
+        return str(spec_data["swagger"])
+    return None
+
+@lru_cache(maxsize=None)
+def load_openapi_schema(version="3.0"):
+    """
+    Loads the JSON Schema for the given specification version from resources/schemas.
+    """
+    with open(os.path.join(SCHEMAS_DIR, SCHEMA_FILES[version]), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+@lru_cache(maxsize=None)
+def get_schema_validator(version="3.0"):
+    """
+    Returns the compiled jsonschema validator for a specification version. Validators are
+    built once per process, so validating many specs only pays for the schema once.
+    """
+    from jsonschema.validators import validator_for # Deferred: only validation needs it
+
+    schema = load_openapi_schema(version)
+    return validator_for(schema)(schema)
+
+def _json_pointer(path):
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in path)
+
+def _string_keys(node):
+    """
+    Returns `node` with every mapping key converted to a string. YAML decodes unquoted keys
+    such as `200:` to ints, which the schemas' patternProperties cannot match; subtrees
+    without such keys are returned as is rather than copied.
+    """
+    if isinstance(node, dict):
+        converted = {str(key): _string_keys(value) for key, value in node.items()}
+        if len(converted) == len(node) and all(
+                type(key) is str and converted[key] is value for key, value in node.items()):
+            return node
+        return converted
+    if isinstance(node, list):
+        converted = [_string_keys(item) for item in node]
+        return node if all(new is old for new, old in zip(converted, node)) else converted
+    return node
+
+def schema_errors(spec_data, version):
+    """
+    Validates decoded spec data against the schema for `version` and returns every error as
+    {'pointer', 'message'}, ordered by location. Non-string mapping keys (YAML's unquoted
+    `200:`) are validated as strings. For 'oneOf'/'anyOf' failures the most relevant nested
+    error is reported, since it names the part that actually needs fixing.
+    """
+    from jsonschema.exceptions import best_match
+
+    errors = []
+    for error in get_schema_validator(version).iter_errors(_string_keys(spec_data)):
+        if error.context:
+            error = best_match(error.context)
+        errors.append({"pointer": _json_pointer(error.absolute_path), "message": error.message})
+    errors.sort(key=lambda error: error["pointer"])
+    return errors
 
 def validate_spec(spec_content, spec_format=None):
     """
-    Validates the API specification against its standard.
-    Currently a very basic validation for OpenAPI/Swagger.
+    Validates the API specification against the official JSON Schema of its version
+    (Swagger 2.0, OpenAPI 3.0 or 3.1). Each schema error is reported as a message starting
+    with its JSON pointer and also listed under 'errors'.
+    `spec_content` may be raw text or a `SpecDocument`.
     """
     is_valid = True
     validation_messages = []
-    error = None
+    errors = []
 
     try:
-        if spec_format and spec_format.lower() in ['json', 'openapi', 'swagger']:
-            spec_data = json.loads(spec_content)
-        elif spec_format and spec_format.lower() in ['yaml', 'asyncapi']:
-            spec_data = yaml.safe_load(spec_content)
-        else: # Attempt to infer
-            try:
-                spec_data = json.loads(spec_content)
-            except json.JSONDecodeError:
-                spec_data = yaml.safe_load(spec_content)
-        
-        # Basic OpenAPI/Swagger validation
+        spec_data = load_spec_document(spec_content, spec_format).data
+
         if not isinstance(spec_data, dict):
             is_valid = False
             validation_messages.append("Spec content is not a valid object.")
-            return {"is_valid": is_valid, "validation_messages": validation_messages}
+            return {"is_valid": is_valid, "validation_messages": validation_messages, "errors": errors}
 
-        if "openapi" not in spec_data and "swagger" not in spec_data:
+        version = spec_version(spec_data)
+        if version is None:
             is_valid = False
             validation_messages.append("Spec does not specify 'openapi' or 'swagger' version.")
-        
-        if "info" not in spec_data or not isinstance(spec_data["info"], dict):
+        elif version not in SCHEMA_FILES:
             is_valid = False
-            validation_messages.append("'info' object is missing or invalid.")
+            validation_messages.append(
+                f"Unsupported specification version '{version}'; supported: Swagger 2.0, OpenAPI 3.0 and 3.1.")
         else:
-            if "title" not in spec_data["info"] or not spec_data["info"]["title"]:
-                is_valid = False
-                validation_messages.append("'info.title' is missing or empty.")
-            if "version" not in spec_data["info"] or not spec_data["info"]["version"]:
+            errors = schema_errors(spec_data, version)
+            if errors:
                 is_valid = False
-                validation_messages.append("'info.version' is missing or empty.")
+                validation_messages.extend(f"{error['pointer'] or '/'}: {error['message']}" for error in errors)
 
-        if "paths" not in spec_data or not isinstance(spec_data["paths"], dict):
-            is_valid = False
-            validation_messages.append("'paths' object is missing or invalid.")
-        elif not spec_data["paths"]:
+        if isinstance(spec_data.get("paths"), dict) and not spec_data["paths"]:
             validation_messages.append("'paths' object is empty.")
 
-        # More comprehensive validation would involve a proper JSON Schema validation
-        # For now, this placeholder provides basic structural checks.
-
-    except (json.JSONDecodeError, yaml.YAMLError) as e:
+    except SpecLoadError as e:
         is_valid = False
         validation_messages.append(f"Invalid JSON or YAML content: {e}")
+    except ImportError as e:
+        is_valid = False
+        validation_messages.append(f"Schema validation requires jsonschema (pip install -r requirements.txt): {e}")
     except Exception as e:
         is_valid = False
         validation_messages.append(f"An unexpected error occurred during validation: {e}")
-    
-    return {"is_valid": is_valid, "validation_messages": validation_messages}
+
+    return {"is_valid": is_valid, "validation_messages": validation_messages, "errors": errors}
+
+def _validate_file(file_path):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            spec_content = f.read()
+    except OSError as e:
+        return {"is_valid": False, "validation_messages": [f"Could not read spec file: {e}"], "errors": []}
+    return validate_spec(spec_content)
+
+def validate_spec_files(file_paths, workers=1, chunk_size=8):
+    """
+    Validates many spec files, e.g. every spec in a repository during CI, and returns
+    {file_path: validate_spec result}. With `workers` > 1 the files are spread over that
+    many processes; each process compiles the schema validators once and reuses them.
+    """
+    file_paths = list(file_paths)
+    if workers <= 1 or len(file_paths) <= 1:
+        return {file_path: _validate_file(file_path) for file_path in file_paths}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(file_paths, executor.map(_validate_file, file_paths, chunksize=chunk_size)))
@@ -1,5 +1,4 @@
 import os
-import yaml
 import subprocess
 import json
 import unicodedata # Added for sanitize_task_name
@@ -21,6 +20,15 @@ def sanitize_task_name(name: str) -> str:
     return cleaned.strip()
 
 
+def yaml_safe_load(stream):
+    """
+    Same as `yaml.safe_load`, but uses libyaml's `CSafeLoader` when PyYAML was built
+    with it, which is several times faster on large specs.
+    """
+    import yaml # Deferred so importing utils stays cheap
+
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
 def _read_config(project_root):
     """
     Reads the openspec/config.yaml for the given project.
@@ -30,7 +38,7 @@ def _read_config(project_root):
         return {"git_integration": {"enabled": False}} # Default if config doesn't exist
 
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml_safe_load(f)
     return config if config else {"git_integration": {"enabled": False}}
 
 def _run_git_command(project_root, command_args):
@@ -0,0 +1,83 @@
+import unittest
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# Add the scripts directory to the Python path
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import main
+
+HEAVY_MODULES = ("requests", "jinja2", "jsonschema", "yaml")
+
+def _loaded_heavy_modules(code):
+    """
+    Runs `code` in a fresh interpreter with the scripts directory on the path and
+    returns which heavy dependencies ended up in sys.modules.
+    """
+    probe = (
+        f"import sys; sys.path.insert(0, {SCRIPTS_DIR!r})\n"
+        f"{code}\n"
+        f"print(__import__('json').dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))"
+    )
+    output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+class TestMainDispatcher(unittest.TestCase):
+
+    def test_importing_main_loads_no_heavy_dependencies(self):
+        self.assertEqual(_loaded_heavy_modules("import main"), [])
+
+    def test_list_projects_loads_no_heavy_dependencies(self):
+        with tempfile.TemporaryDirectory() as base_directory:
+            code = f"import main; main.run('list_projects', base_directory={base_directory!r})"
+            self.assertEqual(_loaded_heavy_modules(code), [])
+
+    def test_json_spec_loads_no_yaml(self):
+        code = "import spec_document; spec_document.load_spec_document('{\"openapi\": \"3.0.0\"}')"
+        self.assertEqual(_loaded_heavy_modules(code), [])
+
+    def test_every_step_resolves_to_a_function(self):
+        for step, (module_name, function_name) in main.COMMAND_MAP.items():
+            module = importlib.import_module(module_name)
+            self.assertTrue(callable(getattr(module, function_name)), step)
+
+    def test_unknown_step(self):
+        result = main.run("does_not_exist")
+        self.assertFalse(result["success"])
+        self.assertIn("Unknown step", result["message"])
+
+    def test_run_dispatches_lazily_resolved_step(self):
+        with tempfile.TemporaryDirectory() as base_directory:
+            os.makedirs(os.path.join(base_directory, "alpha", "openspec"))
+            result = main.run("list_projects", base_directory=base_directory)
+        self.assertEqual([project["project_name"] for project in result["projects"]], ["alpha"])
+
+class TestMainCommandLine(unittest.TestCase):
+
+    SPEC = ('{"openapi": "3.0.0", "info": {"title": "T", "version": "1"}, "paths": {"/n": {"get": '
+            '{"responses": {"200": {"$ref": "#/components/responses/Node"}}}}}, "components": {"responses": '
+            '{"Node": {"description": "Node", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Node"}}}}}, '
+            '"schemas": {"Node": {"properties": {"child": {"$ref": "#/components/schemas/Node"}}}}}}')
+
+    def run_cli(self, **kwargs):
+        output = subprocess.run([sys.executable, os.path.join(SCRIPTS_DIR, "main.py"), "parse",
+                                 "--kwargs", json.dumps(kwargs)], capture_output=True, text=True, check=True).stdout
+        return json.loads(output)
+
+    def test_parse_prints_json(self):
+        result = self.run_cli(spec_content=self.SPEC, ref_mode="eager")
+        response = result["parsed_data"]["endpoints"]["/n"]["get"]["responses"]["200"]
+        self.assertEqual(response["description"], "Node")
+
+    def test_lazy_ref_mode_is_rejected(self):
+        result = self.run_cli(spec_content=self.SPEC, ref_mode="lazy")
+        self.assertFalse(result["success"])
+        self.assertIn("ref_mode 'lazy'", result["message"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Add the scripts directory to the Python path to allow importing the script to be tested
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+from ref_resolver import LazyMapping, RefResolver, resolve_refs
+from spec_parser import parse_spec
+
+SPEC_YAML = """
+openapi: 3.0.3
+info:
+  title: Pets
+  version: '1'
+paths:
+  /pets/{id}:
+    get:
+      parameters:
+        - $ref: '#/components/parameters/PetId'
+        - $ref: 'common.yaml#/parameters/Limit'
+      responses:
+        '200':
+          $ref: '#/components/responses/Pet'
+components:
+  parameters:
+    PetId:
+      name: id
+      in: path
+      required: true
+      schema:
+        type: integer
+  responses:
+    Pet:
+      description: A pet
+      content:
+        application/json:
+          schema:
+            $ref: '#/components/schemas/Pet'
+  schemas:
+    Pet:
+      type: object
+      properties:
+        parent:
+          $ref: '#/components/schemas/Pet'
+        owner:
+          $ref: '#/components/schemas/Owner'
+        missing:
+          $ref: '#/components/schemas/Nope'
+    Owner:
+      type: object
+      description: Owner
+      properties:
+        pets:
+          type: array
+          items:
+            $ref: '#/components/schemas/Pet'
+"""
+
+COMMON_YAML = """
+parameters:
+  Limit:
+    name: limit
+    in: query
+    schema:
+      $ref: 'types.yaml#/PageSize'
+"""
+
+TYPES_YAML = """
+PageSize:
+  type: integer
+  maximum: 100
+"""
+
+class TestRefResolver(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        for name, content in (('common.yaml', COMMON_YAML), ('types.yaml', TYPES_YAML)):
+            with open(os.path.join(self.tmp.name, name), 'w', encoding='utf-8') as f:
+                f.write(content)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def parse(self, **kwargs):
+        result = parse_spec(SPEC_YAML, base_dir=self.tmp.name, **kwargs)
+        self.assertNotIn('error', result)
+        return result['parsed_data']
+
+    def test_eager_resolution_shares_targets(self):
+        parsed = self.parse()
+        schemas = parsed['components']['schemas']
+        operation = parsed['endpoints']['/pets/{id}']['get']
+        self.assertEqual(operation['parameters'][0]['name'], 'id')
+        self.assertIs(operation['responses']['200']['content']['application/json']['schema'], schemas['Pet'])
+        self.assertIs(schemas['Pet']['properties']['owner'], schemas['Owner'])
+
+    def test_relative_file_refs(self):
+        limit = self.parse()['endpoints']['/pets/{id}']['get']['parameters'][1]
+        self.assertEqual(limit['name'], 'limit')
+        # Refs inside an external file are relative to that file
+        self.assertEqual(limit['schema'], {'type': 'integer', 'maximum': 100})
+
+    def test_cycles_stay_as_refs_and_result_is_serializable(self):
+        parsed = self.parse()
+        pet = parsed['components']['schemas']['Pet']
+        self.assertEqual(pet['properties']['parent'], {'$ref': '#/components/schemas/Pet'})
+        json.dumps(parsed)
+
+    def test_cycles_are_cut_independently_of_resolution_order(self):
+        data = self.parse(ref_mode='none')
+        whole = RefResolver(data).resolve()
+        resolver = RefResolver(data)
+        owner_first = resolver.resolve(data['components']['schemas']['Owner'])
+        self.assertEqual(json.dumps(resolver.resolve(), sort_keys=True), json.dumps(whole, sort_keys=True))
+        # Document order reaches Pet first, so only the refs leading back into Pet are kept
+        self.assertEqual(owner_first['properties']['pets']['items'], {'$ref': '#/components/schemas/Pet'})
+        self.assertEqual(whole['components']['schemas']['Pet']['properties']['owner']['description'], 'Owner')
+
+    def test_densely_cyclic_schemas(self):
+        names = [f'S{index}' for index in range(12)]
+        schemas = {name: {'type': 'object', 'properties': {other: {'$ref': f'#/components/schemas/{other}'}
+                                                            for other in names}} for name in names}
+        data = {'components': {'schemas': schemas}}
+        resolver = RefResolver(data)
+        resolved = resolver.resolve()
+        json.dumps(resolved)
+        self.assertEqual(len(resolver._targets), len(names))
+        self.assertEqual(resolved['components']['schemas']['S0']['properties']['S0'], {'$ref': '#/components/schemas/S0'})
+
+    def test_lazy_mode_reports_all_unresolved_refs(self):
+        self.assertEqual(self.parse(ref_mode='lazy')['unresolved_refs'], ['#/components/schemas/Nope'])
+
+    def test_unresolvable_refs_are_reported(self):
+        parsed = self.parse()
+        self.assertEqual(parsed['unresolved_refs'], ['#/components/schemas/Nope'])
+        self.assertEqual(parsed['components']['schemas']['Pet']['properties']['missing'],
+                         {'$ref': '#/components/schemas/Nope'})
+
+    def test_input_is_not_modified(self):
+        data = {'a': {'$ref': '#/b'}, 'b': {'c': 1}, 'd': [1, 2]}
+        resolved = resolve_refs(data)
+        self.assertIs(resolved['a'], data['b'])
+        self.assertIs(resolved['d'], data['d'])
+        self.assertEqual(data['a'], {'$ref': '#/b'})
+
+    def test_sibling_keys_override_target(self):
+        data = {'a': {'$ref': '#/b', 'description': 'Local'}, 'b': {'type': 'string', 'description': 'Shared'}}
+        self.assertEqual(resolve_refs(data)['a'], {'type': 'string', 'description': 'Local'})
+
+    def test_lazy_mode_resolves_on_access(self):
+        parsed = self.parse(ref_mode='lazy')
+        pet = parsed['components']['schemas']['Pet']
+        self.assertIsInstance(pet, LazyMapping)
+        # Lazy views can follow a cycle as deep as the caller navigates
+        self.assertEqual(pet['properties']['parent']['properties']['owner']['description'], 'Owner')
+        self.assertIs(pet['properties']['parent'], pet)
+        self.assertEqual(parsed['endpoints']['/pets/{id}']['get']['parameters'][1]['schema']['maximum'], 100)
+
+    def test_lazy_ref_chain_cycle(self):
+        data = {'a': {'$ref': '#/b'}, 'b': {'$ref': '#/a'}}
+        view = RefResolver(data).lazy()
+        self.assertEqual(view['a'], {'$ref': '#/b'})
+
+    def test_no_resolution(self):
+        parsed = self.parse(ref_mode='none')
+        self.assertEqual(parsed['endpoints']['/pets/{id}']['get']['parameters'][0],
+                         {'$ref': '#/components/parameters/PetId'})
+        self.assertIn('error', parse_spec(SPEC_YAML, ref_mode='sometimes'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+import copy
+import json
+import os
+import sys
+
+# Add the scripts directory to the Python path to allow importing the script to be tested
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+from spec_comparer import _Differ, compare_specs, diff_specs
+
+BASE_SPEC = {
+    "openapi": "3.0.3",
+    "info": {"title": "Users", "version": "1.0.0"},
+    "paths": {
+        "/users": {
+            "parameters": [{"name": "tenant", "in": "header", "schema": {"type": "string"}}],
+            "get": {
+                "summary": "List users",
+                "parameters": [{"name": "limit", "in": "query", "schema": {"type": "integer"}}],
+                "responses": {"200": {"description": "Users"}},
+            },
+            "post": {
+                "requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}}},
+                "responses": {"201": {"description": "Created"}},
+            },
+        },
+        "/users/{id}": {
+            "delete": {"responses": {"204": {"description": "Deleted"}}},
+        },
+    },
+    "components": {
+        "schemas": {
+            "User": {"type": "object", "required": ["id", "name"], "properties": {"id": {"type": "string"}}},
+            "Error": {"type": "object"},
+        }
+    },
+}
+
+class TestSpecComparer(unittest.TestCase):
+
+    def setUp(self):
+        self.old = copy.deepcopy(BASE_SPEC)
+        self.new = copy.deepcopy(BASE_SPEC)
+
+    def test_identical_specs(self):
+        report = diff_specs(self.old, self.new)
+        self.assertFalse(report['has_changes'])
+        self.assertEqual(report['operations'], {"added": [], "removed": [], "changed": []})
+
+    def test_added_and_removed_operations(self):
+        del self.new['paths']['/users/{id}']
+        self.new['paths']['/users']['put'] = {"responses": {"200": {"description": "Replaced"}}}
+        report = diff_specs(self.old, self.new)
+        self.assertEqual(report['operations']['added'], [{"path": "/users", "method": "put"}])
+        self.assertEqual(report['operations']['removed'], [{"path": "/users/{id}", "method": "delete"}])
+        self.assertEqual(report['operations']['changed'], [])
+
+    def test_changed_parameters_responses_and_fields(self):
+        get = self.new['paths']['/users']['get']
+        get['summary'] = 'List all users'
+        get['parameters'][0]['schema']['type'] = 'string'
+        get['parameters'].append({"name": "offset", "in": "query"})
+        get['responses']['404'] = {"description": "Missing"}
+        self.new['paths']['/users']['parameters'] = []
+
+        changed, post = diff_specs(self.old, self.new)['operations']['changed']
+        self.assertEqual((changed['path'], changed['method']), ('/users', 'get'))
+        # Path-level parameters apply to every operation of the path
+        self.assertEqual((post['method'], post['parameters']['removed']), ('post', ['tenant:header']))
+        self.assertEqual(changed['parameters']['added'], ['offset:query'])
+        self.assertEqual(changed['parameters']['removed'], ['tenant:header'])
+        self.assertEqual(changed['parameters']['changed']['limit:query'][0]['new'], 'string')
+        self.assertEqual(changed['responses']['added'], ['404'])
+        self.assertEqual(changed['other'], [{"change": "changed", "pointer": "/paths/~1users/get/summary",
+                                             "old": "List users", "new": "List all users"}])
+
+    def test_schema_changes(self):
+        schemas = self.new['components']['schemas']
+        schemas['User']['properties']['name'] = {"type": "string"}
+        del schemas['Error']
+        schemas['Page'] = {"type": "array"}
+        report = diff_specs(self.old, self.new)
+        self.assertEqual(report['components']['schemas']['added'], ['Page'])
+        self.assertEqual(report['components']['schemas']['removed'], ['Error'])
+        (change,) = report['components']['schemas']['changed']['User']
+        self.assertEqual(change, {"change": "added", "pointer": "/components/schemas/User/properties/name",
+                                  "new": {"type": "string"}})
+        self.assertEqual(report['summary']['schemas_changed'], 1)
+        # The post operation only references User, so it is unchanged
+        self.assertEqual(report['operations']['changed'], [])
+
+    def test_list_order_is_ignored(self):
+        self.new['components']['schemas']['User']['required'].reverse()
+        self.assertFalse(diff_specs(self.old, self.new)['has_changes'])
+
+    def test_path_level_fields(self):
+        self.new['paths']['/users']['summary'] = 'Users'
+        self.new['paths']['/users']['servers'] = [{'url': 'https://users.example.com'}]
+        report = diff_specs(self.old, self.new)
+        self.assertTrue(report['has_changes'])
+        self.assertEqual(sorted(change['pointer'] for change in report['paths']['changed']['/users']),
+                         ['/paths/~1users/servers', '/paths/~1users/summary'])
+        self.assertEqual(report['operations']['changed'], [])
+
+    def test_paths_without_operations(self):
+        self.new['paths']['/health'] = {'$ref': 'health.yaml'}
+        report = diff_specs(self.old, self.new)
+        self.assertEqual(report['paths']['added'], ['/health'])
+        self.assertEqual(report['summary']['paths_added'], 1)
+        self.assertEqual(diff_specs(self.new, self.old)['paths']['removed'], ['/health'])
+
+        changed = copy.deepcopy(self.new)
+        changed['paths']['/health']['$ref'] = 'status.yaml'
+        report = diff_specs(self.new, changed)
+        self.assertEqual(report['paths']['changed']['/health'][0]['new'], 'status.yaml')
+
+    def test_equal_fingerprints_are_confirmed(self):
+        differ = _Differ()
+        a, b = {'x': [1, 2]}, {'x': [1, 3]}
+        differ.fingerprint._memo[id(b)] = (b, differ.fingerprint(a)) # Simulated hash collision
+        self.assertFalse(differ.same(a, b))
+        self.assertEqual(differ.diff(a, b)[0]['pointer'], '/x/1')
+
+    def test_top_level_changes(self):
+        self.new['info']['version'] = '2.0.0'
+        report = diff_specs(self.old, self.new)
+        self.assertEqual(report['other'][0]['pointer'], '/info/version')
+
+    def test_compare_specs_accepts_text(self):
+        self.new['info']['version'] = '2.0.0'
+        result = compare_specs(json.dumps(self.old), json.dumps(self.new))
+        self.assertTrue(result['diff_report']['has_changes'])
+        json.dumps(result)
+        self.assertIn('error', compare_specs('{"a": [', '{}'))
+
+    def test_compare_specs_report_does_not_alias_the_cache(self):
+        self.new['info']['contact'] = {'name': 'API team'}
+        old_text, new_text = json.dumps(self.old), json.dumps(self.new)
+        added = compare_specs(old_text, new_text)['diff_report']['other'][0]['new']
+        added['name'] = 'Changed'
+        self.assertEqual(compare_specs(old_text, new_text)['diff_report']['other'][0]['new'], {'name': 'API team'})
+
+if __name__ == '__main__':
+    unittest.main()
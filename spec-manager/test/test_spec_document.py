@@ -0,0 +1,137 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add the scripts directory to the Python path to allow importing the script to be tested
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+import spec_document
+import utils
+from spec_document import SpecDocument, SpecLoadError, clear_document_cache, load_spec_document, sniff_encoding
+from spec_fetcher import fetch_spec
+from spec_parser import parse_spec
+from spec_validator import validate_spec
+
+SPEC_YAML = """
+openapi: 3.0.0
+info:
+  title: Simple API
+  version: 1.0.0
+paths:
+  /users:
+    get:
+      summary: Get all users
+      responses:
+        '200':
+          description: A list of users.
+"""
+
+SPEC_JSON = '{"swagger": "2.0", "info": {"title": "Old API", "version": "1"}, "paths": {}}'
+
+class TestSpecDocument(unittest.TestCase):
+
+    def setUp(self):
+        clear_document_cache()
+
+    def test_sniff_encoding(self):
+        self.assertEqual(sniff_encoding(SPEC_JSON), 'json')
+        self.assertEqual(sniff_encoding("  \n[1, 2]"), 'json')
+        self.assertEqual(sniff_encoding(SPEC_YAML), 'yaml')
+
+    def test_yaml_is_not_json_parsed_first(self):
+        with mock.patch.object(spec_document.json, 'loads', side_effect=AssertionError("json.loads called")):
+            document = load_spec_document(SPEC_YAML)
+        self.assertEqual(document.encoding, 'yaml')
+        self.assertEqual(document.spec_type, 'openapi')
+        self.assertEqual(document.data['info']['title'], 'Simple API')
+
+    def test_same_content_is_decoded_once(self):
+        first = load_spec_document(SPEC_YAML)
+        with mock.patch.object(spec_document, '_decode', side_effect=AssertionError("decoded twice")):
+            second = load_spec_document(SPEC_YAML, 'AsyncAPI')
+        self.assertIs(first, second)
+
+    def test_forced_format(self):
+        document = load_spec_document(SPEC_JSON, 'yaml')
+        self.assertEqual(document.encoding, 'yaml')
+        self.assertEqual(document.spec_type, 'swagger')
+        with self.assertRaises(SpecLoadError):
+            load_spec_document(SPEC_YAML, 'json')
+
+    def test_invalid_content(self):
+        with self.assertRaises(SpecLoadError):
+            load_spec_document("paths:\n  /users\n    get: [")
+
+    def test_parse_results_do_not_alias_the_cache(self):
+        first = parse_spec(SPEC_YAML)['parsed_data']
+        first['info']['title'] = 'Changed'
+        first['endpoints']['/users']['get']['responses'].clear()
+        second = parse_spec(SPEC_YAML)['parsed_data']
+        self.assertEqual(second['info']['title'], 'Simple API')
+        self.assertIn('200', second['endpoints']['/users']['get']['responses'])
+        self.assertEqual(load_spec_document(SPEC_YAML).data['info']['title'], 'Simple API')
+
+    def test_steps_accept_a_loaded_document(self):
+        document = load_spec_document(SPEC_YAML)
+        with mock.patch.object(spec_document, '_decode', side_effect=AssertionError("decoded again")):
+            parsed = parse_spec(document)
+            validated = validate_spec(document)
+            passed_through = load_spec_document(document)
+        self.assertNotIn('error', parsed)
+        self.assertIn('/users', parsed['parsed_data']['endpoints'])
+        self.assertTrue(validated['is_valid'])
+        self.assertIs(passed_through, document)
+
+    def test_fetch_infers_spec_type(self):
+        path = os.path.join(os.path.dirname(__file__), '_swagger_fixture.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(SPEC_JSON)
+        try:
+            result = fetch_spec(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(result['spec_format'], 'Swagger')
+
+    def test_yaml_uses_libyaml_loader_when_available(self):
+        import yaml
+        expected = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with mock.patch.object(yaml, 'load', wraps=yaml.load) as load:
+            load_spec_document(SPEC_YAML)
+        self.assertIs(load.call_args.kwargs['Loader'], expected)
+        self.assertEqual(utils.yaml_safe_load("a: [1, 2]"), {'a': [1, 2]})
+
+    def test_snapshot_is_reused_by_a_later_run(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            first = load_spec_document(SPEC_YAML, snapshot_dir=snapshot_dir)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+            clear_document_cache() # Simulates a new process
+            with mock.patch.object(spec_document, '_decode', side_effect=AssertionError("decoded again")):
+                second = load_spec_document(SPEC_YAML, snapshot_dir=snapshot_dir)
+            self.assertIsNot(first, second)
+            self.assertEqual(second.data, first.data)
+            self.assertEqual(second.encoding, 'yaml')
+            self.assertEqual(second.content_hash, first.content_hash)
+
+    def test_snapshot_dir_from_environment(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            with mock.patch.dict(os.environ, {spec_document.SNAPSHOT_DIR_ENV: snapshot_dir}):
+                load_spec_document(SPEC_JSON)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+
+    def test_corrupt_snapshot_is_replaced(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            load_spec_document(SPEC_YAML, snapshot_dir=snapshot_dir)
+            (name,) = os.listdir(snapshot_dir)
+            with open(os.path.join(snapshot_dir, name), 'wb') as f:
+                f.write(b'not a pickle')
+            clear_document_cache()
+            document = load_spec_document(SPEC_YAML, snapshot_dir=snapshot_dir)
+            self.assertEqual(document.data['info']['title'], 'Simple API')
+            clear_document_cache()
+            with mock.patch.object(spec_document, '_decode', side_effect=AssertionError("decoded again")):
+                load_spec_document(SPEC_YAML, snapshot_dir=snapshot_dir)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the scripts directory to the Python path to allow importing the script to be tested
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+from spec_validator import get_schema_validator, spec_version, validate_spec, validate_spec_files
+
+VALID_OPENAPI_30 = """
+openapi: 3.0.3
+info:
+  title: Simple API
+  version: 1.0.0
+paths:
+  /users/{id}:
+    get:
+      parameters:
+        - name: id
+          in: path
+          required: true
+          schema:
+            type: string
+      responses:
+        '200':
+          description: A user.
+"""
+
+INVALID_OPENAPI_30 = """
+openapi: 3.0.3
+info:
+  title: Simple API
+paths:
+  /users:
+    get:
+      responses:
+        '200': {}
+"""
+
+UNQUOTED_STATUS_CODES = """
+openapi: 3.0.3
+info:
+  title: Simple API
+  version: 1.0.0
+paths:
+  /users:
+    get:
+      responses:
+        200:
+          description: All users.
+        404: {}
+"""
+
+VALID_OPENAPI_31 = '{"openapi": "3.1.0", "info": {"title": "Hooks", "version": "1"}, "webhooks": {}}'
+
+VALID_SWAGGER_20 = '{"swagger": "2.0", "info": {"title": "Old API", "version": "1"}, "paths": {}}'
+
+class TestSpecValidator(unittest.TestCase):
+
+    def test_valid_specs_of_each_version(self):
+        for spec in (VALID_OPENAPI_30, VALID_OPENAPI_31, VALID_SWAGGER_20):
+            result = validate_spec(spec)
+            self.assertTrue(result['is_valid'], result['validation_messages'])
+            self.assertEqual(result['errors'], [])
+
+    def test_errors_are_reported_with_json_pointers(self):
+        result = validate_spec(INVALID_OPENAPI_30)
+        self.assertFalse(result['is_valid'])
+        pointers = [error['pointer'] for error in result['errors']]
+        self.assertEqual(pointers, ['/info', '/paths/~1users/get/responses/200'])
+        self.assertIn("'version' is a required property", result['validation_messages'][0])
+        self.assertTrue(result['validation_messages'][0].startswith('/info: '))
+
+    def test_nested_one_of_cause_is_reported(self):
+        result = validate_spec(INVALID_OPENAPI_30)
+        self.assertEqual(result['errors'][1]['message'], "'description' is a required property")
+
+    def test_unquoted_status_codes(self):
+        result = validate_spec(UNQUOTED_STATUS_CODES)
+        self.assertEqual(result['errors'], [{'pointer': '/paths/~1users/get/responses/404',
+                                             'message': "'description' is a required property"}])
+        fixed = validate_spec(UNQUOTED_STATUS_CODES.replace('404: {}', '404: {description: Missing.}'))
+        self.assertTrue(fixed['is_valid'], fixed['validation_messages'])
+
+    def test_missing_and_unsupported_versions(self):
+        self.assertFalse(validate_spec('{"info": {}, "paths": {}}')['is_valid'])
+        result = validate_spec('{"openapi": "4.0.0", "info": {}, "paths": {}}')
+        self.assertFalse(result['is_valid'])
+        self.assertIn("Unsupported specification version '4.0.0'", result['validation_messages'][0])
+
+    def test_spec_version(self):
+        self.assertEqual(spec_version({'openapi': '3.0.3'}), '3.0')
+        self.assertEqual(spec_version({'openapi': '3.1.0'}), '3.1')
+        self.assertEqual(spec_version({'swagger': '2.0'}), '2.0')
+        self.assertIsNone(spec_version({}))
+
+    def test_validators_are_compiled_once(self):
+        self.assertIs(get_schema_validator('3.0'), get_schema_validator('3.0'))
+
+    def test_validate_spec_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name, spec in (('valid.yaml', VALID_OPENAPI_30), ('invalid.yaml', INVALID_OPENAPI_30)):
+                paths.append(os.path.join(tmp, name))
+                with open(paths[-1], 'w', encoding='utf-8') as f:
+                    f.write(spec)
+            paths.append(os.path.join(tmp, 'missing.yaml'))
+            for workers in (1, 2):
+                results = validate_spec_files(paths, workers=workers)
+                self.assertEqual([results[path]['is_valid'] for path in paths], [True, False, False])
+
+if __name__ == '__main__':
+    unittest.main()